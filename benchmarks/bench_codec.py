@@ -0,0 +1,49 @@
+"""
+Encoding and decoding throughput.
+"""
+
+import io
+import os
+
+import geojson
+
+
+def test_dumps(benchmark, dataset):
+    benchmark(geojson.dumps, dataset.obj)
+
+
+def test_dumps_coord_precision(benchmark, dataset):
+    benchmark(geojson.dumps, dataset.obj, coord_precision=6)
+
+
+def test_loads(benchmark, dataset):
+    benchmark(geojson.loads, dataset.text)
+
+
+def test_loads_trusted(benchmark, dataset):
+    benchmark(geojson.loads, dataset.text, trusted=True)
+
+
+def test_loads_lazy(benchmark, large):
+    benchmark(geojson.loads, large.text, lazy=True)
+
+
+def test_iterload(benchmark, large):
+    def iterload():
+        for _ in geojson.iterload(io.StringIO(large.text)):
+            pass
+
+    benchmark(iterload)
+
+
+def test_feature_collection_writer(benchmark, large):
+    def write():
+        with open(os.devnull, "w") as fp, \
+                geojson.FeatureCollectionWriter(fp) as writer:
+            writer.write_all(large.obj.features)
+
+    benchmark(write)
+
+
+def test_dumps_quantize(benchmark, dataset):
+    benchmark(geojson.dumps, dataset.obj, quantize=100000)
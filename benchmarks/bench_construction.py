@@ -0,0 +1,56 @@
+"""
+Construction of GeoJSON objects from decoded coordinates.
+"""
+
+import geojson
+from geojson.geometry import Geometry
+
+
+def _geometries(obj):
+    # the geometries of a decoded object, innermost GeometryCollection
+    # members included
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if obj.get("type") == "FeatureCollection":
+            stack.extend(obj["features"])
+        elif obj.get("type") == "Feature":
+            if obj["geometry"]:
+                stack.append(obj["geometry"])
+        elif obj.get("type") == "GeometryCollection":
+            stack.extend(obj["geometries"])
+        else:
+            yield obj
+
+
+def test_clean_coordinates(benchmark, dataset):
+    coordinates = [geometry["coordinates"]
+                   for geometry in _geometries(dataset.plain)]
+
+    def clean():
+        for item in coordinates:
+            Geometry.clean_coordinates(item, 6)
+
+    benchmark(clean)
+
+
+def test_geometries(benchmark, dataset):
+    geometries = [(getattr(geojson, geometry["type"]),
+                   geometry["coordinates"])
+                  for geometry in _geometries(dataset.plain)]
+
+    def construct():
+        for cls, coordinates in geometries:
+            cls(coordinates)
+
+    benchmark(construct)
+
+
+def test_to_instance(benchmark, dataset):
+    geometries = list(_geometries(dataset.plain))
+
+    def construct():
+        for geometry in geometries:
+            geojson.GeoJSON.to_instance(geometry)
+
+    benchmark(construct)
@@ -0,0 +1,53 @@
+"""
+Coordinate utilities, spatial filters and the spatial index.
+"""
+
+import geojson
+import geojson.ops
+from geojson import utils
+
+
+def test_coords(benchmark, dataset):
+    benchmark(lambda: list(utils.coords(dataset.obj)))
+
+
+def test_coords_array(benchmark, dataset):
+    benchmark(utils.coords_array, dataset.obj)
+
+
+def test_map_tuples(benchmark, dataset):
+    benchmark(utils.map_tuples, lambda position: position, dataset.obj)
+
+
+def test_map_tuples_vectorized(benchmark, dataset):
+    benchmark(utils.map_tuples, lambda *columns: columns, dataset.obj,
+              vectorized=True)
+
+
+def test_bbox(benchmark, dataset):
+    # plain dicts, which do not cache their boxes
+    benchmark(utils.bbox, dataset.plain)
+
+
+def test_filter_features(benchmark, large):
+    area = geojson.Polygon([[(-90, -45), (90, -45), (90, 45), (-90, 45),
+                             (-90, -45)]])
+    benchmark(geojson.ops.filter_features, large.obj, bbox=[-120, -60, 0, 0],
+              within=area)
+
+
+def test_build_index(benchmark, large):
+    benchmark(large.obj.build_index)
+
+
+def test_query_index(benchmark, large):
+    index = large.obj.build_index()
+    benchmark(index.query, [-10, -10, 10, 10])
+
+
+def test_generate_random_collection(benchmark):
+    benchmark(utils.generate_random_collection, 10000, seed=1)
+
+
+def test_simplify(benchmark, large):
+    benchmark(utils.simplify, large.obj, 0.01)
@@ -0,0 +1,17 @@
+"""
+Validation of GeoJSON objects.
+"""
+
+import geojson
+
+
+def test_errors(benchmark, dataset):
+    benchmark(dataset.obj.errors)
+
+
+def test_is_valid(benchmark, dataset):
+    benchmark(lambda: dataset.obj.is_valid)
+
+
+def test_validate(benchmark, dataset):
+    benchmark(geojson.validate, dataset.plain)
@@ -0,0 +1,91 @@
+"""
+Datasets shared by the pytest-benchmark suite in the bench_*.py modules.
+
+Every dataset is generated with geojson.utils.generate_random from a fixed
+seed, so that results can be compared across releases and machines:
+
+- ``small``: a single Feature with a Polygon of a few vertices.
+- ``large``: a FeatureCollection of Points, LineStrings and Polygons.
+- ``nested``: a Feature holding GeometryCollections nested several levels
+  deep, each with a MultiPolygon of many rings.
+
+Run with ``tox -e bench``, or ``python -m pytest benchmarks``.
+"""
+
+import functools
+import json
+import random
+
+import pytest
+
+import geojson
+from geojson.utils import generate_random
+
+SEED = 1
+
+GEOMETRY_TYPES = ("Point", "LineString", "Polygon")
+
+
+def _properties(i):
+    return {"name": f"feature {i}", "rank": i, "score": random.random(),
+            "tags": ["a", "b"], "meta": {"checked": bool(i % 2)}}
+
+
+def make_small():
+    return geojson.Feature(id=0, geometry=generate_random(
+        "Polygon", numberVertices=8), properties=_properties(0))
+
+
+def make_large(count=5000, vertices=16):
+    return geojson.FeatureCollection([
+        geojson.Feature(id=i, geometry=generate_random(
+            GEOMETRY_TYPES[i % 3], numberVertices=vertices),
+            properties=_properties(i))
+        for i in range(count)])
+
+
+def make_nested(depth=8, polygons=10, vertices=32):
+    geometry = None
+    for _ in range(depth):
+        multipolygon = geojson.MultiPolygon([
+            generate_random("Polygon", numberVertices=vertices).coordinates
+            for _ in range(polygons)])
+        geometry = geojson.GeometryCollection(
+            [multipolygon] + ([geometry] if geometry else []))
+    return geojson.Feature(id=0, geometry=geometry, properties=_properties(0))
+
+
+DATASETS = {
+    "small": make_small,
+    "large": make_large,
+    "nested": make_nested,
+}
+
+
+class Dataset:
+    """
+    A generated GeoJSON object, with its JSON text and that text decoded
+    into plain dicts.
+    """
+
+    def __init__(self, name):
+        random.seed(SEED)
+        self.name = name
+        self.obj = DATASETS[name]()
+        self.text = geojson.dumps(self.obj)
+        self.plain = json.loads(self.text)
+
+
+@functools.lru_cache(maxsize=None)
+def load_dataset(name):
+    return Dataset(name)
+
+
+@pytest.fixture(params=sorted(DATASETS))
+def dataset(request):
+    return load_dataset(request.param)
+
+
+@pytest.fixture
+def large():
+    return load_dataset("large")
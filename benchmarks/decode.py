@@ -0,0 +1,45 @@
+"""
+Measures geojson.loads decode throughput in MB/s.
+
+Run with ``python benchmarks/decode.py``.
+"""
+
+import random
+import timeit
+
+import geojson
+from geojson.utils import generate_random
+
+
+def make_document(count=2000, seed=1):
+    random.seed(seed)
+    features = []
+    for i in range(count):
+        geometry = generate_random(("Point", "LineString", "Polygon")[i % 3],
+                                   numberVertices=8)
+        properties = {
+            "name": f"feature {i}",
+            "rank": i,
+            "score": random.random(),
+            "tags": ["a", "b", "c"],
+            "meta": {"source": "survey", "checked": bool(i % 2),
+                     "history": [{"rev": r, "by": "someone"}
+                                 for r in range(3)]},
+        }
+        features.append(geojson.Feature(id=i, geometry=geometry,
+                                        properties=properties))
+    return geojson.dumps(geojson.FeatureCollection(features))
+
+
+def main():
+    text = make_document()
+    megabytes = len(text.encode("utf-8")) / 1e6
+    runs = 10
+    seconds = min(timeit.repeat(lambda: geojson.loads(text),
+                                number=runs, repeat=3)) / runs
+    print(f"{megabytes:.2f} MB decoded in {seconds * 1000:.1f} ms "
+          f"({megabytes / seconds:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
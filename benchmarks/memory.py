@@ -0,0 +1,47 @@
+"""
+Measures the memory taken by Point features in the dict-based classes and
+in the compact ones of geojson.compact, built directly and decoded.
+
+Run with ``python benchmarks/memory.py``.
+"""
+
+import random
+import tracemalloc
+
+import geojson
+import geojson.compact
+
+
+def measure(build):
+    tracemalloc.start()
+    features = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(features)
+
+
+def main(count=100_000, seed=1):
+    rng = random.Random(seed)
+    points = [(rng.uniform(-180, 180), rng.uniform(-90, 90))
+              for _ in range(count)]
+    text = geojson.dumps(geojson.FeatureCollection([
+        geojson.Feature(id=i, geometry=geojson.Point(point))
+        for i, point in enumerate(points)]))
+
+    results = (
+        ("dict classes", lambda: [
+            geojson.Feature(id=i, geometry=geojson.Point(point))
+            for i, point in enumerate(points)]),
+        ("compact classes", lambda: [
+            geojson.compact.Feature(id=i, geometry=geojson.compact.Point(point))
+            for i, point in enumerate(points)]),
+        ("dict classes, decoded", lambda: geojson.loads(text).features),
+        ("compact classes, decoded", lambda: geojson.loads(
+            text, object_hook=geojson.compact.object_hook)["features"]),
+    )
+    for name, build in results:
+        print(f"{name:>24}: {measure(build):.0f} bytes per feature")
+
+
+if __name__ == "__main__":
+    main()
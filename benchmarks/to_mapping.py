@@ -0,0 +1,35 @@
+"""
+Compares geojson.mapping.to_mapping against the json round trip it used
+to normalize tuples and lists with.
+
+Run with ``python benchmarks/to_mapping.py``.
+"""
+
+import json
+import random
+import timeit
+
+from geojson.mapping import to_mapping
+
+
+def make_coordinates(rings=20, vertices=500, seed=1):
+    rng = random.Random(seed)
+    return tuple(
+        tuple((rng.uniform(-180, 180), rng.uniform(-90, 90))
+              for _ in range(vertices))
+        for _ in range(rings))
+
+
+def main():
+    coordinates = make_coordinates()
+    assert to_mapping(coordinates) == json.loads(json.dumps(coordinates))
+    runs = 20
+    for name, func in (
+            ("json round trip", lambda: json.loads(json.dumps(coordinates))),
+            ("to_mapping", lambda: to_mapping(coordinates))):
+        seconds = min(timeit.repeat(func, number=runs, repeat=3)) / runs
+        print(f"{name:>16}: {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,21 @@
-from geojson.codec import dump, dumps, load, loads, GeoJSONEncoder
+from geojson.codec import dump, dumps, load, loads, iterload, GeoJSONEncoder
+from geojson.codec import dump_seq, load_seq, FeatureCollectionWriter
 from geojson.utils import coords, map_coords
 from geojson.geometry import Point, LineString, Polygon
 from geojson.geometry import MultiLineString, MultiPoint, MultiPolygon
 from geojson.geometry import GeometryCollection
 from geojson.feature import Feature, FeatureCollection
 from geojson.base import GeoJSON
+from geojson.validation import validate, validate_parallel
 from geojson._version import __version__, __version_info__
 
-__all__ = ([dump, dumps, load, loads, GeoJSONEncoder] +
+__all__ = ([dump, dumps, load, loads, iterload, GeoJSONEncoder] +
+           [dump_seq, load_seq, FeatureCollectionWriter] +
            [coords, map_coords] +
            [Point, LineString, Polygon] +
            [MultiLineString, MultiPoint, MultiPolygon] +
            [GeometryCollection] +
            [Feature, FeatureCollection] +
            [GeoJSON] +
+           [validate, validate_parallel] +
            [__version__, __version_info__])
@@ -0,0 +1,222 @@
+"""
+Registry of JSON implementations used by geojson.dumps and geojson.loads.
+
+The standard library ``json`` module is used unless another backend is
+selected with :func:`set_backend`. A backend only takes over calls it can
+serve exactly; calls using options it does not support (a custom encoder
+or decoder class, ``allow_nan=True``, ``indent`` ...) keep going through
+the standard library. Backends write exactly the text the standard library
+would, and decode text to exactly the same objects.
+"""
+
+from collections import namedtuple
+import json
+import math
+import re
+
+from geojson.coordinates import CoordinateArray
+
+
+Backend = namedtuple("Backend", ["name", "dumps", "loads", "options"])
+Backend.__doc__ = """
+A JSON implementation.
+
+``dumps(obj, default, **options)`` must return a str, call ``default`` for
+objects it cannot serialize and raise ValueError for NaN and infinite
+numbers. ``loads(s, object_hook)`` must call ``object_hook`` for every
+decoded object, innermost first, and reject NaN and infinite numbers.
+``options`` names the ``dumps`` keyword arguments the backend accepts.
+"""
+
+STDLIB = "json"
+
+_registry = {}
+_loaders = {}
+_current = None
+
+
+def register_backend(name, dumps, loads, options=()):
+    """
+    Registers a JSON backend under the given name.
+
+    :param name: Name used to select the backend with set_backend.
+    :type name: str
+    :param dumps: Serializing function, see Backend.
+    :param loads: Deserializing function, see Backend.
+    :param options: Keyword arguments of geojson.dumps the backend
+    supports.
+    :type options: iterable of str
+    """
+    _registry[name] = Backend(name, dumps, loads, frozenset(options))
+
+
+def set_backend(*names):
+    """
+    Selects the first available backend among the given names.
+
+    :param names: Backend names in order of preference, e.g.
+    ``set_backend("orjson", "simplejson", "json")``.
+    :type names: str
+    :return: The name of the selected backend.
+    :rtype: str
+    :raises ValueError: If none of the backends is available.
+    """
+    global _current
+    for name in names:
+        if name == STDLIB:
+            _current = None
+            return name
+        backend = _find(name)
+        if backend is not None:
+            _current = backend
+            return name
+    raise ValueError(f"None of the JSON backends {names!r} is available")
+
+
+def get_backend():
+    """
+    Returns the name of the selected backend.
+
+    :rtype: str
+    """
+    return STDLIB if _current is None else _current.name
+
+
+def current():
+    """Returns the selected Backend, or None for the standard library."""
+    return _current
+
+
+def _find(name):
+    if name not in _registry and name in _loaders:
+        try:
+            _loaders.pop(name)()
+        except ImportError:
+            return None
+    return _registry.get(name)
+
+
+def _check_finite(obj):
+    # Walks obj the way it gets encoded, looking for NaN and infinities.
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f"Number {value!r} is not JSON compliant")
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, CoordinateArray):
+            stack.extend(value.values)
+        elif hasattr(value, "__geo_interface__"):
+            stack.append(value.__geo_interface__)
+
+
+def _apply_object_hook(obj, object_hook):
+    # Replays json's object_hook on an already decoded document.
+    if type(obj) is dict:
+        for key, value in obj.items():
+            if type(value) is dict or type(value) is list:
+                obj[key] = _apply_object_hook(value, object_hook)
+        return object_hook(obj)
+    if type(obj) is list:
+        for i, value in enumerate(obj):
+            if type(value) is dict or type(value) is list:
+                obj[i] = _apply_object_hook(value, object_hook)
+    return obj
+
+
+# Number tokens orjson writes differently from repr(float): exponents
+# without a sign or zero padding, and small numbers in fixed notation.
+# Strings are matched too, so that their content is skipped.
+_ORJSON_NUMBER = re.compile(
+    rb'"(?:[^"\\]|\\.)*"|(?<![\d.])(-?\d+(?:\.\d+)?e-?\d+|-?0\.0000\d+)')
+_ORJSON_NUMBER_HINT = re.compile(rb'\de|0\.0000\d')
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def _stdlib_dumps(obj, default, **kwargs):
+    return json.dumps(obj, default=default, allow_nan=False,
+                      ensure_ascii=False, **kwargs)
+
+
+def _reject_constant(obj):
+    raise ValueError(f"Number {obj!r} is not JSON compliant")
+
+
+def _stdlib_loads(s, object_hook):
+    return json.loads(s, object_hook=object_hook,
+                      parse_constant=_reject_constant)
+
+
+# Integers of 19 digits or more may not fit in 64 bits, which orjson
+# decodes as floats
+_WIDE_INTEGER = re.compile(r"\d{19}")
+_WIDE_INTEGER_BYTES = re.compile(rb"\d{19}")
+
+
+def _repr_number(match):
+    number = match.group(1)
+    if number is None:
+        return match.group(0)
+    return repr(float(number)).encode("ascii")
+
+
+def _load_orjson():
+    import orjson
+
+    def dumps(obj, default, sort_keys=False, separators=None):
+        # orjson only writes compact separators
+        if separators is None or tuple(separators) != _COMPACT_SEPARATORS:
+            return _stdlib_dumps(obj, default, sort_keys=sort_keys,
+                                 separators=separators)
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        try:
+            encoded = orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # non-str keys, integers wider than 64 bits, lone surrogates
+            return _stdlib_dumps(obj, default, sort_keys=sort_keys,
+                                 separators=separators)
+        # orjson writes NaN and infinities as null
+        if b"null" in encoded:
+            _check_finite(obj)
+        if _ORJSON_NUMBER_HINT.search(encoded):
+            encoded = _ORJSON_NUMBER.sub(_repr_number, encoded)
+        return encoded.decode("utf-8")
+
+    def loads(s, object_hook):
+        wide = _WIDE_INTEGER if isinstance(s, str) else _WIDE_INTEGER_BYTES
+        if wide.search(s):
+            return _stdlib_loads(s, object_hook)
+        try:
+            obj = orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson also rejects lone surrogates and numbers too large
+            # for a float, which json accepts; json raises for the rest
+            return _stdlib_loads(s, object_hook)
+        return _apply_object_hook(obj, object_hook)
+
+    register_backend("orjson", dumps, loads,
+                     options=["sort_keys", "separators"])
+
+
+def _load_simplejson():
+    import simplejson
+
+    def dumps(obj, default, **kwargs):
+        return simplejson.dumps(obj, default=default, allow_nan=False,
+                                ensure_ascii=False,
+                                namedtuple_as_object=False, **kwargs)
+
+    def loads(s, object_hook):
+        return simplejson.loads(s, object_hook=object_hook,
+                                parse_constant=_reject_constant)
+
+    register_backend("simplejson", dumps, loads,
+                     options=["sort_keys", "indent", "separators"])
+
+
+_loaders["orjson"] = _load_orjson
+_loaders["simplejson"] = _load_simplejson
@@ -1,6 +1,23 @@
+from operator import is_
+
 import geojson
 from geojson.mapping import to_mapping
 
+# Longest repr of GeoJSON objects: longer ones are cut at this many
+# characters and end with "...", encoding no more of the object than
+# needed. None for no limit. str() always gives the whole encoding.
+REPR_MAX_LENGTH = 2000
+
+
+# Maps GeoJSON type names to the classes constructing them. It is filled
+# on first use since geojson.factory itself depends on this module.
+_factories = {}
+
+
+def _load_factories():
+    _factories.update((cls.__name__, cls) for cls in geojson.factory.__all__)
+    return _factories
+
 
 class GeoJSON(dict):
     """
@@ -18,13 +35,19 @@ class GeoJSON(dict):
         :rtype: GeoJSON
         """
         super().__init__(iterable)
-        self["type"] = getattr(self, "type", type(self).__name__)
+        # a class attribute or the member given, without going through
+        # __getattr__, which is slow to fail
+        cls = type(self)
+        type_ = getattr(cls, "type", None)
+        self["type"] = self.get("type", cls.__name__) if type_ is None \
+            else type_
         self.update(extra)
 
     def __repr__(self):
-        return geojson.dumps(self, sort_keys=True)
+        return _repr(self, REPR_MAX_LENGTH)
 
-    __str__ = __repr__
+    def __str__(self):
+        return _repr(self, None)
 
     def __getattr__(self, name):
         """
@@ -60,13 +83,46 @@ class GeoJSON(dict):
 
         del self[name]
 
+    def _cached(self, name, member, compute):
+        # Caches a value derived from one member in the instance __dict__;
+        # it is dropped whenever a member is set or deleted.
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            pass
+        result = compute(self[member])
+        self.__dict__[name] = result
+        return result
+
+    def _clear_cache(self):
+        # Drops cached values, for changes made inside a member
+        self.__dict__.clear()
+
+    def __setitem__(self, key, value):
+        if self.__dict__:
+            self._clear_cache()
+        dict.__setitem__(self, key, value)
+
+    def compute_bbox(self):
+        """
+        Computes the bounding box of the object's coordinates.
+
+        The result is not stored in the object; see geojson.utils.bbox.
+
+        :return: ``[west, south, east, north]``, or with elevations
+        ``[west, south, low, east, north, high]``; None if the object has
+        no positions.
+        :rtype: list
+        """
+        return geojson.utils.bbox(self)
+
     @property
     def __geo_interface__(self):
         if self.type != "GeoJSON":
             return self
 
     @classmethod
-    def to_instance(cls, ob, default=None, strict=False):
+    def to_instance(cls, ob, default=None, strict=False, trusted=False):
         """Encode a GeoJSON dict into an GeoJSON object.
         Assumes the caller knows that the dict should satisfy a GeoJSON type.
 
@@ -82,6 +138,9 @@ class GeoJSON(dict):
         :param strict: Raise error if unable to coerce particular keys or
         attributes to a valid GeoJSON structure.
         :type strict: bool
+        :param trusted: Construct geometries from their coordinates as they
+        are, without cleaning them (see Geometry).
+        :type trusted: bool
         :return: A GeoJSON object with the dict's elements as its constituents.
         :rtype: GeoJSON
         :raises TypeError: If the input dict contains items that are not valid
@@ -92,32 +151,34 @@ class GeoJSON(dict):
         valid GeoJSON types.
         """
         if ob is None and default is not None:
-            instance = default()
-        elif isinstance(ob, GeoJSON):
-            instance = ob
-        else:
-            mapping = to_mapping(ob)
-            d = {}
-            for k in mapping:
-                d[k] = mapping[k]
+            return default()
+        if isinstance(ob, GeoJSON):
+            return ob
+        # Plain dicts are what the decoder hands us for every JSON object;
+        # most of them (properties, nested values) are not GeoJSON and are
+        # returned untouched without being copied.
+        mapping = ob if type(ob) is dict else to_mapping(ob)
+        type_ = mapping.get("type")
+        factory = (_factories or _load_factories()).get(type_) \
+            if isinstance(type_, str) else None
+        if factory is not None:
+            d = {k: v for k, v in mapping.items() if k != "type"}
+            if trusted and issubclass(factory, geojson.geometry.Geometry):
+                d["trusted"] = True
             try:
-                type_ = d.pop("type")
-                try:
-                    type_ = str(type_)
-                except UnicodeEncodeError:
-                    # If the type contains non-ascii characters, we can assume
-                    # it's not a valid GeoJSON type
-                    raise AttributeError(f"{type_} is not a GeoJSON type")
-                geojson_factory = getattr(geojson.factory, type_)
-                instance = geojson_factory(**d)
+                return factory(**d)
             except (AttributeError, KeyError) as invalid:
-                if strict:
-                    raise ValueError(
-                        f"Cannot coerce {ob!r} into "
-                        f"a valid GeoJSON structure: {invalid}"
-                    )
-                instance = ob
-        return instance
+                error = invalid
+        elif "type" in mapping:
+            error = f"{type_!r} is not a GeoJSON type"
+        else:
+            error = "missing 'type' member"
+        if strict:
+            raise ValueError(
+                f"Cannot coerce {ob!r} into "
+                f"a valid GeoJSON structure: {error}"
+            )
+        return ob
 
     @property
     def is_valid(self):
@@ -137,3 +198,81 @@ class GeoJSON(dict):
         # make sure that each subclass implements it's own validation function
         if self.__class__ != GeoJSON:
             raise NotImplementedError(self.__class__)
+
+
+def _repr(obj, limit):
+    # Encodes obj with sorted keys; past limit characters, the encoding is
+    # stopped and the text cut short.
+    if limit is None:
+        if isinstance(obj, GeoJSON):
+            return _cached_repr(obj)
+        return geojson.dumps(obj, sort_keys=True)
+    # unlike dumps, iterencode yields the text as it goes
+    encoder = geojson.codec.GeoJSONEncoder(sort_keys=True, allow_nan=False,
+                                           ensure_ascii=False)
+    chunks = []
+    size = 0
+    for chunk in encoder.iterencode(to_mapping(obj)):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return "".join(chunks)[:limit] + "..."
+    return "".join(chunks)
+
+
+def _cached_repr(obj, encode=None):
+    # The whole encoding of obj, cached with the encodings of the GeoJSON
+    # objects among its members until a member is set or deleted, here or
+    # in one of them. Changes made inside other members, such as
+    # coordinate lists, are not noticed.
+    if encode is None:
+        encode = geojson.codec.GeoJSONEncoder(
+            sort_keys=True, allow_nan=False, ensure_ascii=False).encode
+    children = [_cached_repr(child, encode)
+                for child in _repr_children(obj)]
+    cached = obj.__dict__.get("repr")
+    if cached is not None and len(cached[1]) == len(children) and \
+            all(map(is_, cached[1], children)):
+        return cached[0]
+    texts = iter(children)
+    members = []
+    for key, value in sorted(obj.items()):
+        if isinstance(value, GeoJSON):
+            text = next(texts)
+        elif type(value) is list and any(
+                isinstance(item, GeoJSON) for item in value):
+            text = "[" + ", ".join([
+                next(texts) if isinstance(item, GeoJSON)
+                else encode(item) for item in value]) + "]"
+        else:
+            text = encode(value)
+        members.append(encode(key) + ": " + text)
+    text = "{" + ", ".join(members) + "}"
+    obj.__dict__["repr"] = (text, children)
+    return text
+
+
+def _repr_children(obj):
+    # The GeoJSON objects among the members of obj, in encoding order
+    for _, value in sorted(obj.items()):
+        if isinstance(value, GeoJSON):
+            yield value
+        elif type(value) is list:
+            yield from (item for item in value if isinstance(item, GeoJSON))
+
+
+def _clearing_cache(name):
+    method = getattr(dict, name)
+
+    def clearing_cache(self, *args, **kwargs):
+        if self.__dict__:
+            self._clear_cache()
+        return method(self, *args, **kwargs)
+    clearing_cache.__name__ = name
+    return clearing_cache
+
+
+# the other ways of changing members, see __setitem__
+for _name in ("__delitem__", "__ior__", "update", "setdefault", "pop",
+              "popitem", "clear"):
+    setattr(GeoJSON, _name, _clearing_cache(_name))
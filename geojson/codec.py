@@ -1,14 +1,39 @@
+import codecs
+import functools
+from itertools import chain
+import io
 import json
+import re
 
 import geojson
+import geojson.compact
 import geojson.factory
-from geojson.mapping import to_mapping
+from geojson import backends
+from geojson.coordinates import CoordinateArray, merge_bboxes
+from geojson.feature import LazyFeature
+from geojson.mapping import is_mapping, to_mapping
+from geojson.utils import _bbox, bbox as compute_bbox
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _default(obj):
+    if isinstance(obj, CoordinateArray):
+        return obj.tolist()
+    if isinstance(obj, geojson.compact.Compact):
+        # compact objects are encoded as they are, not cleaned into
+        # regular GeoJSON objects
+        return obj.__geo_interface__
+    return geojson.factory.GeoJSON.to_instance(obj)
 
 
 class GeoJSONEncoder(json.JSONEncoder):
 
     def default(self, obj):
-        return geojson.factory.GeoJSON.to_instance(obj) # NOQA
+        return _default(obj)
 
 
 # Wrap the functions from json, providing encoder, decoders, and
@@ -19,13 +44,493 @@ def _enforce_strict_numbers(obj):
     raise ValueError(f"Number {obj!r} is not JSON compliant")
 
 
-def dump(obj, fp, cls=GeoJSONEncoder, allow_nan=False, **kwargs):
-    return json.dump(to_mapping(obj),
-                     fp, cls=cls, allow_nan=allow_nan, **kwargs)
+_to_trusted_instance = functools.partial(geojson.base.GeoJSON.to_instance,
+                                         trusted=True)
+
+
+def _object_hook(object_hook, trusted):
+    # trusted decoding only changes how the default hook builds geometries
+    if trusted and object_hook == geojson.base.GeoJSON.to_instance:
+        return _to_trusted_instance
+    return object_hook
+
+
+def _backend_for_dumps(cls, allow_nan, ensure_ascii, kwargs):
+    backend = backends.current()
+    if (backend is None or cls is not GeoJSONEncoder or allow_nan
+            or ensure_ascii or not backend.options.issuperset(kwargs)):
+        return None
+    return backend
+
+
+def _backend_for_loads(cls, parse_constant, object_hook, kwargs):
+    backend = backends.current()
+    if (backend is None or cls is not json.JSONDecoder
+            or parse_constant is not _enforce_strict_numbers
+            or object_hook is None or kwargs):
+        return None
+    return backend
+
+
+def _with_bbox(obj):
+    # Returns a shallow copy of obj with a bbox member, also added to each
+    # of its features or geometries. The objects themselves are unchanged.
+    mapping = dict(to_mapping(obj))
+    for key in ("features", "geometries"):
+        items = mapping.get(key)
+        if isinstance(items, list):
+            mapping[key] = items = [_with_bbox(item) if item else item
+                                    for item in items]
+            box = merge_bboxes(item.get("bbox") for item in items if item)
+            break
+    else:
+        # computed afresh, as the coordinates may have changed in place
+        box = _bbox(obj, False)
+    if box is not None:
+        mapping["bbox"] = box
+    return mapping
+
+
+def _has_lazy_features(mapping):
+    features = mapping.get("features") if is_mapping(mapping) else None
+    return isinstance(features, list) and any(
+        type(feature) is LazyFeature for feature in features)
+
+
+def _load_features(mapping):
+    # encoders read the items of dicts directly, which a LazyFeature has
+    # none of until it is loaded
+    for feature in mapping["features"]:
+        if type(feature) is LazyFeature:
+            feature._load()
+
+
+def _dumps_lazy(mapping, allow_nan, ensure_ascii):
+    # Writes the JSON text of untouched lazy features as it was read,
+    # encoding everything else as json.dumps would.
+    def encode(value):
+        return dumps(value, allow_nan=allow_nan, ensure_ascii=ensure_ascii)
+
+    members = []
+    for key, value in mapping.items():
+        if key == "features" and isinstance(value, list):
+            features = []
+            for feature in value:
+                if type(feature) is LazyFeature and (
+                        not ensure_ascii or feature.raw_json.isascii()):
+                    features.append(feature.raw_json)
+                else:
+                    features.append(encode(feature))
+            text = "[" + ", ".join(features) + "]"
+        else:
+            text = encode(value)
+        members.append(f"{encode(key)}: {text}")
+    return "{" + ", ".join(members) + "}"
+
+
+# Members holding GeoJSON objects, and members holding coordinates, as
+# walked when formatting coordinates
+_NESTED_MEMBERS = {"geometry", "geometries", "features"}
+_COORDINATE_MEMBERS = {"coordinates", "bbox"}
+_WALKED_MEMBERS = _NESTED_MEMBERS | _COORDINATE_MEMBERS
+
+_PLAIN_SEQUENCES = {list, tuple}
+
+# Stands for coordinates in the document given to the JSON encoder
+_PLACEHOLDER = "\ue000coordinates\ue000"
+
+_TRAILING_ZEROS = re.compile(r"0+(?=[],])")
+_TRAILING_POINTS = re.compile(r"\.(?=[],])")
+
+
+def _dumps_precision(obj, precision, cls, allow_nan, ensure_ascii, kwargs):
+    # Encodes obj with its coordinates formatted to the given number of
+    # decimal places, the rest as json.dumps would.
+    encoder = cls(allow_nan=allow_nan, ensure_ascii=ensure_ascii, **kwargs)
+    return _PrecisionEncoder(precision, encoder).encode(obj)
+
+
+class _PrecisionEncoder:
+    """
+    Encodes GeoJSON objects with coordinates formatted to a fixed number
+    of decimal places.
+
+    The JSON encoder is given a shallow copy of the objects in which
+    coordinates are replaced by a placeholder. Meanwhile the coordinates
+    of the whole document are formatted at once, with a single format
+    string whose trailing zeros are stripped from the result, and spliced
+    into the encoded text in place of the placeholders. This is faster
+    than encoding the shortest representation of every float, let alone
+    rounding a copy of the coordinates first.
+    """
+
+    def __init__(self, precision, encoder):
+        if precision < 0:
+            raise ValueError("coord_precision must not be negative")
+        self.precision = precision
+        self.encoder = encoder
+        separator = encoder.item_separator
+        # nested lists of positions stay on one line when indenting
+        self.separator = ", " if encoder.indent is not None else separator
+        self.templates = _PositionTemplates(precision, self.separator)
+
+    def encode(self, obj):
+        found = []
+
+        def replace(coordinates):
+            found.append(coordinates)
+            return _PLACEHOLDER
+
+        text = self.encoder.encode(self.substitute(obj, replace))
+        if not found:
+            return text
+        values = []
+        template = "\0".join([
+            self.template(coordinates, values) for coordinates in found])
+        formatted = template % tuple(values)
+        parts = text.split(self.encoder.encode(_PLACEHOLDER))
+        if "n" in formatted or len(parts) != len(found) + 1:
+            # "nan" and "inf" are the only formatted values with letters;
+            # the encoder rejects them or writes them as allow_nan says.
+            # Also taken if the document contains the placeholder.
+            return self.encoder.encode(self.substitute(
+                obj, functools.partial(_round_coordinates,
+                                       precision=self.precision)))
+        if self.precision:
+            # every value has precision decimals, so the zeros ending them
+            # are all decimals
+            formatted = _TRAILING_POINTS.sub(
+                "", _TRAILING_ZEROS.sub("", formatted))
+        pieces = [parts[0]]
+        for coordinates, part in zip(formatted.split("\0"), parts[1:]):
+            pieces.append(coordinates)
+            pieces.append(part)
+        return "".join(pieces)
+
+    def substitute(self, obj, replace):
+        # Returns a copy of obj with its coordinates replaced, visiting
+        # them in the order the encoder writes them.
+        if type(obj) is LazyFeature:
+            obj._load()
+        if isinstance(obj, dict):
+            mapping = obj
+        else:
+            mapping = to_mapping(obj)
+            if not is_mapping(mapping):
+                return mapping
+        copy = dict(mapping)
+        keys = _WALKED_MEMBERS.intersection(copy)
+        if len(keys) > 1:
+            keys = sorted(keys) if self.encoder.sort_keys \
+                else [key for key in copy if key in keys]
+        for key in keys:
+            value = copy[key]
+            if value is None:
+                continue
+            if key in _COORDINATE_MEMBERS:
+                if _is_sequence(value):
+                    copy[key] = replace(value)
+            elif key in _NESTED_MEMBERS:
+                if type(value) is list:
+                    copy[key] = [item if item is None
+                                 else self.substitute(item, replace)
+                                 for item in value]
+                else:
+                    copy[key] = self.substitute(value, replace)
+        return copy
+
+    def template(self, coordinates, values):
+        # Returns the format string of the coordinates, adding their
+        # numbers to values.
+        if type(coordinates) is not list and isinstance(coordinates,
+                                                        CoordinateArray):
+            coordinates = coordinates.tolist()
+        if not coordinates:
+            return "[]"
+        first = coordinates[0]
+        if not _is_sequence(first):
+            # a single position
+            values.extend(coordinates)
+            return self.templates[len(coordinates)]
+        # parts may be empty, so the depth is read from the first one that
+        # is not
+        first = next((part for part in coordinates if len(part)), first)
+        if len(first) and _is_sequence(first[0]):
+            return "[" + self.separator.join([
+                self.template(part, values) for part in coordinates]) + "]"
+        values.extend(chain.from_iterable(coordinates))
+        return "[" + self.separator.join(
+            map(self.templates.__getitem__, map(len, coordinates))) + "]"
+
+
+class _PositionTemplates(dict):
+    # Format strings of positions by number of values
+
+    def __init__(self, precision, separator):
+        super().__init__()
+        self.number = f"%.{precision}f"
+        self.separator = separator
+
+    def __missing__(self, dims):
+        template = "[" + self.separator.join([self.number] * dims) + "]"
+        self[dims] = template
+        return template
+
+
+def _is_sequence(value):
+    return type(value) in _PLAIN_SEQUENCES or isinstance(
+        value, (list, tuple, CoordinateArray))
+
+
+def _round_coordinates(coordinates, precision):
+    if _is_sequence(coordinates):
+        return [_round_coordinates(item, precision) for item in coordinates]
+    return round(coordinates, precision)
+
+
+# Type of the parts of the multi-part geometry types. When quantizing,
+# the positions of each line and ring are delta-encoded, while those of
+# Points and MultiPoints are not, as in TopoJSON.
+_PART_TYPES = {
+    "MultiLineString": "LineString",
+    "Polygon": "LineString",
+    "MultiPolygon": "Polygon",
+}
+_QUANTIZED_TYPES = {"Point", "MultiPoint", "LineString", *_PART_TYPES}
+
+
+def _quantized(mapping, quantize):
+    # Returns a copy of mapping with its positions quantized to integers
+    # on a grid of quantize by quantize steps spanning its bounding box,
+    # and a TopoJSON transform member mapping them back.
+    if isinstance(quantize, bool) or not isinstance(quantize, int) or \
+            quantize < 2:
+        raise ValueError("quantize must be an integer of at least 2")
+    geometries = []
+
+    def copy(obj):
+        if type(obj) is LazyFeature:
+            obj._load()
+        obj = obj if isinstance(obj, dict) else to_mapping(obj)
+        if not is_mapping(obj):
+            return obj
+        obj = dict(obj)
+        for key in _NESTED_MEMBERS.intersection(obj):
+            value = obj[key]
+            if type(value) is list:
+                obj[key] = [item if item is None else copy(item)
+                            for item in value]
+            elif value is not None:
+                obj[key] = copy(value)
+        coordinates = obj.get("coordinates")
+        if obj.get("type") in _QUANTIZED_TYPES and coordinates and \
+                _is_sequence(coordinates):
+            if isinstance(coordinates, CoordinateArray):
+                obj["coordinates"] = coordinates.tolist()
+            geometries.append(obj)
+        return obj
+
+    quantized = copy(mapping)
+    # the positions of each geometry as lines, a point being a line of a
+    # single position, whose first position is encoded as it is
+    lines = []
+    for geometry in geometries:
+        _collect_lines(geometry["coordinates"], geometry["type"], lines)
+    encoded = None
+    if numpy is not None:
+        encoded, transform = _quantize_arrays(lines, quantize)
+    if encoded is None:
+        encoded, transform = _quantize_lines(lines, quantize,
+                                             compute_bbox(quantized))
+    encoded = iter(encoded)
+    for geometry in geometries:
+        geometry["coordinates"] = _rebuild_lines(
+            geometry["coordinates"], geometry["type"], encoded)
+    quantized["transform"] = transform
+    return quantized
+
+
+def _collect_lines(coordinates, type_, lines):
+    if type_ == "Point":
+        lines.append([coordinates])
+    elif type_ == "MultiPoint":
+        lines.extend([position] for position in coordinates)
+    elif type_ == "LineString":
+        lines.append(coordinates)
+    else:
+        for part in coordinates:
+            _collect_lines(part, _PART_TYPES[type_], lines)
+
+
+def _rebuild_lines(coordinates, type_, encoded):
+    if type_ == "Point":
+        return next(encoded)[0]
+    if type_ == "MultiPoint":
+        return [next(encoded)[0] for _ in coordinates]
+    if type_ == "LineString":
+        return next(encoded)
+    return [_rebuild_lines(part, _PART_TYPES[type_], encoded)
+            for part in coordinates]
+
+
+def _scale(box, quantize):
+    # The transform of the grid spanning box, and the factors mapping
+    # coordinates onto it
+    if box is None:
+        return {"scale": [1, 1], "translate": [0, 0]}, 0, 0, 1, 1
+    dims = len(box) // 2
+    x0, y0 = float(box[0]), float(box[1])
+    width, height = box[dims] - x0, box[dims + 1] - y0
+    kx = (quantize - 1) / width if width else 1
+    ky = (quantize - 1) / height if height else 1
+    return {"scale": [1 / kx, 1 / ky], "translate": [x0, y0]}, x0, y0, kx, ky
+
+
+def _quantize_lines(lines, quantize, box):
+    transform, x0, y0, kx, ky = _scale(box, quantize)
+    encoded = []
+    for positions in lines:
+        line = []
+        append = line.append
+        previous_x = previous_y = 0
+        for values in positions:
+            x = round((values[0] - x0) * kx)
+            y = round((values[1] - y0) * ky)
+            if len(values) == 2:
+                append([x - previous_x, y - previous_y])
+            else:
+                append([x - previous_x, y - previous_y, *values[2:]])
+            previous_x, previous_y = x, y
+        encoded.append(line)
+    return encoded, transform
+
+
+def _quantize_arrays(lines, quantize):
+    # Quantizes and delta-encodes all lines at once when their positions
+    # all have two finite values; returns None otherwise.
+    lengths = numpy.fromiter(map(len, lines), numpy.intp, len(lines))
+    count = int(lengths.sum())
+    values = numpy.fromiter(
+        chain.from_iterable(chain.from_iterable(lines)), float)
+    if len(values) != 2 * count or not numpy.isfinite(values).all():
+        return None, None
+    positions = values.reshape(-1, 2)
+    box = None
+    if count:
+        box = [*positions.min(axis=0).tolist(),
+               *positions.max(axis=0).tolist()]
+    transform, x0, y0, kx, ky = _scale(box, quantize)
+    grid = numpy.rint((positions - (x0, y0)) * (kx, ky)).astype(numpy.int64)
+    deltas = numpy.diff(grid, axis=0, prepend=numpy.zeros((1, 2), int))
+    ends = numpy.cumsum(lengths)
+    starts = ends - lengths
+    first = starts[lengths > 0]
+    deltas[first] = grid[first]
+    rows = deltas.tolist()
+    return [rows[start:end]
+            for start, end in zip(starts.tolist(), ends.tolist())], transform
+
+
+def _dequantize(obj):
+    # Decodes the positions of obj, with its transform member, in place.
+    if isinstance(obj, dict):
+        transform = obj.pop("transform", None)
+    else:
+        # compact Features keep foreign members apart
+        extra = getattr(obj, "extra", None) or {}
+        transform = extra.pop("transform", None)
+    if transform is None:
+        return obj
+    try:
+        (kx, ky), (x0, y0) = transform["scale"], transform["translate"]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Invalid transform {transform!r}")
 
+    def position(values):
+        values[0] = values[0] * kx + x0
+        values[1] = values[1] * ky + y0
 
-def dumps(obj, cls=GeoJSONEncoder, allow_nan=False, ensure_ascii=False, **kwargs):
-    return json.dumps(to_mapping(obj),
+    def line(positions):
+        x = y = 0
+        for values in positions:
+            x += values[0]
+            y += values[1]
+            values[0] = x * kx + x0
+            values[1] = y * ky + y0
+
+    def decode(coordinates, type_):
+        if type_ == "Point":
+            position(coordinates)
+        elif type_ == "MultiPoint":
+            for values in coordinates:
+                position(values)
+        elif type_ == "LineString":
+            line(coordinates)
+        else:
+            for part in coordinates:
+                decode(part, _PART_TYPES[type_])
+
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        mapping = item if isinstance(item, dict) else to_mapping(item)
+        for key in ("features", "geometries"):
+            members = mapping.get(key)
+            if isinstance(members, list):
+                stack.extend(member for member in members
+                             if member is not None)
+        if mapping.get("geometry") is not None:
+            stack.append(mapping["geometry"])
+        coordinates = mapping.get("coordinates")
+        if mapping.get("type") in _QUANTIZED_TYPES and coordinates and \
+                isinstance(coordinates, list):
+            decode(coordinates, mapping["type"])
+            if isinstance(item, geojson.base.GeoJSON):
+                # the coordinates changed in place
+                item._clear_cache()
+    return obj
+
+
+def dump(obj, fp, cls=GeoJSONEncoder, allow_nan=False, bbox=False,
+         coord_precision=None, quantize=None, **kwargs):
+    ensure_ascii = kwargs.pop("ensure_ascii", True)
+    mapping = _with_bbox(obj) if bbox else to_mapping(obj)
+    if quantize is not None:
+        mapping = _quantized(mapping, quantize)
+    if coord_precision is not None:
+        fp.write(_dumps_precision(mapping, coord_precision, cls, allow_nan,
+                                  ensure_ascii, kwargs))
+        return
+    if _has_lazy_features(mapping):
+        if cls is GeoJSONEncoder and not kwargs:
+            fp.write(_dumps_lazy(mapping, allow_nan, ensure_ascii))
+            return
+        _load_features(mapping)
+    backend = _backend_for_dumps(cls, allow_nan, ensure_ascii, kwargs)
+    if backend is not None:
+        fp.write(backend.dumps(mapping, _default, **kwargs))
+        return
+    return json.dump(mapping,
+                     fp, cls=cls, allow_nan=allow_nan, ensure_ascii=ensure_ascii,
+                     **kwargs)
+
+
+def dumps(obj, cls=GeoJSONEncoder, allow_nan=False, ensure_ascii=False,
+          bbox=False, coord_precision=None, quantize=None, **kwargs):
+    mapping = _with_bbox(obj) if bbox else to_mapping(obj)
+    if quantize is not None:
+        mapping = _quantized(mapping, quantize)
+    if coord_precision is not None:
+        return _dumps_precision(mapping, coord_precision, cls, allow_nan,
+                                ensure_ascii, kwargs)
+    if _has_lazy_features(mapping):
+        if cls is GeoJSONEncoder and not kwargs:
+            return _dumps_lazy(mapping, allow_nan, ensure_ascii)
+        _load_features(mapping)
+    backend = _backend_for_dumps(cls, allow_nan, ensure_ascii, kwargs)
+    if backend is not None:
+        return backend.dumps(mapping, _default, **kwargs)
+    return json.dumps(mapping,
                       cls=cls, allow_nan=allow_nan, ensure_ascii=ensure_ascii, **kwargs)
 
 
@@ -33,22 +538,499 @@ def load(fp,
          cls=json.JSONDecoder,
          parse_constant=_enforce_strict_numbers,
          object_hook=geojson.base.GeoJSON.to_instance,
+         trusted=False,
+         dequantize=False,
          **kwargs):
-    return json.load(fp,
-                     cls=cls, object_hook=object_hook,
-                     parse_constant=parse_constant,
-                     **kwargs)
+    object_hook = _object_hook(object_hook, trusted)
+    backend = _backend_for_loads(cls, parse_constant, object_hook, kwargs)
+    if backend is not None:
+        obj = backend.loads(fp.read(), object_hook)
+    else:
+        obj = json.load(fp,
+                        cls=cls, object_hook=object_hook,
+                        parse_constant=parse_constant,
+                        **kwargs)
+    return _dequantize(obj) if dequantize else obj
 
 
 def loads(s,
           cls=json.JSONDecoder,
           parse_constant=_enforce_strict_numbers,
           object_hook=geojson.base.GeoJSON.to_instance,
+          trusted=False,
+          lazy=False,
+          dequantize=False,
           **kwargs):
-    return json.loads(s,
-                      cls=cls, object_hook=object_hook,
-                      parse_constant=parse_constant,
+    object_hook = _object_hook(object_hook, trusted)
+    # the features of a quantized collection are decoded with it, and lazy
+    # features can only stand for the Features of the default hooks
+    if lazy and not dequantize and object_hook in (
+            geojson.base.GeoJSON.to_instance, _to_trusted_instance):
+        decoder = cls(object_hook=object_hook, parse_constant=parse_constant,
                       **kwargs)
+        collection = _loads_lazy(s, decoder)
+        if collection is not None:
+            return collection
+    backend = _backend_for_loads(cls, parse_constant, object_hook, kwargs)
+    if backend is not None:
+        obj = backend.loads(s, object_hook)
+    else:
+        obj = json.loads(s,
+                         cls=cls, object_hook=object_hook,
+                         parse_constant=parse_constant,
+                         **kwargs)
+    return _dequantize(obj) if dequantize else obj
+
+
+def _loads_lazy(s, decoder):
+    # Decodes a FeatureCollection leaving its features as LazyFeatures;
+    # returns None for other documents.
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+    if not s.lstrip(" \t\n\r").startswith("{"):
+        return None
+    reader = FeatureCollectionReader(io.StringIO(s), decoder,
+                                     chunk_size=len(s), raw=True)
+    try:
+        features = [LazyFeature(text, decoder.decode) if text[0] == "{"
+                    else decoder.decode(text) for text in reader]
+    except ValueError:
+        # not laid out as a collection, let the regular decoder handle or
+        # report it
+        return None
+    members = reader.members
+    if members.get("type") != "FeatureCollection":
+        return None
+    collection = geojson.FeatureCollection(
+        features, **{k: v for k, v in members.items() if k != "type"})
+    return collection
+
+
+# RFC 8142 records are introduced by an ASCII record separator
+_RECORD_SEPARATOR = "\x1e"
+_RECORD_SEPARATOR_BYTES = b"\x1e"
+
+
+def dump_seq(objs, fp, rs=False, batch_size=1000,
+             cls=GeoJSONEncoder, allow_nan=False, ensure_ascii=False,
+             **kwargs):
+    """
+    Writes GeoJSON objects as a text sequence, one object per line.
+
+    A FeatureCollection is written as the sequence of its features.
+
+    :param objs: GeoJSON objects to write, a single GeoJSON object or a
+    FeatureCollection.
+    :type objs: iterable, GeoJSON
+    :param fp: File-like object to write to.
+    :param rs: Prefix each record with the RFC 8142 record separator,
+    otherwise write newline-delimited GeoJSON.
+    :type rs: bool
+    :param batch_size: Number of records encoded before each write.
+    :type batch_size: int
+    """
+    if is_mapping(objs) or hasattr(objs, "__geo_interface__"):
+        mapping = to_mapping(objs)
+        if mapping.get("type") == "FeatureCollection":
+            objs = mapping["features"]
+        else:
+            objs = [mapping]
+    encode = cls(allow_nan=allow_nan, ensure_ascii=ensure_ascii,
+                 **kwargs).encode
+    prefix = _RECORD_SEPARATOR if rs else ""
+    batch = []
+    for obj in objs:
+        batch.append(f"{prefix}{encode(to_mapping(obj))}\n")
+        if len(batch) >= batch_size:
+            fp.write("".join(batch))
+            batch = []
+    if batch:
+        fp.write("".join(batch))
+
+
+def load_seq(fp,
+             cls=json.JSONDecoder,
+             parse_constant=_enforce_strict_numbers,
+             object_hook=geojson.base.GeoJSON.to_instance,
+             skip_invalid=False,
+             trusted=False,
+             **kwargs):
+    """
+    Lazily decodes a GeoJSON text sequence, yielding one object at a time.
+
+    Both RFC 8142 sequences (records prefixed by an ASCII record separator)
+    and newline-delimited GeoJSON are understood; blank lines are ignored.
+
+    :param fp: Text or binary (UTF-8) file-like object, or any iterable of
+    lines, to read.
+    :param skip_invalid: Silently skip records that cannot be decoded, or
+    that are not valid GeoJSON objects, instead of raising.
+    :type skip_invalid: bool
+    :param trusted: Build geometries without cleaning their coordinates.
+    :type trusted: bool
+    :return: A generator of decoded GeoJSON objects.
+    :rtype: generator
+    :raises ValueError: If a record cannot be decoded, unless skip_invalid.
+    """
+    decode = cls(object_hook=_object_hook(object_hook, trusted),
+                 parse_constant=parse_constant,
+                 **kwargs).decode
+    for number, record in enumerate(_iter_records(fp), 1):
+        if not record.strip():
+            continue
+        try:
+            if isinstance(record, bytes):
+                record = record.decode("utf-8")
+            yield decode(record)
+        except (ValueError, TypeError) as invalid:
+            if not skip_invalid:
+                raise ValueError(
+                    f"Invalid GeoJSON text in record {number}: {invalid}"
+                ) from invalid
+
+
+def _iter_records(lines):
+    # Records are separated by RS when the stream uses them (a record may
+    # then span several lines), otherwise each line is a record.
+    # Lines of binary streams are kept as bytes, decoded record by record,
+    # and a byte order mark starting the stream is dropped as iterload
+    # does.
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        return
+    if first.startswith(codecs.BOM_UTF8 if isinstance(first, bytes)
+                        else "\ufeff"):
+        first = first[3 if isinstance(first, bytes) else 1:]
+    pending = None
+    for line in chain([first], lines):
+        separator = _RECORD_SEPARATOR if isinstance(line, str) \
+            else _RECORD_SEPARATOR_BYTES
+        if line.startswith(separator):
+            if pending is not None:
+                yield pending[0][:0].join(pending)
+            pending = [line[1:]]
+        elif pending is not None:
+            pending.append(line)
+        else:
+            yield line
+    if pending is not None:
+        yield pending[0][:0].join(pending)
+
+
+def iterload(fp,
+             cls=json.JSONDecoder,
+             parse_constant=_enforce_strict_numbers,
+             object_hook=geojson.base.GeoJSON.to_instance,
+             chunk_size=65536,
+             trusted=False,
+             **kwargs):
+    """
+    Incrementally decodes a FeatureCollection from a file-like object.
+
+    Only the feature currently being decoded is held in memory, so
+    arbitrarily large collections can be processed feature by feature.
+
+    :param fp: Text or binary (UTF-8) file-like object to read from.
+    :param chunk_size: Number of characters (or bytes) to read at a time.
+    :type chunk_size: int
+    :param trusted: Build geometries without cleaning their coordinates.
+    :type trusted: bool
+    :return: An iterable yielding each decoded Feature in turn.
+    :rtype: FeatureCollectionReader
+    :raises ValueError: While iterating, if the document is not a valid
+    FeatureCollection.
+    """
+    decoder = cls(object_hook=_object_hook(object_hook, trusted),
+                  parse_constant=parse_constant,
+                  **kwargs)
+    return FeatureCollectionReader(fp, decoder, chunk_size=chunk_size)
+
+
+# First characters of JSON numbers
+_NUMBER_START = frozenset("-0123456789")
+
+
+class FeatureCollectionReader:
+    """
+    Iterates over the features of a FeatureCollection read from a stream.
+
+    Top-level members other than ``features`` (``type``, ``bbox``,
+    ``crs``, ...) are collected in ``members`` as they are encountered:
+    those preceding the ``features`` array are available as soon as the
+    first feature has been yielded, the rest once iteration is complete.
+
+    With ``raw=True`` the JSON text of each feature is yielded instead of
+    the decoded feature.
+    """
+
+    _WHITESPACE = " \t\n\r"
+    # A truncated token may end the buffer, the longest being "-Infinity"
+    # or an escaped surrogate pair
+    _LONGEST_TOKEN = 12
+
+    def __init__(self, fp, decoder, chunk_size=65536, raw=False):
+        self.members = {}
+        self._fp = fp
+        self._decoder = decoder
+        # features are only delimited in raw mode, with a plain decoder
+        self._scanner = json.JSONDecoder(
+            parse_constant=decoder.parse_constant) if raw else None
+        self._start = 0
+        self._chunk_size = chunk_size
+        self._utf8 = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._iterator = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._iterator is None:
+            self._iterator = self._iter_features()
+        return next(self._iterator)
+
+    def _read(self, size):
+        chunk = self._fp.read(size)
+        self._eof = not chunk
+        if isinstance(chunk, bytes):
+            if self._utf8 is None:
+                self._utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self._utf8.decode(chunk, final=self._eof)
+        # drop the consumed prefix so memory stays proportional to the
+        # value currently being decoded
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+
+    def _peek(self):
+        """Skips whitespace and returns the next character ('' at EOF)."""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self._eof:
+                return ""
+            self._read(self._chunk_size)
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expecting one of {chars!r} but found {char or 'EOF'!r} "
+                f"while reading a FeatureCollection")
+        self._pos += 1
+        return char
+
+    def _decode(self, decoder=None):
+        """Decodes the JSON value starting at the current position."""
+        decoder = decoder or self._decoder
+        self._peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as error:
+                if self._eof or not self._truncated(error):
+                    raise
+            else:
+                # a number ending near the end of the buffer may continue
+                # in the next chunk, as "12." or "1.5e" were cut from it
+                if self._eof or self._buffer[self._pos] not in _NUMBER_START \
+                        or end < len(self._buffer) - self._LONGEST_TOKEN:
+                    self._start, self._pos = self._pos, end
+                    return value
+            # grow geometrically so huge values are not re-parsed too often
+            self._read(max(self._chunk_size, len(self._buffer)))
+
+    def _truncated(self, error):
+        # Whether the value may continue in the next chunk: decoding
+        # stopped within a token's length of the end of the buffer, or in
+        # a string that is not closed before it. Other errors are raised
+        # without reading the rest of the stream.
+        return (error.pos >= len(self._buffer) - self._LONGEST_TOKEN
+                or error.msg.startswith("Unterminated string"))
+
+    def _iter_features(self):
+        self._read(self._chunk_size)
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            self._check_type(False)
+            return
+        has_features = False
+        while True:
+            key = self._decode()
+            if not isinstance(key, str):
+                raise ValueError(f"Expecting a member name but found {key!r}")
+            self._expect(":")
+            if key == "features":
+                has_features = True
+                self._expect("[")
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        if self._scanner is None:
+                            yield self._decode()
+                        else:
+                            self._decode(self._scanner)
+                            yield self._buffer[self._start:self._pos]
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.members[key] = self._decode()
+                if key == "type":
+                    self._check_type(True)
+            if self._expect(",}") == "}":
+                self._check_type(has_features)
+                return
+
+    def _check_type(self, has_features):
+        # A missing type is tolerated in a document with features
+        type_ = self.members.get("type")
+        if type_ != "FeatureCollection" and (type_ is not None or
+                                             not has_features):
+            raise ValueError(
+                f"Expecting a FeatureCollection but found {type_!r}")
+
+
+class FeatureCollectionWriter:
+    """
+    Writes a FeatureCollection to a stream one feature at a time.
+
+    The header is written on the first write, encoded features are
+    written in batches of ``batch_size``, and the ``features`` array and
+    the collection are closed by :meth:`close`. Only the current batch is
+    held in memory, whatever the number of features written.
+
+    Used as a context manager, the writer is closed when the block exits
+    normally. If the block raises, the collection is left unterminated so
+    that the output cannot be mistaken for a complete one.
+    """
+
+    def __init__(self, fp, members=None, batch_size=1000,
+                 cls=GeoJSONEncoder, allow_nan=False, ensure_ascii=False,
+                 coord_precision=None, **kwargs):
+        """
+        Initialises a FeatureCollectionWriter.
+
+        :param fp: Text or binary file-like object to write to, such as an
+        open file or the result of ``socket.makefile("wb")``. Binary
+        streams are written UTF-8 encoded.
+        :param members: Top-level members of the collection other than
+        ``type`` and ``features``, e.g. ``{"name": "roads"}``.
+        :type members: dict
+        :param batch_size: Number of features encoded before each write.
+        :type batch_size: int
+        :param coord_precision: Write coordinates with at most this many
+        decimal places, as geojson.dumps does.
+        :type coord_precision: int
+        """
+        self._fp = fp
+        self._binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+        self._members = dict(members or {})
+        self._batch_size = batch_size
+        self._ensure_ascii = ensure_ascii
+        # the text of lazy features is written as it was read, unless
+        # coordinates have to be formatted
+        self._splice_lazy = coord_precision is None
+        backend = _backend_for_dumps(cls, allow_nan, ensure_ascii, kwargs)
+        if coord_precision is not None:
+            self._encode = _PrecisionEncoder(coord_precision, cls(
+                allow_nan=allow_nan, ensure_ascii=ensure_ascii,
+                **kwargs)).encode
+        elif backend is not None:
+            def encode(obj):
+                return backend.dumps(obj, _default, **kwargs)
+            self._encode = encode
+        else:
+            self._encode = cls(allow_nan=allow_nan, ensure_ascii=ensure_ascii,
+                               **kwargs).encode
+        self._batch = []
+        self._started = False
+        self.closed = False
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def _write(self, text):
+        if not self._binary:
+            self._fp.write(text)
+            return
+        data = memoryview(text.encode("utf-8"))
+        while data:
+            # unbuffered streams may write only part of the data
+            data = data[self._fp.write(data):]
+
+    def _encode_feature(self, feature):
+        if type(feature) is LazyFeature:
+            if self._splice_lazy and (not self._ensure_ascii or
+                                      feature.raw_json.isascii()):
+                return feature.raw_json
+            feature._load()
+        return self._encode(to_mapping(feature))
+
+    def _flush(self):
+        if not self._started:
+            header = ['{"type": "FeatureCollection"']
+            for key, value in self._members.items():
+                if key not in ("type", "features"):
+                    header.append(
+                        f"{self._encode(key)}: {self._encode(value)}")
+            self._write(", ".join(header) + ', "features": [')
+        if self._batch:
+            separator = ", " if self._started else ""
+            self._write(separator + ", ".join(self._batch))
+            self._batch = []
+        self._started = True
+
+    def write(self, feature):
+        """
+        Writes a feature.
+
+        :param feature: The feature to write.
+        :type feature: Feature, dict
+        :raises ValueError: If the writer is closed.
+        """
+        if self.closed:
+            raise ValueError("write to a closed FeatureCollectionWriter")
+        self._batch.append(self._encode_feature(feature))
+        self.count += 1
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+
+    def write_all(self, features):
+        """
+        Writes every feature of an iterable, consuming it lazily.
+
+        :param features: The features to write, e.g. a generator over the
+        rows of a database cursor.
+        :type features: iterable
+        :raises ValueError: If the writer is closed.
+        """
+        for feature in features:
+            self.write(feature)
+
+    def close(self):
+        """
+        Writes the remaining features, terminates the collection and
+        flushes the stream, which is left open.
+        """
+        if self.closed:
+            return
+        self._flush()
+        self._write("]}")
+        self.closed = True
+        self._fp.flush()
 
 
 # Backwards compatibility
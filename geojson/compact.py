@@ -0,0 +1,190 @@
+"""
+Compact alternatives to the dict-based GeoJSON classes.
+
+The classes here store their members in ``__slots__`` instead of a dict
+per object, which makes them several times smaller, at the price of the
+dict interface: they are read and written through attributes only, and
+converted to mappings through ``__geo_interface__``. They are meant for
+holding large numbers of simple features in memory. Coordinates are not
+rounded, like those of geometries constructed with ``trusted=True``.
+
+Decoding into compact objects is done by passing
+``object_hook=geojson.compact.object_hook`` to ``geojson.loads``,
+``geojson.load`` or ``geojson.iterload``.
+"""
+
+import geojson
+from geojson.base import GeoJSON, _repr
+from geojson.geometry import check_line_string, check_point, check_polygon
+from geojson.mapping import is_mapping, normalize, to_mapping
+
+
+class Compact:
+    """
+    Base class of the compact GeoJSON objects.
+    """
+
+    __slots__ = ()
+
+    type = None
+
+    @property
+    def is_valid(self):
+        return not self.errors()
+
+    def errors(self):
+        """Return validation errors (if any)."""
+        raise NotImplementedError(type(self))
+
+    def __eq__(self, other):
+        if isinstance(other, Compact) or is_mapping(other) or \
+                hasattr(other, "__geo_interface__"):
+            return self.__geo_interface__ == to_mapping(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return _repr(self, geojson.base.REPR_MAX_LENGTH)
+
+    def __str__(self):
+        return _repr(self, None)
+
+
+class Geometry(Compact):
+    """
+    Base class of the compact geometries.
+    """
+
+    __slots__ = ("coordinates",)
+
+    def __init__(self, coordinates):
+        """
+        Initialises a compact geometry.
+
+        :param coordinates: The coordinates of the geometry; tuples are
+        converted to lists.
+        :type coordinates: list, tuple
+        """
+        self.coordinates = normalize(coordinates)
+
+    @classmethod
+    def _adopt(cls, coordinates):
+        # decoded coordinates are lists already
+        geometry = cls.__new__(cls)
+        geometry.coordinates = coordinates
+        return geometry
+
+    @property
+    def __geo_interface__(self):
+        return {"type": self.type, "coordinates": self.coordinates}
+
+
+class Point(Geometry):
+    __slots__ = ()
+
+    type = "Point"
+
+    def errors(self):
+        return check_point(self.coordinates)
+
+
+class LineString(Geometry):
+    __slots__ = ()
+
+    type = "LineString"
+
+    def errors(self):
+        return check_line_string(self.coordinates)
+
+
+class Polygon(Geometry):
+    __slots__ = ()
+
+    type = "Polygon"
+
+    def errors(self):
+        return check_polygon(self.coordinates)
+
+
+class Feature(Compact):
+    """
+    A compact Feature.
+    """
+
+    __slots__ = ("id", "geometry", "properties", "extra")
+
+    type = "Feature"
+
+    def __init__(self, id=None, geometry=None, properties=None, **extra):
+        """
+        Initialises a compact Feature.
+
+        :param id: Feature identifier, such as a sequential number.
+        :type id: str, int
+        :param geometry: Geometry of the feature, a compact geometry or any
+        GeoJSON geometry.
+        :param properties: Dict containing properties of the feature.
+        :type properties: dict
+        :param extra: Foreign members of the feature.
+        """
+        self.id = id
+        self.geometry = geometry
+        self.properties = properties
+        self.extra = extra or None
+
+    @property
+    def __geo_interface__(self):
+        mapping = {"type": "Feature"}
+        if self.id is not None:
+            mapping["id"] = self.id
+        geometry = self.geometry
+        mapping["geometry"] = None if geometry is None else getattr(
+            geometry, "__geo_interface__", geometry)
+        mapping["properties"] = {} if self.properties is None \
+            else self.properties
+        if self.extra:
+            mapping.update(self.extra)
+        return mapping
+
+    def errors(self):
+        geometry = self.geometry
+        if geometry is None:
+            return None
+        if not hasattr(geometry, "errors"):
+            geometry = GeoJSON.to_instance(geometry, strict=True)
+        return geometry.errors()
+
+
+_GEOMETRIES = {cls.type: cls for cls in (Point, LineString, Polygon)}
+
+
+def object_hook(obj):
+    """
+    Decodes Points, LineStrings, Polygons and Features into compact objects.
+
+    Geometries with members other than "type" and "coordinates", and other
+    GeoJSON types, are decoded into the regular classes, except for
+    FeatureCollections, which are left as dicts so that their features stay
+    compact.
+
+    :param obj: A decoded JSON object.
+    :type obj: dict
+    :return: The compact object, GeoJSON object or obj itself.
+    """
+    type_ = obj.get("type")
+    if type_ == "Feature":
+        members = dict(obj)
+        del members["type"]
+        feature = Feature(**members)
+        if not feature.properties:
+            # an empty dict per feature would outweigh the feature itself
+            feature.properties = None
+        return feature
+    if len(obj) == 2 and "coordinates" in obj and isinstance(type_, str):
+        cls = _GEOMETRIES.get(type_)
+        if cls is not None:
+            return cls._adopt(obj["coordinates"])
+    if type_ == "FeatureCollection":
+        return obj
+    return GeoJSON.to_instance(obj)
@@ -0,0 +1,383 @@
+"""
+Compact storage for the coordinates of large geometries.
+"""
+
+from array import array
+from collections.abc import Sequence
+from operator import itemgetter
+
+
+class CoordinateArray(Sequence):
+    """
+    Nested coordinates packed into one contiguous array of numbers.
+
+    All positions are stored one after another in ``values`` (an
+    ``array('d')`` or a NumPy array), ``dims`` numbers each. Every level of
+    nesting above the positions (the rings of a Polygon, the parts of a
+    MultiPolygon, ...) is described by an array of offsets, outermost
+    level first: element ``i`` of a level spans items ``offsets[i]`` up to
+    ``offsets[i + 1]`` of the level below it, the last level indexing
+    positions. A LineString therefore needs no offsets, a Polygon one
+    array of ring offsets and a MultiPolygon two.
+
+    The object behaves like the equivalent nested list: indexing returns
+    nested CoordinateArray views sharing the same storage, and positions
+    as lists of floats.
+    """
+
+    __slots__ = ("values", "dims", "offsets", "_level", "_start", "_stop")
+
+    def __init__(self, values, dims=2, offsets=()):
+        """
+        Initialises a CoordinateArray.
+
+        :param values: Flat sequence of the numbers of all positions.
+        :type values: array, numpy.ndarray
+        :param dims: Number of values per position.
+        :type dims: int
+        :param offsets: Offset arrays for each level of nesting above the
+        positions, outermost first.
+        :type offsets: sequence of sequences of int
+        :raises ValueError: If values or offsets are inconsistent.
+        """
+        if not isinstance(values, array) and not hasattr(values, "tolist"):
+            values = array("d", values)
+        if len(values) % dims:
+            raise ValueError(
+                f"{len(values)} values cannot be split into positions of "
+                f"{dims} values")
+        offsets = tuple(o if isinstance(o, array) else array("q", o)
+                        for o in offsets)
+        count = len(values) // dims
+        for level in reversed(offsets):
+            if len(level) == 0 or level[0] != 0 or level[-1] != count:
+                raise ValueError("offsets must start at 0 and end with the "
+                                 "number of items of the level below")
+            count = len(level) - 1
+        self.values = values
+        self.dims = dims
+        self.offsets = offsets
+        self._level = 0
+        self._start = 0
+        self._stop = count
+
+    @classmethod
+    def _view(cls, parent, level, start, stop):
+        view = cls.__new__(cls)
+        view.values = parent.values
+        view.dims = parent.dims
+        view.offsets = parent.offsets
+        view._level = level
+        view._start = start
+        view._stop = stop
+        return view
+
+    @classmethod
+    def from_nested(cls, coordinates, depth=None):
+        """
+        Packs nested lists of coordinates.
+
+        :param coordinates: The coordinates of a geometry, e.g. a list of
+        rings for a Polygon.
+        :type coordinates: list
+        :param depth: Number of list levels above the positions, e.g. 2
+        for a Polygon. By default it is read from the first non-empty part
+        at each level, and innermost empty lists are taken as lists of
+        positions.
+        :type depth: int
+        :return: The packed coordinates.
+        :rtype: CoordinateArray
+        :raises ValueError: If positions have differing numbers of values.
+        """
+        if depth is None:
+            depth, found = _nested_depth(coordinates)
+            if not found:
+                depth += 1
+        else:
+            # counting the level of the positions themselves
+            depth += 1
+        if depth == 1:
+            # a single position, as in a Point
+            values = array("d", coordinates)
+            packed = cls(values, dims=len(values) or 2)
+            return cls._view(packed, 1, 0, len(values))
+
+        values = array("d")
+        dims = None
+
+        def extend(positions):
+            nonlocal dims
+            for position in positions:
+                if dims is None:
+                    dims = len(position)
+                elif len(position) != dims:
+                    raise ValueError("positions must all have the same "
+                                     "number of values")
+                values.extend(position)
+
+        offsets = tuple(array("q", [0]) for _ in range(depth - 2))
+        last = len(offsets) - 1
+        if last < 0:
+            extend(coordinates)
+        stack = [(item, 0) for item in reversed(coordinates)] \
+            if offsets else []
+        while stack:
+            items, level = stack.pop()
+            offsets[level].append(offsets[level][-1] + len(items))
+            if level == last:
+                extend(items)
+            else:
+                stack.extend((item, level + 1) for item in reversed(items))
+        return cls(values, dims or 2, offsets)
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = self._stop - self._start
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("CoordinateArray index out of range")
+        return self._item(self._start + index)
+
+    def _item(self, i):
+        level = self._level
+        depth = len(self.offsets)
+        if level < depth:
+            offsets = self.offsets[level]
+            return self._view(self, level + 1, offsets[i], offsets[i + 1])
+        if level == depth:
+            dims = self.dims
+            return self.values[i * dims:(i + 1) * dims].tolist()
+        return self.values[i]
+
+    def __iter__(self):
+        for i in range(self._start, self._stop):
+            yield self._item(i)
+
+    def _position_range(self):
+        start, stop = self._start, self._stop
+        for offsets in self.offsets[self._level:]:
+            start, stop = offsets[start], offsets[stop]
+        return start, stop
+
+    def positions(self):
+        """
+        Yields every position as a tuple, without building nested lists.
+
+        :return: A generator of coordinate tuples.
+        :rtype: generator
+        """
+        if self._level > len(self.offsets):
+            yield tuple(self.values[self._start:self._stop].tolist())
+            return
+        start, stop = self._position_range()
+        dims = self.dims
+        flat = self.values[start * dims:stop * dims]
+        yield from zip(*(flat[i::dims].tolist() for i in range(dims)))
+
+    def tolist(self):
+        """
+        Returns the coordinates as nested lists.
+
+        :rtype: list
+        """
+        level = self._level
+        depth = len(self.offsets)
+        if level > depth:
+            return self.values[self._start:self._stop].tolist()
+        if level == depth:
+            dims = self.dims
+            flat = self.values[self._start * dims:self._stop * dims].tolist()
+            return [flat[i:i + dims] for i in range(0, len(flat), dims)]
+        return [item.tolist() for item in self]
+
+    def _is_root(self):
+        if self._level == 0:
+            return True
+        return self._level > len(self.offsets) and len(self) == len(
+            self.values)
+
+    def _root(self):
+        if self._is_root():
+            return self
+        return self.from_nested(self.tolist(),
+                                max(len(self.offsets) - self._level, 0))
+
+    def _replace_values(self, values, dims):
+        packed = self._view(self, self._level, self._start, self._stop)
+        packed.values = values
+        packed.dims = dims
+        if self._level > len(self.offsets):
+            packed._stop = len(values)
+        return packed
+
+    def rounded(self, precision):
+        """
+        Returns a copy with every value rounded to the given precision.
+
+        :param precision: Number of decimal places to keep.
+        :type precision: int
+        :rtype: CoordinateArray
+        """
+        root = self._root()
+        values = array("d", [round(v, precision) for v in root.values])
+        return root._replace_values(values, root.dims)
+
+    def map_positions(self, func):
+        """
+        Returns a copy with func applied to each position tuple.
+
+        :param func: Function mapping a position tuple to a new position.
+        :type func: function
+        :rtype: CoordinateArray
+        """
+        root = self._root()
+        values = array("d")
+        dims = None
+        for position in root.positions():
+            mapped = func(position)
+            values.extend(mapped)
+            if dims is None:
+                dims = len(mapped)
+        return root._replace_values(values, dims or root.dims)
+
+    def __eq__(self, other):
+        if isinstance(other, CoordinateArray):
+            other = other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.tolist()!r})"
+
+
+def coordinates_bbox(coordinates):
+    """
+    Computes the bounding box of the coordinates of a geometry.
+
+    Each list of positions is scanned once per bound without creating a
+    tuple per position.
+
+    :param coordinates: The coordinates of a geometry, nested lists or a
+    CoordinateArray.
+    :type coordinates: list, CoordinateArray
+    :return: ``[west, south, east, north]``, with the minimum and maximum
+    elevation inserted when every position has one, or None if there are
+    no positions.
+    :rtype: list
+    """
+    if type(coordinates) is not list and isinstance(coordinates,
+                                                    CoordinateArray):
+        return _packed_bbox(coordinates)
+    if not coordinates:
+        return None
+    first = coordinates[0]
+    if not isinstance(first, _SEQUENCES):
+        # a single position
+        position = coordinates[:3 if len(coordinates) >= 3 else 2]
+        return [*position, *position]
+    if first and not isinstance(first[0], _SEQUENCES):
+        return _positions_bbox(coordinates)
+    return merge_bboxes(coordinates_bbox(part) for part in coordinates)
+
+
+# Nested coordinates: lists and tuples, or CoordinateArray views of packed
+# ones. Only lists and packed coordinates are valid, being what JSON
+# arrays decode to.
+_SEQUENCES = (list, tuple, CoordinateArray)
+_VALID_SEQUENCES = (list, CoordinateArray)
+
+# Number of list levels above the positions of each geometry type
+_POSITION_DEPTHS = {
+    'Point': 0,
+    'LineString': 1,
+    'MultiPoint': 1,
+    'MultiLineString': 2,
+    'Polygon': 2,
+    'MultiPolygon': 3,
+}
+
+
+def _nested_depth(coordinates):
+    # Returns the number of list levels above the first number, looking
+    # past empty parts, and whether a number was found at all; if not,
+    # the depth is that of the most deeply nested list.
+    if not isinstance(coordinates, _SEQUENCES):
+        return 0, True
+    depth = 1
+    for item in coordinates:
+        below, found = _nested_depth(item)
+        if found:
+            return below + 1, True
+        depth = max(depth, below + 1)
+    return depth, False
+
+
+def _positions_bbox(positions):
+    bounds = []
+    for i in range(3 if min(map(len, positions)) >= 3 else 2):
+        bounds.append((min(map(itemgetter(i), positions)),
+                       max(map(itemgetter(i), positions))))
+    return [low for low, _ in bounds] + [high for _, high in bounds]
+
+
+def _packed_bbox(packed):
+    if packed._level > len(packed.offsets):
+        # a single position
+        return _positions_bbox([packed.tolist()]) if len(packed) else None
+    start, stop = packed._position_range()
+    if start == stop:
+        return None
+    dims = packed.dims
+    flat = packed.values[start * dims:stop * dims]
+    bounds = []
+    for i in range(3 if dims >= 3 else 2):
+        values = flat[i::dims]
+        if hasattr(values, "min"):
+            # NumPy reduces faster than iterating over its scalars
+            bounds.append((float(values.min()), float(values.max())))
+        else:
+            bounds.append((min(values), max(values)))
+    return [low for low, _ in bounds] + [high for _, high in bounds]
+
+
+def merge_bboxes(bboxes):
+    """
+    Returns the bounding box enclosing all of the given ones.
+
+    :param bboxes: Bounding boxes as returned by coordinates_bbox; None
+    entries are ignored.
+    :type bboxes: iterable
+    :return: The enclosing box, 2D unless all boxes are 3D, or None.
+    :rtype: list
+    """
+    result = None
+    for bbox in bboxes:
+        if bbox is None:
+            continue
+        if result is None:
+            result = list(bbox)
+            continue
+        if len(bbox) != len(result):
+            result = _flatten_bbox(result)
+            bbox = _flatten_bbox(bbox)
+        half = len(result) // 2
+        for i in range(half):
+            if bbox[i] < result[i]:
+                result[i] = bbox[i]
+            if bbox[half + i] > result[half + i]:
+                result[half + i] = bbox[half + i]
+    return result
+
+
+def _flatten_bbox(bbox):
+    if len(bbox) == 6:
+        return [bbox[0], bbox[1], bbox[3], bbox[4]]
+    return list(bbox)
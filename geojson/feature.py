@@ -1,4 +1,5 @@
 from geojson.base import GeoJSON
+from geojson.index import SpatialIndex
 
 
 class Feature(GeoJSON):
@@ -30,6 +31,54 @@ class Feature(GeoJSON):
         return geo.errors() if geo else None
 
 
+class LazyFeature(Feature):
+    """
+    A Feature decoded from its JSON text only when it is first used.
+
+    Any access to the feature's members decodes the text, fills in the
+    feature and turns the object into a plain Feature. Until then the
+    text is kept as is in ``raw_json``, so that an untouched feature can
+    be written out again without being encoded.
+    """
+
+    def __init__(self, raw, decode):
+        """
+        Initialises a LazyFeature.
+
+        :param raw: JSON text of the feature.
+        :type raw: str
+        :param decode: Function decoding raw into a Feature.
+        :type decode: function
+        """
+        self.__dict__.update(_raw=raw, _decode=decode)
+
+    @property
+    def raw_json(self):
+        return self.__dict__["_raw"]
+
+    def _load(self):
+        state = self.__dict__
+        feature = state.pop("_decode")(state.pop("_raw"))
+        object.__setattr__(self, "__class__", Feature)
+        dict.update(self, feature)
+
+
+def _load_first(name):
+    def load_first(self, *args, **kwargs):
+        self._load()
+        return getattr(self, name)(*args, **kwargs)
+    load_first.__name__ = name
+    return load_first
+
+
+for _name in ("__getitem__", "__setitem__", "__delitem__", "__contains__",
+              "__iter__", "__reversed__", "__len__", "__eq__", "__ne__",
+              "__or__", "__ror__", "__ior__", "__reduce__", "__reduce_ex__",
+              "get", "keys", "values", "items", "copy", "update",
+              "setdefault", "pop", "popitem", "clear"):
+    setattr(LazyFeature, _name, _load_first(_name))
+
+
 class FeatureCollection(GeoJSON):
     """
     Represents a FeatureCollection, a set of multiple Feature objects.
@@ -52,6 +101,18 @@ class FeatureCollection(GeoJSON):
     def errors(self):
         return self.check_list_errors(lambda x: x.errors(), self.features)
 
+    def build_index(self, node_capacity=16):
+        """
+        Builds a spatial index over the bounding boxes of the features.
+
+        :param node_capacity: Maximum number of children of a tree node.
+        :type node_capacity: int
+        :return: An index whose query() and nearest() methods return
+        features of this collection, including ones appended later.
+        :rtype: geojson.index.SpatialIndex
+        """
+        return SpatialIndex(self["features"], node_capacity)
+
     def __getitem__(self, key):
         try:
             return self.get("features", ())[key]
@@ -2,6 +2,8 @@ from decimal import Decimal
 from numbers import Number, Real
 
 from geojson.base import GeoJSON
+from geojson.coordinates import (
+    _POSITION_DEPTHS, _VALID_SEQUENCES, CoordinateArray)
 
 
 DEFAULT_PRECISION = 6
@@ -12,7 +14,8 @@ class Geometry(GeoJSON):
     Represents an abstract base class for a WGS84 geometry.
     """
 
-    def __init__(self, coordinates=None, validate=False, precision=None, **extra):
+    def __init__(self, coordinates=None, validate=False, precision=None,
+                 packed=False, trusted=False, **extra):
         """
         Initialises a Geometry object.
 
@@ -22,12 +25,25 @@ class Geometry(GeoJSON):
         :type validate: boolean
         :param precision: Number of decimal places for lat/lon coords.
         :type precision: integer
+        :param packed: Store the coordinates in a compact CoordinateArray
+        instead of nested lists.
+        :type packed: boolean
+        :param trusted: Adopt the coordinates as they are, without copying
+        or rounding them. Only for coordinates known to be nested lists
+        of numbers already; precision is ignored.
+        :type trusted: boolean
         """
         super().__init__(**extra)
         if precision is None:
             precision = DEFAULT_PRECISION
-        self["coordinates"] = self.clean_coordinates(
-            coordinates or [], precision)
+        if trusted:
+            coordinates = [] if coordinates is None else coordinates
+        else:
+            coordinates = self.clean_coordinates(coordinates or [], precision)
+        if packed and not isinstance(coordinates, CoordinateArray):
+            coordinates = CoordinateArray.from_nested(
+                coordinates, _POSITION_DEPTHS.get(self["type"]))
+        self["coordinates"] = coordinates
 
         if validate:
             errors = self.errors()
@@ -38,20 +54,42 @@ class Geometry(GeoJSON):
     def clean_coordinates(cls, coords, precision):
         if isinstance(coords, cls):
             return coords['coordinates']
-
-        new_coords = []
+        if isinstance(coords, CoordinateArray):
+            return coords.rounded(precision)
         if isinstance(coords, Geometry):
             coords = [coords]
-        for coord in coords:
-            if isinstance(coord, (list, tuple)):
-                new_coords.append(cls.clean_coordinates(coord, precision))
-            elif isinstance(coord, Geometry):
-                new_coords.append(coord['coordinates'])
-            elif isinstance(coord, (Real, Decimal)):
-                new_coords.append(round(coord, precision))
+        return _clean_coordinates(coords, precision)
+
+
+def _clean_coordinates(coords, precision):
+    # Plain floats, ints, lists and tuples make up nearly all coordinates,
+    # so they are recognised by exact type before any slower isinstance
+    # checks against the numeric ABCs.
+    new_coords = []
+    append = new_coords.append
+    for coord in coords:
+        tp = type(coord)
+        if tp is float or tp is int:
+            append(round(coord, precision))
+        elif tp is list or tp is tuple:
+            if len(coord) == 2 and type(coord[0]) is float \
+                    and type(coord[1]) is float:
+                # the common 2D position, without a recursive call
+                append([round(coord[0], precision),
+                        round(coord[1], precision)])
             else:
-                raise ValueError(f"{coord!r} is not a JSON compliant number")
-        return new_coords
+                append(_clean_coordinates(coord, precision))
+        elif isinstance(coord, (list, tuple)):
+            append(_clean_coordinates(coord, precision))
+        elif isinstance(coord, CoordinateArray):
+            append(_clean_coordinates(coord.tolist(), precision))
+        elif isinstance(coord, Geometry):
+            append(coord['coordinates'])
+        elif isinstance(coord, (Real, Decimal)):
+            append(round(coord, precision))
+        else:
+            raise ValueError(f"{coord!r} is not a JSON compliant number")
+    return new_coords
 
 
 class GeometryCollection(GeoJSON):
@@ -76,8 +114,9 @@ class GeometryCollection(GeoJSON):
 
 # Marker classes.
 
+
 def check_point(coord):
-    if not isinstance(coord, list):
+    if not isinstance(coord, _VALID_SEQUENCES):
         return 'each position must be a list'
     if len(coord) not in (2, 3):
         return 'a position must have exactly 2 or 3 values'
@@ -97,7 +136,7 @@ class MultiPoint(Geometry):
 
 
 def check_line_string(coord):
-    if not isinstance(coord, list):
+    if not isinstance(coord, _VALID_SEQUENCES):
         return 'each line must be a list of positions'
     if len(coord) < 2:
         return ('the "coordinates" member must be an array of '
@@ -119,19 +158,21 @@ class MultiLineString(Geometry):
 
 
 def check_polygon(coord):
-    if not isinstance(coord, list):
+    if not isinstance(coord, _VALID_SEQUENCES):
         return 'Each polygon must be a list of linear rings'
 
-    if not all(isinstance(elem, list) for elem in coord):
-        return "Each element of a polygon's coordinates must be a list"
-
-    lengths = all(len(elem) >= 4 for elem in coord)
-    if lengths is False:
-        return 'Each linear ring must contain at least 4 positions'
-
-    isring = all(elem[0] == elem[-1] for elem in coord)
-    if isring is False:
-        return 'Each linear ring must end where it started'
+    # a single pass over the rings, reporting the same error the separate
+    # checks would: any non-list element first, then any short ring, then
+    # any ring that is not closed
+    error = None
+    for elem in coord:
+        if not isinstance(elem, _VALID_SEQUENCES):
+            return "Each element of a polygon's coordinates must be a list"
+        if len(elem) < 4:
+            error = 'Each linear ring must contain at least 4 positions'
+        elif error is None and elem[0] != elem[-1]:
+            error = 'Each linear ring must end where it started'
+    return error
 
 
 class Polygon(Geometry):
@@ -0,0 +1,214 @@
+"""
+In-memory spatial index over the features of a collection.
+"""
+
+from heapq import heappop, heappush
+from math import ceil, sqrt
+
+from geojson.coordinates import _flatten_bbox
+from geojson.utils import bbox as compute_bbox
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class SpatialIndex:
+    """
+    A static R-tree over the bounding boxes of a list of features.
+
+    The tree is bulk-loaded with the Sort-Tile-Recursive algorithm: leaves
+    hold ``node_capacity`` features of neighbouring boxes, and each level
+    above groups ``node_capacity`` consecutive nodes of the level below.
+    Nodes are not objects but positions in one list of boxes per level,
+    node ``i`` of a level spanning nodes ``i * node_capacity`` up to
+    ``(i + 1) * node_capacity`` of the level below.
+
+    Features appended to the list after the index was built are picked up
+    by the next query, and merged into the tree once enough of them have
+    accumulated, reusing the boxes already computed. Any other change to
+    the features requires building a new index.
+    """
+
+    def __init__(self, features, node_capacity=16):
+        """
+        Builds the index.
+
+        :param features: The features to index, typically the "features"
+        member of a FeatureCollection, which the index keeps a reference
+        to.
+        :type features: list
+        :param node_capacity: Maximum number of children of a node.
+        :type node_capacity: int
+        :raises ValueError: If node_capacity is smaller than 2.
+        """
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.features = features
+        self.node_capacity = node_capacity
+        self._boxes = []
+        self._pending = []
+        self._extend()
+        self._pack()
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def _extend(self):
+        # computes the boxes of features added since the last call
+        for i in range(len(self._boxes), len(self.features)):
+            feature = self.features[i]
+            box = compute_bbox(feature) if feature else None
+            if box is not None:
+                box = _flatten_bbox(box)
+            self._boxes.append(box)
+            if box is not None:
+                self._pending.append(i)
+
+    def _pack(self):
+        boxes = self._boxes
+        indices = [i for i, box in enumerate(boxes) if box is not None]
+        capacity = self.node_capacity
+        items = _sort_tile(indices, boxes, capacity)
+        level = [boxes[i] for i in items]
+        levels = [level]
+        while len(level) > 1:
+            parents = []
+            for start in range(0, len(level), capacity):
+                west, south, east, north = zip(*level[start:start + capacity])
+                parents.append((min(west), min(south), max(east), max(north)))
+            levels.append(parents)
+            level = parents
+        self._items = items
+        self._levels = levels
+        self._pending = []
+
+    def _update(self):
+        if len(self.features) < len(self._boxes):
+            # features were removed, start over
+            self._boxes = []
+            self._extend()
+            self._pack()
+            return
+        self._extend()
+        if len(self._pending) > max(self.node_capacity ** 2,
+                                    len(self._items) // 8):
+            self._pack()
+
+    def query(self, bbox):
+        """
+        Returns the features whose bounding box intersects the given one.
+
+        :param bbox: ``[west, south, east, north]``; the elevation range of
+        a 3D box is ignored.
+        :type bbox: list
+        :return: The matching features, in collection order.
+        :rtype: list
+        """
+        self._update()
+        west, south, east, north = _flatten_bbox(bbox)
+        levels = self._levels
+        items = self._items
+        capacity = self.node_capacity
+        found = [i for i in self._pending
+                 if _intersects(self._boxes[i], west, south, east, north)]
+        top = len(levels) - 1
+        stack = [(top, 0, len(levels[top]))]
+        while stack:
+            level, start, stop = stack.pop()
+            boxes = levels[level]
+            for i in range(start, stop):
+                box = boxes[i]
+                if box[0] > east or box[2] < west or \
+                        box[1] > north or box[3] < south:
+                    continue
+                if level:
+                    stack.append((level - 1, i * capacity,
+                                  min((i + 1) * capacity,
+                                      len(levels[level - 1]))))
+                else:
+                    found.append(items[i])
+        found.sort()
+        return [self.features[i] for i in found]
+
+    def nearest(self, point, k=1):
+        """
+        Returns the k features closest to a point.
+
+        Distances are measured to the bounding box of each feature, which
+        is exact for points and a lower bound for other geometries.
+
+        :param point: A position, or a Point.
+        :type point: list, tuple, Point
+        :param k: Number of features to return.
+        :type k: int
+        :return: The features, closest first.
+        :rtype: list
+        """
+        self._update()
+        if isinstance(point, dict):
+            point = point["coordinates"]
+        x, y = point[0], point[1]
+        levels = self._levels
+        capacity = self.node_capacity
+        # entries are (distance, level, node); level -1 marks a pending
+        # feature, given by its index
+        heap = [(_distance(self._boxes[i], x, y), -1, i)
+                for i in self._pending]
+        heap.sort()
+        top = len(levels) - 1
+        for i, box in enumerate(levels[top]):
+            heappush(heap, (_distance(box, x, y), top, i))
+        result = []
+        while heap and len(result) < k:
+            _, level, i = heappop(heap)
+            if level < 0:
+                result.append(self.features[i])
+            elif level == 0:
+                result.append(self.features[self._items[i]])
+            else:
+                below = levels[level - 1]
+                for j in range(i * capacity,
+                               min((i + 1) * capacity, len(below))):
+                    heappush(heap,
+                             (_distance(below[j], x, y), level - 1, j))
+        return result
+
+
+def _intersects(box, west, south, east, north):
+    return not (box[0] > east or box[2] < west or
+                box[1] > north or box[3] < south)
+
+
+def _distance(box, x, y):
+    dx = max(box[0] - x, 0, x - box[2])
+    dy = max(box[1] - y, 0, y - box[3])
+    return dx * dx + dy * dy
+
+
+def _sort_tile(indices, boxes, capacity):
+    # Orders the indices so that each run of capacity items is a leaf:
+    # sorted by x into vertical slices of about sqrt(leaves) leaves each,
+    # then by y within every slice.
+    count = len(indices)
+    if count <= capacity:
+        return indices
+    slices = ceil(sqrt(ceil(count / capacity)))
+    per_slice = slices * capacity
+    if numpy is not None:
+        centers = numpy.array([boxes[i] for i in indices])
+        cx = centers[:, 0] + centers[:, 2]
+        cy = centers[:, 1] + centers[:, 3]
+        order = numpy.argsort(cx, kind="stable")
+        for start in range(0, count, per_slice):
+            chunk = order[start:start + per_slice]
+            order[start:start + per_slice] = chunk[
+                numpy.argsort(cy[chunk], kind="stable")]
+        return [indices[i] for i in order.tolist()]
+    order = sorted(indices, key=lambda i: boxes[i][0] + boxes[i][2])
+    result = []
+    for start in range(0, count, per_slice):
+        result.extend(sorted(order[start:start + per_slice],
+                             key=lambda i: boxes[i][1] + boxes[i][3]))
+    return result
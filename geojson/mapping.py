@@ -1,15 +1,13 @@
 from collections.abc import MutableMapping
-
-try:
-    import simplejson as json
-except ImportError:
-    import json
+from decimal import Decimal
 
 import geojson
 
 
 GEO_INTERFACE_MARKER = "__geo_interface__"
 
+_INFINITY = float("inf")
+
 
 def is_mapping(obj):
     """
@@ -36,4 +34,67 @@ def to_mapping(obj):
     if isinstance(obj, geojson.GeoJSON):
         return dict(obj)
 
-    return json.loads(json.dumps(obj))
+    return normalize(obj)
+
+
+def normalize(obj):
+    """
+    Converts a value to the plain structure JSON would decode it to.
+
+    This gives the same result as ``json.loads(json.dumps(obj))`` without
+    going through an intermediate string: tuples become lists, dict keys
+    become strings and str, int and float subclasses become their base
+    types. As with simplejson, namedtuples (and other objects with an
+    ``_asdict`` method) become dicts and Decimals become floats.
+
+    :param obj: Object to be normalized.
+    :return: The normalized object.
+    :raises TypeError: If the object (or a value it contains) is not JSON
+    serializable.
+    """
+    tp = type(obj)
+    if tp is list or tp is tuple:
+        return [normalize(item) for item in obj]
+    if tp is float or tp is int or tp is str or obj is None \
+            or obj is True or obj is False:
+        return obj
+    if isinstance(obj, dict):
+        return {_normalize_key(key): normalize(value)
+                for key, value in obj.items()}
+    as_dict = getattr(obj, "_asdict", None)
+    if as_dict is not None:
+        return normalize(as_dict())
+    if isinstance(obj, (list, tuple)):
+        return [normalize(item) for item in obj]
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    raise TypeError(
+        f"Object of type {tp.__name__} is not JSON serializable")
+
+
+def _normalize_key(key):
+    # Mirrors how json.dumps converts dict keys to strings.
+    if isinstance(key, str):
+        return str(key)
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key in (_INFINITY, -_INFINITY):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, "
+                    f"not {key.__class__.__name__}")
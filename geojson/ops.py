@@ -0,0 +1,297 @@
+"""
+Spatial predicates over GeoJSON objects.
+
+Point-in-polygon tests use ray casting: a point is inside a polygon when
+a ray cast from it crosses the rings of the polygon an odd number of
+times, which accounts for holes. A line or ring is within a polygon when
+all of its positions are inside and none of its segments goes outside
+where it meets the polygon's rings. Points on the boundary, and segments
+running along it, may fall on either side. Rings and polygons whose bounding box does not contain a
+point are skipped without looking at their edges, and batches of points
+are tested edge by edge over whole NumPy arrays when NumPy is installed.
+"""
+
+from geojson.coordinates import (
+    CoordinateArray, _flatten_bbox, coordinates_bbox)
+from geojson.mapping import is_mapping, to_mapping
+from geojson.utils import bbox as compute_bbox, coords
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+# Batches smaller than this are tested one point at a time
+_VECTORIZE_MIN_POINTS = 32
+
+
+def contains(polygon, points):
+    """
+    Tests which points lie inside a polygon.
+
+    :param polygon: A Polygon or MultiPolygon, or a Feature of one.
+    :type polygon: Polygon, MultiPolygon, Feature, dict
+    :param points: The positions to test. The elevation of 3D positions
+    is ignored.
+    :type points: iterable of positions, numpy.ndarray
+    :return: Whether each point is inside, as a NumPy array if points is
+    one and as a list otherwise.
+    :rtype: list of bool
+    :raises ValueError: If polygon is not a Polygon or MultiPolygon.
+    """
+    return _contains(_prepare(polygon), points)
+
+
+def _contains(parts, points):
+    if numpy is not None and isinstance(points, numpy.ndarray):
+        return _contains_array(parts, points[:, 0], points[:, 1])
+    if not isinstance(points, (list, tuple)):
+        points = list(points)
+    if numpy is not None and len(points) >= _VECTORIZE_MIN_POINTS:
+        xs = numpy.fromiter((point[0] for point in points), float,
+                            count=len(points))
+        ys = numpy.fromiter((point[1] for point in points), float,
+                            count=len(points))
+        return _contains_array(parts, xs, ys).tolist()
+    return [_contains_point(parts, point[0], point[1]) for point in points]
+
+
+def intersects_bbox(obj, bbox):
+    """
+    Tests whether the bounding box of an object intersects a given one.
+
+    :param obj: A geometry, feature or collection.
+    :type obj: GeoJSON, dict
+    :param bbox: ``[west, south, east, north]``; the elevation range of a
+    3D box is ignored.
+    :type bbox: list
+    :return: False if the boxes are disjoint or obj has no positions.
+    :rtype: bool
+    """
+    box = compute_bbox(obj)
+    if box is None:
+        return False
+    west, south, east, north = _flatten_bbox(bbox)
+    box = _flatten_bbox(box)
+    return not (box[0] > east or box[2] < west or
+                box[1] > north or box[3] < south)
+
+
+def filter_features(obj, bbox=None, within=None):
+    """
+    Selects the features matching all of the given conditions.
+
+    :param obj: A FeatureCollection, or an iterable of features.
+    :type obj: FeatureCollection, dict, iterable
+    :param bbox: Keep features whose bounding box intersects this one.
+    :type bbox: list
+    :param within: Keep features whose geometry lies inside this Polygon
+    or MultiPolygon: its positions, and its segments between them.
+    :type within: Polygon, MultiPolygon, Feature, dict
+    :return: A copy of the collection with the matching features, or a
+    list of them.
+    :rtype: dict, list
+    """
+    collection = None
+    if is_mapping(obj) or hasattr(obj, "__geo_interface__"):
+        collection = to_mapping(obj)
+        features = collection["features"]
+    else:
+        features = list(obj)
+    geometries = [to_mapping(f).get("geometry") for f in features]
+    keep = [geometry is not None for geometry in geometries]
+    if bbox is not None:
+        keep = [k and intersects_bbox(geometry, bbox)
+                for k, geometry in zip(keep, geometries)]
+    if within is not None:
+        keep = _within(geometries, keep, _prepare(within))
+    matched = [f for k, f in zip(keep, features) if k]
+    if collection is None:
+        return matched
+    return {**collection, "features": matched}
+
+
+def _within(geometries, keep, parts):
+    # All Points are tested in one batch, other geometries one at a time
+    # after comparing their bounding box with the polygon's.
+    west, south, east, north = _parts_bbox(parts)
+    keep = list(keep)
+    indices = []
+    points = []
+    for i, geometry in enumerate(geometries):
+        if not keep[i]:
+            continue
+        geometry = to_mapping(geometry)
+        if geometry.get("type") == "Point":
+            indices.append(i)
+            points.append(geometry["coordinates"])
+            continue
+        box = compute_bbox(geometry)
+        if box is None:
+            keep[i] = False
+            continue
+        box = _flatten_bbox(box)
+        if box[0] < west or box[2] > east or \
+                box[1] < south or box[3] > north:
+            keep[i] = False
+            continue
+        keep[i] = all(_contains(parts, list(coords(geometry)))) and \
+            not _leaves(parts, geometry)
+    for i, inside in zip(indices, _contains(parts, points)):
+        keep[i] = inside
+    return keep
+
+
+def _prepare(polygon):
+    # Returns the polygons of polygon as (bbox, rings) pairs, each ring as
+    # (bbox, xs, ys).
+    mapping = to_mapping(polygon)
+    if mapping.get("type") == "Feature":
+        mapping = to_mapping(mapping.get("geometry") or {})
+    type_ = mapping.get("type")
+    coordinates = mapping.get("coordinates")
+    if isinstance(coordinates, CoordinateArray):
+        coordinates = coordinates.tolist()
+    if type_ == "Polygon":
+        polygons = [coordinates]
+    elif type_ == "MultiPolygon":
+        polygons = coordinates
+    else:
+        raise ValueError(f"Expected a Polygon or MultiPolygon, not {type_!r}")
+    parts = []
+    for rings in polygons:
+        prepared = []
+        for ring in rings:
+            if len(ring) < 3:
+                continue
+            box = coordinates_bbox(ring)
+            prepared.append((_flatten_bbox(box), [p[0] for p in ring],
+                             [p[1] for p in ring]))
+        if prepared:
+            parts.append((prepared[0][0], prepared))
+    return parts
+
+
+def _parts_bbox(parts):
+    if not parts:
+        return (0, 0, -1, -1)
+    boxes = [box for box, _ in parts]
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+def _lines(geometry):
+    # Yields the lists of positions joined by segments: lines and rings
+    geometry = to_mapping(geometry)
+    type_ = geometry.get("type")
+    if type_ == "GeometryCollection":
+        for member in geometry.get("geometries") or ():
+            yield from _lines(member)
+        return
+    coordinates = geometry.get("coordinates")
+    if isinstance(coordinates, CoordinateArray):
+        coordinates = coordinates.tolist()
+    if type_ == "LineString":
+        yield coordinates
+    elif type_ in ("MultiLineString", "Polygon"):
+        yield from coordinates
+    elif type_ == "MultiPolygon":
+        for rings in coordinates:
+            yield from rings
+
+
+def _leaves(parts, geometry):
+    # Whether a segment of geometry goes outside of parts between its
+    # ends: each segment is cut where it meets the edges of the rings,
+    # and the middle of each piece is tested.
+    for line in _lines(geometry):
+        for start, end in zip(line, line[1:]):
+            x0, y0, x1, y1 = start[0], start[1], end[0], end[1]
+            cuts = set()
+            for box, rings in parts:
+                if max(x0, x1) < box[0] or min(x0, x1) > box[2] or \
+                        max(y0, y1) < box[1] or min(y0, y1) > box[3]:
+                    continue
+                for (west, south, east, north), xs, ys in rings:
+                    if max(x0, x1) < west or min(x0, x1) > east or \
+                            max(y0, y1) < south or min(y0, y1) > north:
+                        continue
+                    cuts.update(_ring_cuts(x0, y0, x1, y1, xs, ys))
+            cuts.discard(0.0)
+            cuts.discard(1.0)
+            if not cuts:
+                continue
+            bounds = [0.0, *sorted(cuts), 1.0]
+            for t0, t1 in zip(bounds, bounds[1:]):
+                t = (t0 + t1) / 2
+                if not _contains_point(parts, x0 + t * (x1 - x0),
+                                       y0 + t * (y1 - y0)):
+                    return True
+    return False
+
+
+def _ring_cuts(x0, y0, x1, y1, xs, ys):
+    # Yields where the segment meets the edges of the ring, as fractions
+    # of its length. Edges running along it are left out.
+    dx, dy = x1 - x0, y1 - y0
+    px, py = xs[-1], ys[-1]
+    for qx, qy in zip(xs, ys):
+        ex, ey = qx - px, qy - py
+        denominator = dx * ey - dy * ex
+        if denominator:
+            wx, wy = px - x0, py - y0
+            t = (wx * ey - wy * ex) / denominator
+            u = (wx * dy - wy * dx) / denominator
+            if 0 <= t <= 1 and 0 <= u <= 1:
+                yield t
+        px, py = qx, qy
+
+
+def _contains_point(parts, x, y):
+    for box, rings in parts:
+        if x < box[0] or x > box[2] or y < box[1] or y > box[3]:
+            continue
+        inside = False
+        for (west, south, east, north), xs, ys in rings:
+            if x < west or x > east or y < south or y > north:
+                continue
+            x0, y0 = xs[-1], ys[-1]
+            for x1, y1 in zip(xs, ys):
+                if (y1 > y) != (y0 > y) and \
+                        x < (x0 - x1) * (y - y1) / (y0 - y1) + x1:
+                    inside = not inside
+                x0, y0 = x1, y1
+        if inside:
+            return True
+    return False
+
+
+def _contains_array(parts, xs, ys):
+    result = numpy.zeros(len(xs), dtype=bool)
+    for box, rings in parts:
+        candidates = numpy.flatnonzero(
+            (xs >= box[0]) & (xs <= box[2]) & (ys >= box[1]) & (ys <= box[3])
+            & ~result)
+        if not len(candidates):
+            continue
+        px = xs[candidates]
+        py = ys[candidates]
+        inside = numpy.zeros(len(candidates), dtype=bool)
+        for (west, south, east, north), ring_xs, ring_ys in rings:
+            in_box = numpy.flatnonzero(
+                (px >= west) & (px <= east) & (py >= south) & (py <= north))
+            if not len(in_box):
+                continue
+            rx = px[in_box]
+            ry = py[in_box]
+            crossings = numpy.zeros(len(in_box), dtype=bool)
+            x0, y0 = ring_xs[-1], ring_ys[-1]
+            for x1, y1 in zip(ring_xs, ring_ys):
+                if y0 != y1:
+                    crossings ^= ((y1 > ry) != (y0 > ry)) & (
+                        rx < (x0 - x1) * (ry - y1) / (y0 - y1) + x1)
+                x0, y0 = x1, y1
+            inside[in_box] ^= crossings
+        result[candidates] = inside
+    return result
@@ -1,5 +1,22 @@
 """Coordinate utility functions."""
 
+from array import array
+import heapq
+from itertools import chain, islice
+import math
+import random
+
+from geojson.base import GeoJSON
+from geojson.coordinates import (
+    _POSITION_DEPTHS, _SEQUENCES, CoordinateArray, coordinates_bbox,
+    merge_bboxes)
+from geojson.mapping import to_mapping
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 def coords(obj):
     """
@@ -10,29 +27,89 @@ def coords(obj):
     :return: A generator with coordinate tuples from the geometry or feature.
     :rtype: generator
     """
-    # Handle recursive case first
-    if 'features' in obj:  # FeatureCollection
-        for f in obj['features']:
-            yield from coords(f)
-    elif 'geometry' in obj:  # Feature
-        yield from coords(obj['geometry'])
-    elif 'geometries' in obj:  # GeometryCollection
-        for g in obj['geometries']:
-            yield from coords(g)
-    else:
-        if isinstance(obj, (tuple, list)):
-            coordinates = obj
+    for positions in _iter_positions(obj):
+        if isinstance(positions, list):
+            yield from map(tuple, positions)
         else:
-            coordinates = obj.get('coordinates', obj)
-        for e in coordinates:
-            if isinstance(e, (float, int)):
-                yield tuple(coordinates)
-                break
-            for f in coords(e):
-                yield f
+            yield from positions.positions()
 
 
-def map_coords(func, obj):
+def coords_array(obj):
+    """
+    Copies the coordinates from a Feature or Geometry into one flat array.
+
+    The array supports the buffer protocol, so ``numpy.frombuffer(values)``
+    wraps it without copying, and ``.reshape(-1, dims)`` gives one row per
+    position.
+
+    :param obj: A geometry, feature or collection to extract the
+    coordinates from.
+    :type obj: GeoJSON, dict
+    :return: The values of all positions one after another, and the number
+    of values per position.
+    :rtype: tuple of (array, int)
+    :raises ValueError: If positions have differing numbers of values.
+    """
+    values = array('d')
+    dims = None
+    for positions in _iter_positions(obj):
+        if isinstance(positions, list):
+            lengths = set(map(len, positions))
+            flat = list(chain.from_iterable(positions))
+        else:
+            start, stop = positions._position_range()
+            if positions._level > len(positions.offsets):
+                start, stop = 0, 1
+            lengths = {positions.dims}
+            flat = positions.values[start * positions.dims:
+                                    stop * positions.dims]
+            if not isinstance(flat, array):
+                flat = flat.tolist()
+        if dims is None and len(lengths) == 1:
+            dims = next(iter(lengths))
+        if lengths != {dims}:
+            raise ValueError(
+                "positions must all have the same number of values")
+        if isinstance(flat, list):
+            values.fromlist(flat)
+        else:
+            values.extend(flat)
+    return values, dims or 2
+
+
+def _iter_positions(obj):
+    # Yields lists of positions (a single position is wrapped in a list)
+    # and packed CoordinateArrays, in document order, walking nested
+    # objects and coordinates with a stack rather than recursion.
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if obj is None:
+            continue
+        if not isinstance(obj, _SEQUENCES):
+            if 'features' in obj:  # FeatureCollection
+                stack.extend(reversed(obj['features']))
+                continue
+            if 'geometry' in obj:  # Feature
+                stack.append(obj['geometry'])
+                continue
+            if 'geometries' in obj:  # GeometryCollection
+                stack.extend(reversed(obj['geometries']))
+                continue
+            obj = obj.get('coordinates', obj)
+        if type(obj) is not list and isinstance(obj, CoordinateArray):
+            yield obj
+        elif obj:
+            first = obj[0]
+            if not isinstance(first, _SEQUENCES):
+                yield [obj]
+            elif first and not isinstance(first[0], _SEQUENCES):
+                yield obj if type(obj) is list else list(obj)
+            else:
+                stack.extend(reversed(obj))
+
+
+def map_coords(func, obj, vectorized=False, inplace=False):
     """
     Returns the mapped coordinates from a Geometry after applying the provided
     function to each dimension in tuples list (ie, linear scaling).
@@ -43,63 +120,156 @@ def map_coords(func, obj):
     :param obj: A geometry or feature to extract the coordinates from.
     :type obj: Point, LineString, MultiPoint, MultiLineString, Polygon,
     MultiPolygon
+    :param vectorized: Call func once per dimension with the values of all
+    positions, see map_tuples.
+    :type vectorized: bool
+    :param inplace: Rewrite the coordinates of obj, see map_tuples.
+    :type inplace: bool
     :return: The result of applying the function to each dimension in the
     array.
     :rtype: list
     :raises ValueError: if the provided object is not GeoJSON.
     """
 
+    if vectorized:
+        return map_tuples(lambda x, y, *rest: (func(x), func(y)), obj,
+                          vectorized=True, inplace=inplace)
+
     def tuple_func(coord):
         return (func(coord[0]), func(coord[1]))
 
-    return map_tuples(tuple_func, obj)
+    return map_tuples(tuple_func, obj, inplace=inplace)
 
 
-def map_tuples(func, obj):
+def map_tuples(func, obj, vectorized=False, inplace=False):
     """
     Returns the mapped coordinates from a Geometry after applying the provided
     function to each coordinate.
 
+    By default obj is left unchanged: the result is made of new dicts,
+    keeping all other members (``id``, ``properties``, ``bbox``, foreign
+    members ...) of the original objects, which it shares with them. With
+    ``inplace=True`` the coordinate lists of obj are rewritten where they
+    are and obj itself is returned, so that transforming a large
+    collection does not need memory for a second copy of it.
+
+    In vectorized mode func is called only once, with one array per
+    dimension holding that value of every position of obj (``func(x, y)``
+    or ``func(x, y, z)``), and returns the transformed arrays in the same
+    way, e.g. ``pyproj.Transformer.transform``. The arrays are NumPy
+    arrays when NumPy is installed and ``array('d')`` otherwise.
+
     :param func: Function to apply to tuples
     :type func: function
     :param obj: A geometry or feature to extract the coordinates from.
     :type obj: Point, LineString, MultiPoint, MultiLineString, Polygon,
     MultiPolygon
+    :param vectorized: Apply func to arrays of values rather than to each
+    position.
+    :type vectorized: bool
+    :param inplace: Rewrite the coordinates of obj instead of copying it.
+    :type inplace: bool
     :return: The result of applying the function to each dimension in the
     array.
     :rtype: list
-    :raises ValueError: if the provided object is not GeoJSON.
+    :raises ValueError: if the provided object is not GeoJSON, or in
+    vectorized mode if positions have differing numbers of values or func
+    returns arrays of the wrong length.
     """
 
-    if obj['type'] == 'Point':
-        coordinates = tuple(func(obj['coordinates']))
-    elif obj['type'] in ['LineString', 'MultiPoint']:
-        coordinates = [tuple(func(c)) for c in obj['coordinates']]
-    elif obj['type'] in ['MultiLineString', 'Polygon']:
-        coordinates = [[
-            tuple(func(c)) for c in curve]
-            for curve in obj['coordinates']]
-    elif obj['type'] == 'MultiPolygon':
-        coordinates = [[[
-            tuple(func(c)) for c in curve]
-            for curve in part]
-            for part in obj['coordinates']]
-    elif obj['type'] in ['Feature', 'FeatureCollection', 'GeometryCollection']:
-        return map_geometries(lambda g: map_tuples(func, g), obj)
+    if vectorized:
+        if obj['type'] not in _POSITION_DEPTHS and \
+                obj['type'] not in _COLLECTION_TYPES:
+            raise ValueError(f"Invalid geometry object {obj!r}")
+        positions = _map_columns(func, obj)
+
+        def take(coordinates):
+            return list(islice(positions, len(coordinates)))
+    else:
+        def take(coordinates):
+            return [tuple(func(c)) for c in coordinates]
+
+    return _map_geometry_positions(obj, take, inplace)
+
+
+def _map_columns(func, obj):
+    # Applies func to the columns of all the positions of obj and returns
+    # an iterator over the resulting position tuples.
+    values, dims = coords_array(obj)
+    if numpy is not None:
+        table = numpy.frombuffer(values).reshape(-1, dims)
+        columns = [table[:, i] for i in range(dims)]
     else:
+        columns = [values[i::dims] for i in range(dims)]
+    count = len(values) // dims
+    results = [result.tolist() if hasattr(result, 'tolist') else result
+               for result in func(*columns)]
+    if any(len(result) != count for result in results):
+        raise ValueError(f"func must return arrays of {count} values")
+    return zip(*results)
+
+
+_COLLECTION_TYPES = ('Feature', 'FeatureCollection', 'GeometryCollection')
+
+
+def _map_geometry_positions(obj, take, inplace):
+    # Replaces the positions of obj in document order, take mapping a list
+    # of positions to the list of their replacements.
+    if obj['type'] in _COLLECTION_TYPES:
+        return map_geometries(
+            lambda g: _map_geometry_positions(g, take, inplace), obj,
+            inplace=inplace)
+    depth = _POSITION_DEPTHS.get(obj['type'])
+    coordinates = obj.get('coordinates')
+    if isinstance(coordinates, CoordinateArray):
+        mapped = coordinates.map_positions(lambda c: take([c])[0])
+        if inplace and coordinates._is_root() and \
+                mapped.dims == coordinates.dims:
+            coordinates.values[:] = mapped.values
+            mapped = coordinates
+    elif depth is None:
         raise ValueError(f"Invalid geometry object {obj!r}")
-    return {'type': obj['type'], 'coordinates': coordinates}
+    else:
+        mapped = _map_nested(coordinates, depth, take, inplace)
+    if not inplace:
+        return {**obj, 'coordinates': mapped}
+    obj['coordinates'] = mapped
+    if isinstance(obj, GeoJSON):
+        obj._clear_cache()
+    return obj
+
+
+def _map_nested(coordinates, depth, take, inplace):
+    if depth == 0:
+        if not coordinates:
+            return coordinates
+        mapped = take([coordinates])[0]
+    elif depth == 1:
+        mapped = take(coordinates)
+    else:
+        mapped = [_map_nested(part, depth - 1, take, inplace)
+                  for part in coordinates]
+    if inplace and type(coordinates) is list:
+        coordinates[:] = mapped
+        return coordinates
+    return mapped
 
 
-def map_geometries(func, obj):
+def map_geometries(func, obj, inplace=False):
     """
     Returns the result of passing every geometry in the given geojson object
     through func.
 
+    By default the features and collections of obj are copied into new
+    dicts keeping all of their members; with ``inplace=True`` the results
+    of func replace the geometries of obj, which is returned.
+
     :param func: Function to apply to tuples
     :type func: function
     :param obj: A geometry or feature to extract the coordinates from.
     :type obj: GeoJSON
+    :param inplace: Update obj instead of copying it.
+    :type inplace: bool
     :return: The result of applying the function to each geometry
     :rtype: list
     :raises ValueError: if the provided object is not geojson.
@@ -117,19 +287,282 @@ def map_geometries(func, obj):
         return func(obj)
     elif obj['type'] == 'GeometryCollection':
         geoms = [func(geom) if geom else None for geom in obj['geometries']]
-        return {'type': obj['type'], 'geometries': geoms}
+        if inplace:
+            obj['geometries'][:] = geoms
+            return obj
+        return {**obj, 'geometries': geoms}
     elif obj['type'] == 'Feature':
-        obj['geometry'] = func(obj['geometry']) if obj['geometry'] else None
-        return obj
+        geom = func(obj['geometry']) if obj['geometry'] else None
+        if inplace:
+            obj['geometry'] = geom
+            return obj
+        return {**obj, 'geometry': geom}
     elif obj['type'] == 'FeatureCollection':
-        feats = [map_geometries(func, feat) for feat in obj['features']]
-        return {'type': obj['type'], 'features': feats}
+        feats = [map_geometries(func, feat, inplace)
+                 for feat in obj['features']]
+        if inplace:
+            return obj
+        return {**obj, 'features': feats}
     else:
         raise ValueError(f"Invalid GeoJSON object {obj!r}")
 
 
+def bbox(obj):
+    """
+    Computes the bounding box of a GeoJSON object.
+
+    Collections and features enclose the boxes of their geometries. The
+    box of a geometry instance is cached on it until one of its members
+    is set or deleted; changes made inside the coordinate lists are not
+    noticed, except by the in-place functions of this module.
+
+    :param obj: A geometry, feature or collection.
+    :type obj: GeoJSON, dict
+    :return: ``[west, south, east, north]``, or with elevations when every
+    position has one, ``[west, south, low, east, north, high]``; None if
+    the object has no positions.
+    :rtype: list
+    """
+    return _bbox(obj, True)
+
+
+def _bbox(obj, cache):
+    # bbox, reading and filling the caches of geometry instances or not
+    if not isinstance(obj, dict):
+        obj = to_mapping(obj)
+    if 'coordinates' in obj:
+        if cache and isinstance(obj, GeoJSON):
+            cached = obj._cached('bbox', 'coordinates', coordinates_bbox)
+            return None if cached is None else list(cached)
+        return coordinates_bbox(obj['coordinates'])
+    if 'geometries' in obj:
+        return merge_bboxes(_bbox(geom, cache)
+                            for geom in obj['geometries'] if geom)
+    if 'features' in obj:
+        return merge_bboxes(_bbox(feat, cache) for feat in obj['features'])
+    geometry = obj.get('geometry')
+    return _bbox(geometry, cache) if geometry else None
+
+
+def simplify(obj, tolerance=0.0, max_vertices=None,
+             method='douglas-peucker', inplace=False):
+    """
+    Reduces the number of positions of the lines and rings of a GeoJSON
+    object.
+
+    Each line and ring is simplified on its own, on the first two values
+    of its positions, keeping the positions it retains unchanged.
+    ``'douglas-peucker'`` drops positions closer than tolerance to the
+    line through their neighbours; ``'visvalingam'`` drops positions
+    whose triangle with their neighbours has an area below tolerance. If
+    more than max_vertices positions remain, only the most significant
+    ones are kept. Lines keep their end positions and at least two
+    positions, rings stay closed with at least four, so valid geometries
+    remain valid; the simplified rings may however cross each other.
+    Points and MultiPoints are left as they are.
+
+    Like map_tuples, obj is copied unless ``inplace=True``.
+
+    :param obj: A geometry, feature or collection.
+    :type obj: GeoJSON, dict
+    :param tolerance: The largest distance, or area, of a dropped position.
+    :type tolerance: float
+    :param max_vertices: The largest number of positions kept per line or
+    ring.
+    :type max_vertices: int
+    :param method: ``'douglas-peucker'`` or ``'visvalingam'``.
+    :type method: str
+    :param inplace: Rewrite the coordinates of obj instead of copying it.
+    :type inplace: bool
+    :return: The simplified object.
+    :rtype: dict
+    :raises ValueError: If the method is not known, or if obj is not
+    GeoJSON.
+    """
+    try:
+        select = _SIMPLIFY_METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown simplification method {method!r}")
+    if not isinstance(obj, dict):
+        obj = to_mapping(obj)
+
+    def simplify_positions(positions, minimum):
+        count = len(positions)
+        limit = count if max_vertices is None else max(max_vertices, minimum)
+        if count <= minimum:
+            return list(positions)
+        xs = [position[0] for position in positions]
+        ys = [position[1] for position in positions]
+        kept = select(xs, ys, tolerance, minimum - 2, limit - 2)
+        return [positions[0]] + [positions[i] for i in sorted(kept)] + \
+            [positions[-1]]
+
+    def simplify_geometry(geometry):
+        if geometry['type'] in _COLLECTION_TYPES:
+            return map_geometries(simplify_geometry, geometry,
+                                  inplace=inplace)
+        minimum = _SIMPLIFY_MINIMUM.get(geometry['type'])
+        if minimum is None:
+            if geometry['type'] not in _POSITION_DEPTHS:
+                raise ValueError(f"Invalid geometry object {geometry!r}")
+            return geometry if inplace else {**geometry}
+        coordinates = geometry['coordinates']
+        depth = _POSITION_DEPTHS[geometry['type']]
+        packed = isinstance(coordinates, CoordinateArray)
+        if packed:
+            coordinates = coordinates.tolist()
+        simplified = _map_nested(
+            coordinates, depth,
+            lambda positions: simplify_positions(positions, minimum),
+            inplace and not packed)
+        if packed:
+            simplified = CoordinateArray.from_nested(simplified, depth)
+        if not inplace:
+            return {**geometry, 'coordinates': simplified}
+        geometry['coordinates'] = simplified
+        if isinstance(geometry, GeoJSON):
+            geometry._clear_cache()
+        return geometry
+
+    return map_geometries(simplify_geometry, obj, inplace=inplace)
+
+
+def _douglas_peucker(xs, ys, tolerance, minimum, limit):
+    # Returns the indices of the interior positions to keep. Parts of the
+    # line are split at their position farthest from the segment joining
+    # their ends, farthest first, until the next one is within tolerance
+    # or limit positions are kept. The distance of a position is capped
+    # at that of the position splitting its part, so that the result is
+    # the one of the recursive algorithm.
+    vectorized = numpy is not None and len(xs) >= _VECTORIZE_MIN
+    if vectorized:
+        x_array, y_array = numpy.array(xs), numpy.array(ys)
+
+    def farthest(first, last, cap):
+        if vectorized and last - first >= _VECTORIZE_MIN:
+            index, distance = _farthest_array(x_array, y_array, first, last)
+        else:
+            index, distance = _farthest(xs, ys, first, last)
+        return (-min(distance, cap), first, last, index)
+
+    kept = []
+    heap = [farthest(0, len(xs) - 1, math.inf)]
+    while heap and len(kept) < limit:
+        distance, first, last, index = heapq.heappop(heap)
+        distance = -distance
+        if distance <= tolerance and len(kept) >= minimum:
+            break
+        kept.append(index)
+        for part in ((first, index), (index, last)):
+            if part[1] - part[0] >= 2:
+                heapq.heappush(heap, farthest(*part, distance))
+    return kept
+
+
+def _farthest(xs, ys, first, last):
+    ax, ay = xs[first], ys[first]
+    dx, dy = xs[last] - ax, ys[last] - ay
+    length = math.hypot(dx, dy)
+    best, index = -1.0, first + 1
+    if length == 0:
+        # a closed ring: the distance to its first position
+        for i in range(first + 1, last):
+            distance = math.hypot(xs[i] - ax, ys[i] - ay)
+            if distance > best:
+                best, index = distance, i
+        return index, best
+    for i in range(first + 1, last):
+        distance = abs(dx * (ys[i] - ay) - dy * (xs[i] - ax))
+        if distance > best:
+            best, index = distance, i
+    return index, best / length
+
+
+def _farthest_array(xs, ys, first, last):
+    ax, ay = xs[first], ys[first]
+    dx, dy = xs[last] - ax, ys[last] - ay
+    length = math.hypot(dx, dy)
+    px, py = xs[first + 1:last] - ax, ys[first + 1:last] - ay
+    if length == 0:
+        distances = numpy.hypot(px, py)
+        length = 1.0
+    else:
+        distances = numpy.abs(dx * py - dy * px)
+    i = int(distances.argmax())
+    return first + 1 + i, float(distances[i]) / length
+
+
+def _visvalingam(xs, ys, tolerance, minimum, limit):
+    # Returns the indices of the interior positions to keep, dropping the
+    # position making the smallest triangle with its remaining neighbours
+    # while that area is within tolerance or more than limit positions
+    # remain. The area of a position is raised to that of the position
+    # dropped before it, as dropping it may have shrunk the triangle.
+    count = len(xs)
+    if numpy is not None and count >= _VECTORIZE_MIN:
+        x, y = numpy.array(xs), numpy.array(ys)
+        areas = (numpy.abs((x[:-2] - x[2:]) * (y[1:-1] - y[:-2]) -
+                           (x[:-2] - x[1:-1]) * (y[2:] - y[:-2]))
+                 / 2).tolist()
+    else:
+        areas = [_triangle_area(xs, ys, i - 1, i, i + 1)
+                 for i in range(1, count - 1)]
+    areas = [None] + areas + [None]
+    previous = list(range(-1, count - 1))
+    following = list(range(1, count + 1))
+    heap = [(area, i) for i, area in enumerate(areas[1:-1], 1)]
+    heapq.heapify(heap)
+    heappop, heappush = heapq.heappop, heapq.heappush
+    remaining = count - 2
+    floor = 0.0
+    while heap and remaining > minimum:
+        area, i = heappop(heap)
+        if area != areas[i]:
+            # superseded by a later entry
+            continue
+        if area > floor:
+            floor = area
+        if floor > tolerance and remaining <= limit:
+            break
+        areas[i] = None
+        remaining -= 1
+        before, after = previous[i], following[i]
+        following[before], previous[after] = after, before
+        if before:
+            area = _triangle_area(xs, ys, previous[before], before, after)
+            areas[before] = area
+            heappush(heap, (area, before))
+        if after < count - 1:
+            area = _triangle_area(xs, ys, before, after, following[after])
+            areas[after] = area
+            heappush(heap, (area, after))
+    return [i for i in range(1, count - 1) if areas[i] is not None]
+
+
+def _triangle_area(xs, ys, a, b, c):
+    return abs((xs[a] - xs[c]) * (ys[b] - ys[a]) -
+               (xs[a] - xs[b]) * (ys[c] - ys[a])) / 2
+
+
+_SIMPLIFY_METHODS = {
+    'douglas-peucker': _douglas_peucker,
+    'visvalingam': _visvalingam,
+}
+
+# Fewest positions kept in each line or ring of the simplified types
+_SIMPLIFY_MINIMUM = {
+    'LineString': 2,
+    'MultiLineString': 2,
+    'Polygon': 4,
+    'MultiPolygon': 4,
+}
+
+# Lines from this many positions are handled with NumPy arrays
+_VECTORIZE_MIN = 64
+
+
 def generate_random(featureType, numberVertices=3,
-                    boundingBox=[-180.0, -90.0, 180.0, 90.0]):
+                    boundingBox=[-180.0, -90.0, 180.0, 90.0], seed=None):
     """
     Generates random geojson features depending on the parameters
     passed through.
@@ -143,76 +576,236 @@ def generate_random(featureType, numberVertices=3,
     :type numberVertices: int
     :param boundingBox: A bounding box in which features will be restricted to
     :type boundingBox: list
+    :param seed: Seed of a random number generator of its own, to generate
+    the same geometry on every call; the global random module is used
+    otherwise.
+    :type seed: int
     :return: The resulting random geojson object or geometry collection.
     :rtype: object
     :raises ValueError: if there is no featureType provided.
     """
 
     from geojson import Point, LineString, Polygon
-    import random
-    import math
 
+    rng = random if seed is None else random.Random(seed)
     lon_min, lat_min, lon_max, lat_max = boundingBox
 
-    def random_lon():
-        return random.uniform(lon_min, lon_max)
-
-    def random_lat():
-        return random.uniform(lat_min, lat_max)
-
     def create_point():
-        return Point((random_lon(), random_lat()))
-
-    def create_line():
-        return LineString([create_point() for _ in range(numberVertices)])
-
-    def create_poly():
-        ave_radius = 60
-        ctr_x = 0.1
-        ctr_y = 0.2
-        irregularity = clip(0.1, 0, 1) * math.tau / numberVertices
-        spikeyness = clip(0.5, 0, 1) * ave_radius
-
-        lower = (math.tau / numberVertices) - irregularity
-        upper = (math.tau / numberVertices) + irregularity
-        angle_steps = []
-        for _ in range(numberVertices):
-            angle_steps.append(random.uniform(lower, upper))
-        sum_angle = sum(angle_steps)
-
-        k = sum_angle / math.tau
-        angle_steps = [x / k for x in angle_steps]
-
-        points = []
-        angle = random.uniform(0, math.tau)
-
-        for angle_step in angle_steps:
-            r_i = clip(random.gauss(ave_radius, spikeyness), 0, 2 * ave_radius)
-            x = ctr_x + r_i * math.cos(angle)
-            y = ctr_y + r_i * math.sin(angle)
-            x = (x + 180.0) * (abs(lon_min - lon_max) / 360.0) + lon_min
-            y = (y + 90.0) * (abs(lat_min - lat_max) / 180.0) + lat_min
-            x = clip(x, lon_min, lon_max)
-            y = clip(y, lat_min, lat_max)
-            points.append((x, y))
-            angle += angle_step
-
-        points.append(points[0])  # append first point to the end
-        return Polygon([points])
-
-    def clip(x, min_val, max_val):
-        if min_val > max_val:
-            return x
-        else:
-            return min(max(min_val, x), max_val)
+        return Point((rng.uniform(lon_min, lon_max),
+                      rng.uniform(lat_min, lat_max)))
 
     if featureType == 'Point':
         return create_point()
 
     if featureType == 'LineString':
-        return create_line()
+        return LineString([create_point() for _ in range(numberVertices)])
 
     if featureType == 'Polygon':
-        return create_poly()
+        # centred on the bounding box, as wide as the world when scaled to it
+        return Polygon([_random_ring(rng, numberVertices, boundingBox,
+                                     (0.1, 0.2), 60, (360.0, 180.0))])
 
     raise ValueError(f"featureType: {featureType} is not supported.")
+
+
+def generate_random_collection(n, types=("Point", "LineString", "Polygon"),
+                               seed=None, vertices=8, parts=3,
+                               bbox=(-180.0, -90.0, 180.0, 90.0),
+                               properties=None):
+    """
+    Generates a FeatureCollection of random geometries in bulk.
+
+    Features cycle through the given geometry types and have sequential
+    ids. Polygons are star-shaped, with irregular vertices around a random
+    centre and an average radius of a hundredth of the bounding box. With
+    NumPy installed, the coordinates of all geometries of a type are drawn
+    at once; the numbers drawn then differ from those of the pure Python
+    generator for the same seed.
+
+    :param n: Number of features.
+    :type n: int
+    :param types: Geometry types to cycle through, among Point,
+    MultiPoint, LineString, MultiLineString, Polygon and MultiPolygon.
+    :type types: sequence of str
+    :param seed: Seed making the collection reproducible.
+    :type seed: int
+    :param vertices: Number of positions of each MultiPoint, LineString
+    and polygon ring (not counting the closing position).
+    :type vertices: int
+    :param parts: Number of parts of each Multi* geometry.
+    :type parts: int
+    :param bbox: The bounding box the geometries are restricted to.
+    :type bbox: sequence
+    :param properties: Function returning the properties of a feature,
+    given its index and a random.Random seeded from seed.
+    :type properties: function
+    :return: The collection.
+    :rtype: FeatureCollection
+    :raises ValueError: If no type is given, or a type is not supported.
+    """
+    import geojson
+
+    if not types:
+        raise ValueError("types must name at least one geometry type")
+    for type_ in types:
+        if type_ not in _RANDOM_TYPES:
+            raise ValueError(f"featureType: {type_} is not supported.")
+    rng = random.Random(seed)
+    sampler = _NumpySampler(seed, bbox) if numpy is not None \
+        else _PythonSampler(rng, bbox)
+    positions = sampler.positions
+    rings = sampler.rings
+    geometries = {}
+    for index, type_ in enumerate(types):
+        count = len(range(index, n, len(types)))
+        if type_ == "Point":
+            coordinates = positions(count)
+        elif type_ in ("MultiPoint", "LineString"):
+            coordinates = _groups(positions(count * vertices), vertices)
+        elif type_ == "MultiLineString":
+            coordinates = _groups(_groups(positions(
+                count * parts * vertices), vertices), parts)
+        elif type_ == "Polygon":
+            coordinates = [[ring] for ring in rings(count, vertices)]
+        else:
+            coordinates = _groups([[ring] for ring in rings(
+                count * parts, vertices)], parts)
+        cls = getattr(geojson, type_)
+        geometries[type_] = [cls(item, trusted=True) for item in coordinates]
+
+    features = []
+    for i in range(n):
+        type_ = types[i % len(types)]
+        features.append(geojson.Feature(
+            id=i, geometry=geometries[type_][i // len(types)],
+            properties=properties(i, rng) if properties else None))
+    return geojson.FeatureCollection(features)
+
+
+_RANDOM_TYPES = {"Point", "MultiPoint", "LineString", "MultiLineString",
+                 "Polygon", "MultiPolygon"}
+
+# Average radius of the polygons of generate_random_collection, as a
+# fraction of the smaller side of the bounding box
+_POLYGON_RADIUS = 0.01
+
+
+def _groups(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class _PythonSampler:
+    # Random coordinates drawn from a random.Random, one at a time
+
+    def __init__(self, rng, bbox):
+        from geojson.geometry import DEFAULT_PRECISION
+        self.rng = rng
+        self.bbox = bbox
+        self.precision = DEFAULT_PRECISION
+
+    def positions(self, count):
+        uniform = self.rng.uniform
+        precision = self.precision
+        west, south, east, north = self.bbox
+        return [[round(uniform(west, east), precision),
+                 round(uniform(south, north), precision)]
+                for _ in range(count)]
+
+    def rings(self, count, vertices):
+        rng = self.rng
+        precision = self.precision
+        west, south, east, north = self.bbox
+        width, height = east - west, north - south
+        radius = min(width, height) * _POLYGON_RADIUS
+        result = []
+        for _ in range(count):
+            center = (rng.uniform(-width / 2, width / 2),
+                      rng.uniform(-height / 2, height / 2))
+            ring = _random_ring(rng, vertices, self.bbox, center, radius,
+                                (width, height))
+            result.append([[round(x, precision), round(y, precision)]
+                           for x, y in ring])
+        return result
+
+
+class _NumpySampler:
+    # Random coordinates drawn from a NumPy generator, whole arrays at once
+
+    def __init__(self, seed, bbox):
+        from geojson.geometry import DEFAULT_PRECISION
+        self.generator = numpy.random.default_rng(seed)
+        self.bbox = bbox
+        self.precision = DEFAULT_PRECISION
+
+    def positions(self, count):
+        west, south, east, north = self.bbox
+        values = self.generator.uniform((west, south), (east, north),
+                                        (count, 2))
+        return values.round(self.precision).tolist()
+
+    def rings(self, count, vertices):
+        # the same construction as _random_ring, one vertex of every ring
+        # at a time
+        generator = self.generator
+        west, south, east, north = self.bbox
+        radius = min(east - west, north - south) * _POLYGON_RADIUS
+        regular = math.tau / vertices
+        irregularity = _RING_IRREGULARITY * regular
+        steps = generator.uniform(regular - irregularity,
+                                  regular + irregularity, (count, vertices))
+        steps *= math.tau / steps.sum(axis=1, keepdims=True)
+        angles = generator.uniform(0, math.tau, (count, 1)) + \
+            steps.cumsum(axis=1) - steps
+        radii = generator.normal(radius, _RING_SPIKINESS * radius,
+                                 (count, vertices)).clip(0, 2 * radius)
+        centers = generator.uniform((west, south), (east, north), (count, 2))
+        x = (centers[:, :1] + radii * numpy.cos(angles)).clip(west, east)
+        y = (centers[:, 1:] + radii * numpy.sin(angles)).clip(south, north)
+        ring = numpy.stack([x, y], axis=2).round(self.precision)
+        closed = numpy.concatenate([ring, ring[:, :1]], axis=1)
+        return closed.tolist()
+
+
+def _random_ring(rng, vertices, bbox, center, radius, scale):
+    # A closed ring of vertices around center, at irregular angles and
+    # distances (averaging radius); units are mapped onto bbox so that
+    # scale spans its width and height.
+    lon_min, lat_min, lon_max, lat_max = bbox
+    x_scale = abs(lon_min - lon_max) / scale[0]
+    y_scale = abs(lat_min - lat_max) / scale[1]
+    irregularity = _RING_IRREGULARITY * math.tau / vertices
+    spikiness = _RING_SPIKINESS * radius
+
+    lower = (math.tau / vertices) - irregularity
+    upper = (math.tau / vertices) + irregularity
+    angle_steps = [rng.uniform(lower, upper) for _ in range(vertices)]
+    k = sum(angle_steps) / math.tau
+    angle_steps = [x / k for x in angle_steps]
+
+    points = []
+    angle = rng.uniform(0, math.tau)
+    for angle_step in angle_steps:
+        r_i = _clip(rng.gauss(radius, spikiness), 0, 2 * radius)
+        x = center[0] + r_i * math.cos(angle)
+        y = center[1] + r_i * math.sin(angle)
+        x = (x + scale[0] / 2) * x_scale + lon_min
+        y = (y + scale[1] / 2) * y_scale + lat_min
+        points.append((_clip(x, lon_min, lon_max), _clip(y, lat_min, lat_max)))
+        angle += angle_step
+
+    points.append(points[0])  # append first point to the end
+    return points
+
+
+# Shape of random polygons: the largest deviation of the angle between
+# vertices, as a fraction of the regular angle, and the standard deviation
+# of the distance of vertices to the centre, as a fraction of the average
+_RING_IRREGULARITY = 0.1
+_RING_SPIKINESS = 0.5
+
+
+def _clip(x, min_val, max_val):
+    if min_val > max_val:
+        return x
+    else:
+        return min(max(min_val, x), max_val)
@@ -0,0 +1,294 @@
+"""
+Validation of GeoJSON objects in a single pass.
+
+Unlike the ``errors()`` methods of the GeoJSON classes, which return
+nested lists of messages, the functions here yield one record per error,
+located by a JSON pointer, and can stop after a given number of errors.
+They work on GeoJSON instances and plain decoded dicts alike, and on
+streams of features such as the ones produced by ``geojson.iterload``.
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from numbers import Number
+import os
+import pickle
+
+from geojson.coordinates import _VALID_SEQUENCES, CoordinateArray
+from geojson.mapping import is_mapping, to_mapping
+
+
+ErrorRecord = namedtuple("ErrorRecord", ["path", "message"])
+ErrorRecord.__doc__ = """
+A validation error.
+
+``path`` is the JSON pointer (RFC 6901) of the offending value, e.g.
+``/features/3/geometry/coordinates/0/5``, and ``message`` describes the
+problem.
+"""
+
+_LIST = {list}
+_POSITION_LENGTHS = {2, 3}
+_PLAIN_NUMBERS = {float, int}
+
+
+def validate(obj, max_errors=None):
+    """
+    Returns the validation errors of a GeoJSON object or feature stream.
+
+    :param obj: GeoJSON object, or an iterable of features.
+    :type obj: GeoJSON, dict, iterable
+    :param max_errors: Stop after this many errors.
+    :type max_errors: int
+    :return: The errors found, in document order.
+    :rtype: list of ErrorRecord
+    """
+    return list(islice(iter_errors(obj), max_errors))
+
+
+def validate_parallel(obj, workers=None, chunk_size=5000, max_errors=None):
+    """
+    Validates the features of a collection on a pool of processes.
+
+    Features are sent to the workers in chunks, each pickled into a single
+    bytes object. Errors are reported exactly as by :func:`validate`, in
+    document order and with paths holding the original feature indices.
+
+    :param obj: FeatureCollection, or an iterable of features.
+    :type obj: FeatureCollection, dict, iterable
+    :param workers: Number of worker processes (defaults to the number of
+    CPUs).
+    :type workers: int
+    :param chunk_size: Number of features validated per task.
+    :type chunk_size: int
+    :param max_errors: Stop after this many errors.
+    :type max_errors: int
+    :return: The errors found, in document order.
+    :rtype: list of ErrorRecord
+    """
+    if is_mapping(obj) or hasattr(obj, "__geo_interface__"):
+        obj = to_mapping(obj)
+        if obj.get("type") != "FeatureCollection":
+            return validate(obj, max_errors)
+        features = obj.get("features")
+        if not isinstance(features, list):
+            return validate(obj, max_errors)
+    else:
+        features = obj
+
+    workers = workers or os.cpu_count() or 1
+    errors = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # keep a bounded number of chunks in flight so that streamed
+        # features are not all serialized up front
+        pending = deque()
+        for start, chunk in _iter_chunks(features, chunk_size):
+            pending.append(executor.submit(
+                _validate_chunk, start, _encode_chunk(chunk), max_errors))
+            while len(pending) > 2 * workers or (
+                    pending and pending[0].done()):
+                errors.extend(pending.popleft().result())
+                if max_errors is not None and len(errors) >= max_errors:
+                    executor.shutdown(cancel_futures=True)
+                    return errors[:max_errors]
+        while pending:
+            errors.extend(pending.popleft().result())
+    return errors[:max_errors]
+
+
+def _iter_chunks(features, chunk_size):
+    iterator = iter(features)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _encode_chunk(chunk):
+    # pickle round-trips nested lists and dicts several times faster than
+    # JSON, and the binary form is no larger
+    return pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _validate_chunk(start, encoded, max_errors):
+    errors = []
+    for i, feature in enumerate(pickle.loads(encoded), start):
+        errors.extend(islice(_iter_object_errors(feature, f"/features/{i}"),
+                             max_errors))
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+    return errors[:max_errors]
+
+
+def iter_errors(obj, path=""):
+    """
+    Lazily yields the validation errors of a GeoJSON object.
+
+    Iterables that are not GeoJSON objects are treated as a stream of
+    features, reported under ``/features``.
+
+    :param obj: GeoJSON object, or an iterable of features.
+    :type obj: GeoJSON, dict, iterable
+    :param path: JSON pointer of obj within its document.
+    :type path: str
+    :return: A generator of ErrorRecord.
+    :rtype: generator
+    """
+    if not isinstance(obj, (dict, str, bytes)) and not is_mapping(obj) \
+            and not hasattr(obj, "__geo_interface__") \
+            and hasattr(obj, "__iter__"):
+        return _iter_feature_errors(obj, path + "/features")
+    return _iter_object_errors(obj, path)
+
+
+def _iter_object_errors(obj, path):
+    # below the top level, anything but a mapping is an error
+    if not isinstance(obj, dict):
+        if not is_mapping(obj) and not hasattr(obj, "__geo_interface__"):
+            yield ErrorRecord(path, f"{obj!r} is not a GeoJSON object")
+            return
+        obj = to_mapping(obj)
+    type_ = obj.get("type")
+    check = _CHECKS.get(type_) if isinstance(type_, str) else None
+    if check is None:
+        yield ErrorRecord(path + "/type",
+                          f"{type_!r} is not a valid GeoJSON type")
+        return
+    yield from check(obj, path)
+
+
+def _iter_feature_errors(features, path):
+    for i, feature in enumerate(features):
+        yield from _iter_object_errors(feature, f"{path}/{i}")
+
+
+def _position_error(position):
+    if not isinstance(position, _VALID_SEQUENCES):
+        return 'each position must be a list'
+    if len(position) not in (2, 3):
+        return 'a position must have exactly 2 or 3 values'
+    for number in position:
+        if type(number) is not float and type(number) is not int \
+                and not isinstance(number, Number):
+            return 'a position cannot have inner positions'
+
+
+def _check_positions(positions, path):
+    if isinstance(positions, CoordinateArray):
+        # packed positions are numbers of a single, uniform size
+        if len(positions) and positions.dims not in (2, 3):
+            yield ErrorRecord(f"{path}/0",
+                              'a position must have exactly 2 or 3 values')
+        return
+    # the common all-valid case is settled with a few C-level passes before
+    # looking at positions one at a time
+    if set(map(type, positions)) <= _LIST and \
+            set(map(len, positions)) <= _POSITION_LENGTHS and \
+            set(map(type, chain.from_iterable(positions))) <= _PLAIN_NUMBERS:
+        return
+    for i, position in enumerate(positions):
+        error = _position_error(position)
+        if error:
+            yield ErrorRecord(f"{path}/{i}", error)
+
+
+def _check_point(coordinates, path):
+    error = _position_error(coordinates)
+    if error:
+        yield ErrorRecord(path, error)
+
+
+def _check_multi_point(coordinates, path):
+    if not isinstance(coordinates, _VALID_SEQUENCES):
+        yield ErrorRecord(path, 'the "coordinates" member must be a list')
+        return
+    yield from _check_positions(coordinates, path)
+
+
+def _check_line_string(coordinates, path):
+    if not isinstance(coordinates, _VALID_SEQUENCES):
+        yield ErrorRecord(path, 'each line must be a list of positions')
+        return
+    if len(coordinates) < 2:
+        yield ErrorRecord(path, 'the "coordinates" member must be an array '
+                                'of two or more positions')
+    yield from _check_positions(coordinates, path)
+
+
+def _check_ring(ring, path):
+    if not isinstance(ring, _VALID_SEQUENCES):
+        yield ErrorRecord(
+            path, "Each element of a polygon's coordinates must be a list")
+        return
+    yield from _check_positions(ring, path)
+    if len(ring) < 4:
+        yield ErrorRecord(
+            path, 'Each linear ring must contain at least 4 positions')
+    elif ring[0] != ring[-1]:
+        yield ErrorRecord(path, 'Each linear ring must end where it started')
+
+
+def _check_polygon(coordinates, path):
+    if not isinstance(coordinates, _VALID_SEQUENCES):
+        yield ErrorRecord(path, 'Each polygon must be a list of linear rings')
+        return
+    for i, ring in enumerate(coordinates):
+        yield from _check_ring(ring, f"{path}/{i}")
+
+
+def _check_parts(check):
+    def check_parts(coordinates, path):
+        if not isinstance(coordinates, _VALID_SEQUENCES):
+            yield ErrorRecord(path, 'the "coordinates" member must be a list')
+            return
+        for i, part in enumerate(coordinates):
+            yield from check(part, f"{path}/{i}")
+    return check_parts
+
+
+def _geometry(check):
+    def check_geometry(obj, path):
+        yield from check(obj.get("coordinates"), path + "/coordinates")
+    return check_geometry
+
+
+def _check_geometry_collection(obj, path):
+    geometries = obj.get("geometries")
+    if not isinstance(geometries, list):
+        yield ErrorRecord(path + "/geometries",
+                          'the "geometries" member must be a list')
+        return
+    for i, geometry in enumerate(geometries):
+        yield from _iter_object_errors(geometry, f"{path}/geometries/{i}")
+
+
+def _check_feature(obj, path):
+    geometry = obj.get("geometry")
+    if geometry is not None:
+        yield from _iter_object_errors(geometry, path + "/geometry")
+
+
+def _check_feature_collection(obj, path):
+    features = obj.get("features")
+    if not isinstance(features, list):
+        yield ErrorRecord(path + "/features",
+                          'the "features" member must be a list')
+        return
+    yield from _iter_feature_errors(features, path + "/features")
+
+
+_CHECKS = {
+    "Point": _geometry(_check_point),
+    "MultiPoint": _geometry(_check_multi_point),
+    "LineString": _geometry(_check_line_string),
+    "MultiLineString": _geometry(_check_parts(_check_line_string)),
+    "Polygon": _geometry(_check_polygon),
+    "MultiPolygon": _geometry(_check_parts(_check_polygon)),
+    "GeometryCollection": _check_geometry_collection,
+    "Feature": _check_feature,
+    "FeatureCollection": _check_feature_collection,
+}
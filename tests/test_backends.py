@@ -0,0 +1,179 @@
+"""
+Tests for geojson/backends.py
+"""
+
+import importlib.util
+import io
+import json
+import unittest
+
+import geojson
+from geojson import backends
+
+
+POINT = geojson.Point((-115.81, 37.24))
+
+FEATURE_COLLECTION = geojson.FeatureCollection(
+    [geojson.Feature(id=1, geometry=POINT, properties={"name": "Zürich"}),
+     geojson.Feature(id=2, geometry=None, properties={"tags": ["a", None]})],
+    bbox=[-115.81, 37.24, -115.81, 37.24],
+)
+
+NUMBERS = geojson.Feature(
+    geometry=geojson.LineString([(2e16, 1e-07), (10.00001, -1e-05)]),
+    properties={"floats": [1.5e300, -2.5e-10, 1e-07, 0.0001, 1e15, 5e-324],
+                "text": "1e5 0.00001 \"2e16\""},
+)
+
+# orjson cannot encode these
+UNSUPPORTED = geojson.Feature(
+    geometry=None, properties={"wide": 2 ** 70, "keys": {2: "b", 1: "a"}})
+
+
+class RecordingBackend:
+    """Wraps the standard library and records which calls reach it."""
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj, default, **kwargs):
+        self.calls.append("dumps")
+        return json.dumps(obj, default=default, allow_nan=False,
+                          ensure_ascii=False, **kwargs)
+
+    def loads(self, s, object_hook):
+        self.calls.append("loads")
+        return json.loads(s, object_hook=object_hook)
+
+
+class RegistryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.recorder = RecordingBackend()
+        backends.register_backend("recording", self.recorder.dumps,
+                                  self.recorder.loads, options=["sort_keys"])
+
+    def tearDown(self):
+        backends.set_backend("json")
+
+    def test_default_is_stdlib(self):
+        self.assertEqual(backends.get_backend(), "json")
+        self.assertIsNone(backends.current())
+
+    def test_set_backend_preference(self):
+        self.assertEqual(
+            backends.set_backend("not-installed", "recording", "json"),
+            "recording")
+        self.assertEqual(backends.get_backend(), "recording")
+
+    def test_set_backend_unavailable(self):
+        with self.assertRaises(ValueError):
+            backends.set_backend("not-installed")
+        self.assertEqual(backends.get_backend(), "json")
+
+    def test_dumps_and_loads(self):
+        backends.set_backend("recording")
+        text = geojson.dumps(FEATURE_COLLECTION, sort_keys=True)
+        decoded = geojson.loads(text)
+        self.assertEqual(self.recorder.calls, ["dumps", "loads"])
+        self.assertEqual(decoded, FEATURE_COLLECTION)
+        self.assertIsInstance(decoded.features[0].geometry, geojson.Point)
+
+    def test_dump_and_load(self):
+        backends.set_backend("recording")
+        fp = io.StringIO()
+        geojson.dump(POINT, fp, ensure_ascii=False)
+        fp.seek(0)
+        self.assertEqual(geojson.load(fp), POINT)
+        self.assertEqual(self.recorder.calls, ["dumps", "loads"])
+
+    def test_unsupported_options_use_stdlib(self):
+        backends.set_backend("recording")
+        geojson.dumps(POINT, indent=2)
+        geojson.dumps(POINT, allow_nan=True)
+        geojson.dumps(POINT, ensure_ascii=True)
+        geojson.dump(POINT, io.StringIO())
+        geojson.loads('{"type": "Point", "coordinates": [1, 2]}',
+                      object_hook=None)
+        self.assertEqual(self.recorder.calls, [])
+
+
+class InstalledBackendsMixin:
+
+    name = None
+
+    def setUp(self):
+        backends.set_backend(self.name)
+
+    def tearDown(self):
+        backends.set_backend("json")
+
+    def test_roundtrip(self):
+        text = geojson.dumps(FEATURE_COLLECTION)
+        self.assertEqual(json.loads(text), json.loads(
+            json.dumps(FEATURE_COLLECTION, ensure_ascii=False)))
+        decoded = geojson.loads(text)
+        self.assertEqual(decoded, FEATURE_COLLECTION)
+        self.assertIsInstance(decoded.features[0], geojson.Feature)
+
+    def test_geo_interface(self):
+        class MyPoint:
+            __geo_interface__ = {"type": "Point", "coordinates": (1, 2)}
+
+        text = geojson.dumps({"type": "Feature", "geometry": MyPoint(),
+                              "properties": {}})
+        self.assertEqual(json.loads(text)["geometry"]["coordinates"], [1, 2])
+
+    def test_strict_numbers(self):
+        with self.assertRaises(ValueError):
+            geojson.dumps({"type": "Point",
+                           "coordinates": (float("nan"), 1.0)})
+        with self.assertRaises(ValueError):
+            geojson.dumps({"type": "Feature", "geometry": None,
+                           "properties": {"value": float("inf")}})
+        with self.assertRaises(ValueError):
+            geojson.loads('{"type": "Point", "coordinates": [1.0, NaN]}')
+
+    def test_identical_loads(self):
+        texts = [geojson.dumps(FEATURE_COLLECTION), geojson.dumps(NUMBERS)]
+        for value in ("123456789012345678901234567890",
+                      "-9223372036854775809", "18446744073709551615",
+                      '"\\ud800"', "1e400", "0.1234567890123456789"):
+            texts.append('{"type": "Feature", "geometry": null, '
+                         '"properties": {"value": %s}}' % value)
+        for text in texts:
+            for s in (text, text.encode("utf-8")):
+                backends.set_backend("json")
+                expected = geojson.loads(s)
+                backends.set_backend(self.name)
+                self.assertEqual(json.dumps(geojson.loads(s)),
+                                 json.dumps(expected))
+
+    def test_identical_output(self):
+        calls = [{}, {"sort_keys": True}, {"separators": (",", ":")},
+                 {"separators": (",", ":"), "sort_keys": True}]
+        for obj in (FEATURE_COLLECTION, NUMBERS, UNSUPPORTED):
+            for kwargs in calls:
+                backends.set_backend("json")
+                expected = geojson.dumps(obj, **kwargs)
+                backends.set_backend(self.name)
+                self.assertEqual(geojson.dumps(obj, **kwargs), expected)
+
+
+@unittest.skipUnless(importlib.util.find_spec("orjson"), "requires orjson")
+class OrjsonTestCase(InstalledBackendsMixin, unittest.TestCase):
+    name = "orjson"
+
+
+@unittest.skipUnless(importlib.util.find_spec("simplejson"),
+                     "requires simplejson")
+class SimplejsonTestCase(InstalledBackendsMixin, unittest.TestCase):
+    name = "simplejson"
+
+    def test_identical_indented_output(self):
+        backends.set_backend("json")
+        expected = geojson.dumps(FEATURE_COLLECTION, sort_keys=True, indent=1)
+        backends.set_backend(self.name)
+        self.assertEqual(
+            geojson.dumps(FEATURE_COLLECTION, sort_keys=True, indent=1),
+            expected)
@@ -5,6 +5,8 @@ Tests for geojson/base.py
 import unittest
 
 import geojson
+import geojson.compact
+from geojson.base import REPR_MAX_LENGTH
 
 
 class TypePropertyTestCase(unittest.TestCase):
@@ -33,6 +35,15 @@ class TypePropertyTestCase(unittest.TestCase):
         self.assertTrue(isinstance(geojson_obj, geojson.GeoJSON))
         self.assertTrue("type" in geojson_obj.properties)
 
+    def test_type_member(self):
+        class Named(geojson.GeoJSON):
+            type = "Custom"
+
+        self.assertEqual(geojson.GeoJSON().type, "GeoJSON")
+        self.assertEqual(geojson.GeoJSON({"type": "Point"}).type, "Point")
+        self.assertEqual(Named({"type": "Point"}).type, "Custom")
+        self.assertEqual(geojson.Feature(type="Feature").type, "Feature")
+
 
 class OperatorOverloadingTestCase(unittest.TestCase):
     """
@@ -66,9 +77,125 @@ class BaseTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             geojson.GeoJSON.to_instance({"type": "Not GeoJSON"}, strict=True)
 
+        with self.assertRaises(ValueError):
+            geojson.GeoJSON.to_instance({"coordinates": [1, 2]}, strict=True)
+
+    def test_to_instance_non_geojson(self):
+        for ob in ({"type": "Not GeoJSON"}, {"type": ["Point"]},
+                   {"type": None}, {"name": "no type"}, {}):
+            self.assertIs(geojson.GeoJSON.to_instance(ob), ob)
+
+    def test_to_instance_dispatch(self):
+        for type_ in ("Point", "MultiPoint", "LineString", "MultiLineString",
+                      "Polygon", "MultiPolygon", "GeometryCollection",
+                      "Feature", "FeatureCollection"):
+            instance = geojson.GeoJSON.to_instance(
+                {"type": type_, "features": []}
+                if type_ == "FeatureCollection" else {"type": type_})
+            self.assertIsInstance(instance, getattr(geojson, type_))
+
     def test_errors(self):
         class Fake(geojson.GeoJSON):
             pass
 
         with self.assertRaises(NotImplementedError):
             Fake().errors()
+
+
+class ReprTestCase(unittest.TestCase):
+    def setUp(self):
+        self.collection = geojson.FeatureCollection([
+            geojson.Feature(id=i, geometry=geojson.Point((i, i)))
+            for i in range(100)])
+
+    def tearDown(self):
+        geojson.base.REPR_MAX_LENGTH = REPR_MAX_LENGTH
+
+    def test_repr(self):
+        point = geojson.Point((1, 2))
+        self.assertEqual(repr(point),
+                         '{"coordinates": [1, 2], "type": "Point"}')
+        self.assertEqual(str(point), repr(point))
+
+    def test_str(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(id=1, geometry=geojson.Polygon(
+                [[(0, 0), (1, 0), (1, 1), (0, 0)]], packed=True),
+                properties={"point": geojson.Point((1, 2)), "n": [1, 2]}),
+            geojson.Feature(geometry=geojson.GeometryCollection(
+                [geojson.Point((3, 4)), geojson.LineString([(0, 0), (1, 1)])]))
+        ], bbox=[0, 0, 3, 4], name="Zürich")
+        self.assertEqual(str(collection),
+                         geojson.dumps(collection, sort_keys=True))
+        lazy = geojson.loads(geojson.dumps(collection), lazy=True)
+        self.assertEqual(str(lazy), str(collection))
+
+    def test_cached(self):
+        text = str(self.collection)
+        self.assertIs(str(self.collection), text)
+
+        # changes to the members of nested objects are noticed
+        feature = self.collection.features[5]
+        feature.geometry = geojson.Point((50, 60))
+        self.assertIn("[50, 60]", str(self.collection))
+        feature.geometry.coordinates = [70, 80]
+        self.assertIn("[70, 80]", str(self.collection))
+        geojson.utils.map_tuples(lambda c: (c[0] + 1, c[1]), feature,
+                                 inplace=True)
+        self.assertIn("[71, 80]", str(self.collection))
+        self.collection.features[6] = geojson.Feature(id="new")
+        self.assertIn('"id": "new"', str(self.collection))
+
+        # changes inside other members are not, until they are set again
+        point = geojson.Point((1, 2))
+        str(point)
+        point.coordinates[0] = 9
+        self.assertEqual(str(point),
+                         '{"coordinates": [1, 2], "type": "Point"}')
+        point.coordinates = point.coordinates
+        self.assertEqual(str(point),
+                         '{"coordinates": [9, 2], "type": "Point"}')
+
+    def test_changes(self):
+        self.collection.features.append(geojson.Feature(id=100))
+        self.assertIn('"id": 100', str(self.collection))
+
+        self.collection.features = []
+        self.assertEqual(repr(self.collection),
+                         '{"features": [], "type": "FeatureCollection"}')
+
+        self.collection.name = "empty"
+        self.assertIn('"name": "empty"', repr(self.collection))
+        del self.collection.name
+        self.assertNotIn("name", repr(self.collection))
+
+    def test_bounded(self):
+        full = str(self.collection)
+        self.assertGreater(len(full), REPR_MAX_LENGTH)
+        self.assertEqual(repr(self.collection),
+                         full[:REPR_MAX_LENGTH] + "...")
+        geojson.base.REPR_MAX_LENGTH = 50
+        text = repr(self.collection)
+        self.assertEqual(text, full[:50] + "...")
+        self.assertEqual(repr(self.collection), text)
+
+        geojson.base.REPR_MAX_LENGTH = len(full)
+        self.assertEqual(repr(self.collection), full)
+        geojson.base.REPR_MAX_LENGTH = None
+        self.assertEqual(repr(self.collection), full)
+
+    def test_bounded_lazy(self):
+        collection = geojson.loads(geojson.dumps(self.collection), lazy=True)
+        geojson.base.REPR_MAX_LENGTH = 50
+        repr(collection)
+        loaded = [feature for feature in collection.features
+                  if type(feature) is geojson.Feature]
+        self.assertLess(len(loaded), 5)
+
+    def test_bounded_compact(self):
+        collection = geojson.loads(geojson.dumps(self.collection),
+                                   object_hook=geojson.compact.object_hook)
+        feature = collection["features"][0]
+        geojson.base.REPR_MAX_LENGTH = 20
+        self.assertEqual(repr(feature),
+                         geojson.dumps(feature, sort_keys=True)[:20] + "...")
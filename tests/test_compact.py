@@ -0,0 +1,85 @@
+"""
+Tests for the compact GeoJSON classes
+"""
+
+import io
+import unittest
+
+import geojson
+from geojson import compact
+
+
+class CompactTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.feature = compact.Feature(
+            id=3, geometry=compact.Point((1.5, 2.1234567)),
+            properties={"name": "a"}, title="t")
+
+    def test_slots(self):
+        for obj in (self.feature, self.feature.geometry,
+                    compact.LineString([(0, 0), (1, 1)])):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.feature.geometry.name = "x"
+
+    def test_geo_interface(self):
+        self.assertEqual(self.feature.__geo_interface__, {
+            "type": "Feature", "id": 3,
+            "geometry": {"type": "Point", "coordinates": [1.5, 2.1234567]},
+            "properties": {"name": "a"}, "title": "t"})
+        self.assertEqual(compact.Feature().__geo_interface__,
+                         {"type": "Feature", "geometry": None,
+                          "properties": {}})
+        regular = geojson.Feature(geometry=self.feature.geometry)
+        self.assertEqual(regular.geometry, geojson.Point((1.5, 2.123457)))
+
+    def test_dumps(self):
+        self.assertEqual(
+            geojson.loads(geojson.dumps(self.feature)),
+            geojson.Feature(id=3, geometry=geojson.Point((1.5, 2.1234567)),
+                            properties={"name": "a"}, title="t"))
+        self.assertIn("2.1234567", geojson.dumps(self.feature))
+
+    def test_loads(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=geojson.Point((1, 2))),
+            geojson.Feature(geometry=geojson.LineString([(1, 2), (3, 4)]),
+                            properties={"n": 1}),
+            geojson.Feature(geometry=geojson.Polygon(
+                [[(0, 0), (1, 0), (1, 1), (0, 0)]])),
+            geojson.Feature(geometry=geojson.MultiPoint([(1, 2)])),
+            geojson.Feature(geometry=geojson.Point((1, 2), bbox=[1, 2, 1, 2])),
+        ])
+        text = geojson.dumps(collection)
+        decoded = geojson.loads(text, object_hook=compact.object_hook)
+        features = decoded["features"]
+        self.assertEqual([type(f.geometry) for f in features],
+                         [compact.Point, compact.LineString, compact.Polygon,
+                          geojson.MultiPoint, geojson.Point])
+        self.assertIsNone(features[0].properties)
+        self.assertEqual(geojson.dumps(decoded), text)
+        streamed = list(geojson.iterload(io.StringIO(text),
+                                         object_hook=compact.object_hook))
+        self.assertEqual(streamed, features)
+
+    def test_validation(self):
+        self.assertTrue(self.feature.is_valid)
+        self.assertEqual(geojson.validate(self.feature), [])
+        ring = [(0, 0), (1, 0), (1, 1)]
+        polygon = compact.Polygon([ring])
+        self.assertEqual(polygon.errors(),
+                         geojson.Polygon([ring]).errors())
+        self.assertEqual(geojson.validate(compact.Feature(geometry=polygon)),
+                         geojson.validate(geojson.Feature(
+                             geometry=geojson.Polygon([ring]))))
+        self.assertFalse(compact.LineString([(0, 0)]).is_valid)
+        self.assertFalse(compact.Feature(
+            geometry={"type": "Point", "coordinates": [1]}).is_valid)
+
+    def test_equality(self):
+        self.assertEqual(compact.Point([1, 2]), geojson.Point((1, 2)))
+        self.assertEqual(compact.Point([1, 2]),
+                         {"type": "Point", "coordinates": [1, 2]})
+        self.assertNotEqual(compact.Point([1, 2]), compact.Point([2, 1]))
+        self.assertNotEqual(compact.Point([1, 2]), [1, 2])
@@ -3,6 +3,8 @@ Tests for geojson object constructor
 """
 
 import unittest
+from decimal import Decimal
+from fractions import Fraction
 
 import geojson
 
@@ -30,3 +32,68 @@ class TestGeoJSONConstructor(unittest.TestCase):
         poly2 = geojson.Polygon([outer, other])
         self.assertEqual(geojson.MultiPolygon([poly, poly2]).coordinates,
                          [[outer], [outer, other]])
+
+
+class CleanCoordinatesTestCase(unittest.TestCase):
+
+    def test_rounding(self):
+        coords = [[(1.23456789, 2.675), (3, -4.5555555)],
+                  [[2.675, 1e-9, 100.0000004]]]
+        self.assertEqual(
+            geojson.geometry.Geometry.clean_coordinates(coords, 2),
+            [[[1.23, 2.67], [3, -4.56]], [[2.67, 0.0, 100.0]]])
+
+    def test_result_types(self):
+        cleaned = geojson.geometry.Geometry.clean_coordinates(
+            [(1, 2.0), [True, Decimal("1.123456789")], [Fraction(1, 3), 0]],
+            3)
+        self.assertEqual(cleaned, [[1, 2.0], [1, Decimal("1.123")],
+                                   [Fraction(333, 1000), 0]])
+        self.assertIs(type(cleaned[0][0]), int)
+        self.assertIs(type(cleaned[1][0]), int)
+        self.assertIs(type(cleaned[1][1]), Decimal)
+
+    def test_subclasses(self):
+        class Coordinate(float):
+            pass
+
+        class Position(list):
+            pass
+
+        cleaned = geojson.geometry.Geometry.clean_coordinates(
+            Position([Coordinate(1.23456), Coordinate(2.5)]), 2)
+        self.assertEqual(cleaned, [1.23, 2.5])
+        self.assertIs(type(cleaned), list)
+
+    def test_invalid(self):
+        for coords in ([["1", 2]], [(1, None)], [{"x": 1}]):
+            with self.assertRaises(ValueError):
+                geojson.geometry.Geometry.clean_coordinates(coords, 6)
+
+
+class TrustedConstructionTestCase(unittest.TestCase):
+
+    def test_adopts_coordinates(self):
+        coords = [[1.123456789, 2.0], [3.0, 4.0]]
+        line = geojson.LineString(coords, trusted=True)
+        self.assertIs(line.coordinates, coords)
+        self.assertNotIn("trusted", line)
+        self.assertEqual(geojson.LineString([], trusted=True).coordinates, [])
+
+    def test_validate(self):
+        with self.assertRaises(ValueError):
+            geojson.LineString([[1.0, 2.0]], trusted=True, validate=True)
+
+    def test_loads(self):
+        text = ('{"type": "Feature", "properties": {}, "geometry": '
+                '{"type": "Point", "coordinates": [1.123456789, 2]}}')
+        feature = geojson.loads(text, trusted=True)
+        self.assertIsInstance(feature.geometry, geojson.Point)
+        self.assertEqual(feature.geometry.coordinates, [1.123456789, 2])
+        self.assertEqual(geojson.loads(text).geometry.coordinates,
+                         [1.123457, 2])
+
+    def test_load_seq(self):
+        lines = ['{"type": "Point", "coordinates": [1.123456789, 2]}\n']
+        point, = geojson.load_seq(lines, trusted=True)
+        self.assertEqual(point.coordinates, [1.123456789, 2])
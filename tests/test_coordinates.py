@@ -0,0 +1,141 @@
+"""
+Tests for geojson/coordinates.py
+"""
+
+import json
+import unittest
+from array import array
+
+import geojson
+from geojson.coordinates import CoordinateArray
+from geojson.utils import coords, map_coords, map_tuples
+
+RING = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+HOLE = [[0.2, 0.2], [0.3, 0.2], [0.3, 0.3], [0.2, 0.2]]
+MULTIPOLYGON = [[RING, HOLE], [[[5.0, 5.0], [6.0, 5.0], [6.0, 6.0],
+                               [5.0, 5.0]]]]
+
+
+class CoordinateArrayTestCase(unittest.TestCase):
+
+    def test_from_nested(self):
+        packed = CoordinateArray.from_nested(MULTIPOLYGON)
+        self.assertEqual(packed.dims, 2)
+        self.assertEqual(len(packed.values), 24)
+        self.assertEqual([list(o) for o in packed.offsets],
+                         [[0, 2, 3], [0, 4, 8, 12]])
+        self.assertEqual(packed, MULTIPOLYGON)
+        self.assertEqual(packed.tolist(), MULTIPOLYGON)
+
+    def test_indexing(self):
+        packed = CoordinateArray.from_nested(MULTIPOLYGON)
+        self.assertEqual(len(packed), 2)
+        self.assertEqual(len(packed[0]), 2)
+        self.assertEqual(packed[0][1], HOLE)
+        self.assertEqual(packed[-1][0][2], [6.0, 6.0])
+        self.assertEqual(packed[0][0][1:3], [[1.0, 0.0], [1.0, 1.0]])
+        self.assertIsInstance(packed[0], CoordinateArray)
+        with self.assertRaises(IndexError):
+            packed[2]
+
+    def test_from_arrays(self):
+        packed = CoordinateArray(array('d', [0, 0, 1, 0, 1, 1, 0, 0]),
+                                 offsets=[[0, 4]])
+        self.assertEqual(packed, [RING])
+
+    def test_inconsistent_arrays(self):
+        with self.assertRaises(ValueError):
+            CoordinateArray([0, 0, 1], dims=2)
+        with self.assertRaises(ValueError):
+            CoordinateArray([0, 0, 1, 1], offsets=[[0, 3]])
+        with self.assertRaises(ValueError):
+            CoordinateArray.from_nested([[0, 0], [1, 1, 1]])
+
+    def test_positions(self):
+        packed = CoordinateArray.from_nested(MULTIPOLYGON)
+        self.assertEqual(list(packed[0][1].positions()),
+                         [tuple(p) for p in HOLE])
+        self.assertEqual(len(list(packed.positions())), 12)
+
+    def test_point(self):
+        packed = CoordinateArray.from_nested([1.5, 2.5, 3.5])
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(packed[1], 2.5)
+        self.assertEqual(list(packed.positions()), [(1.5, 2.5, 3.5)])
+
+    def test_empty_parts(self):
+        for nested in ([[], RING], [[], [[], RING]], [[[]]], [[], []]):
+            packed = CoordinateArray.from_nested(nested)
+            self.assertEqual(packed.tolist(), nested)
+        self.assertEqual(CoordinateArray.from_nested([[]], 3).offsets,
+                         (array('q', [0, 0]), array('q', [0])))
+
+    def test_rounded(self):
+        packed = CoordinateArray.from_nested([[1.123456789, 2.0]])
+        self.assertEqual(packed.rounded(3), [[1.123, 2.0]])
+        self.assertEqual(packed, [[1.123456789, 2.0]])
+
+
+class PackedGeometryTestCase(unittest.TestCase):
+
+    def test_packed_geometries(self):
+        for geometry in (geojson.Point((1, 2), packed=True),
+                         geojson.LineString(RING, packed=True),
+                         geojson.MultiPoint(RING, packed=True),
+                         geojson.Polygon([RING, HOLE], packed=True),
+                         geojson.MultiLineString([RING, HOLE], packed=True),
+                         geojson.MultiPolygon(MULTIPOLYGON, packed=True)):
+            self.assertIsInstance(geometry.coordinates, CoordinateArray)
+            self.assertTrue(geometry.is_valid, geometry.type)
+
+    def test_empty_parts(self):
+        for geometry in (geojson.Polygon([[]], packed=True),
+                         geojson.Polygon([[], RING], packed=True),
+                         geojson.MultiLineString([[], RING], packed=True),
+                         geojson.MultiPolygon([[[]]], packed=True),
+                         geojson.MultiPolygon([[], [RING]], packed=True)):
+            unpacked = type(geometry)(geometry.coordinates.tolist())
+            self.assertEqual(geometry, unpacked)
+            self.assertEqual(geojson.dumps(geometry), geojson.dumps(unpacked))
+        self.assertEqual(len(geojson.MultiPolygon(
+            [[]], packed=True).coordinates.offsets), 2)
+
+    def test_invalid(self):
+        polygon = geojson.Polygon([RING[:-1]], packed=True)
+        self.assertEqual(polygon.errors(),
+                         'Each linear ring must contain at least 4 positions')
+
+    def test_rounding(self):
+        line = geojson.LineString([(1.1234567, 2)], packed=True)
+        self.assertEqual(line.coordinates, [[1.123457, 2.0]])
+
+    def test_adopts_packed_input(self):
+        packed = CoordinateArray(array('d', [0, 0, 1, 0, 1, 1, 0, 0]),
+                                 offsets=[[0, 4]])
+        polygon = geojson.Polygon(packed)
+        self.assertIsInstance(polygon.coordinates, CoordinateArray)
+        self.assertEqual(polygon, geojson.Polygon([RING]))
+
+    def test_dumps(self):
+        polygon = geojson.Polygon([RING, HOLE], packed=True)
+        feature = geojson.Feature(geometry=polygon)
+        self.assertEqual(json.loads(geojson.dumps(feature)),
+                         json.loads(geojson.dumps(geojson.Feature(
+                             geometry=geojson.Polygon([RING, HOLE])))))
+
+    def test_coords(self):
+        polygon = geojson.MultiPolygon(MULTIPOLYGON, packed=True)
+        self.assertEqual(
+            list(coords(polygon)),
+            list(coords(geojson.MultiPolygon(MULTIPOLYGON))))
+
+    def test_map_coords(self):
+        polygon = geojson.Polygon([RING, HOLE], packed=True)
+        result = map_coords(lambda x: x * 2, polygon)
+        self.assertIsInstance(result['coordinates'], CoordinateArray)
+        self.assertEqual(result['coordinates'][0][2], [2.0, 2.0])
+
+    def test_map_tuples(self):
+        point = geojson.Point((1, 2), packed=True)
+        result = map_tuples(lambda c: (c[1], c[0]), point)
+        self.assertEqual(list(coords(result)), [(2.0, 1.0)])
@@ -1,7 +1,7 @@
 import unittest
 
 import geojson
-from geojson.utils import coords, map_coords
+from geojson.utils import coords, coords_array, map_coords, map_tuples
 
 TOO_PRECISE = (1.12341234, -2.12341234)
 
@@ -59,6 +59,46 @@ class CoordsTestCase(unittest.TestCase):
             (23.18, -34.29), (-1.31, -4.61), (3.41, 77.91), (23.18, -34.29)
         })
 
+    def test_null_geometry(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(),
+            geojson.Feature(geometry=geojson.Point((1, 2)))])
+        self.assertEqual(list(coords(collection)), [(1, 2)])
+
+    def test_deep_nesting_order(self):
+        ring = [[0, 0], [1, 0], [1, 1], [0, 0]]
+        polygon = {'type': 'MultiPolygon', 'coordinates': [
+            [ring, [(2, 2), (3, 2), (3, 3), (2, 2)]], [], [ring]]}
+        self.assertEqual(list(coords(polygon)),
+                         [(0, 0), (1, 0), (1, 1), (0, 0),
+                          (2, 2), (3, 2), (3, 3), (2, 2),
+                          (0, 0), (1, 0), (1, 1), (0, 0)])
+
+    def test_packed(self):
+        rings = [[(0, 0), (1, 0), (1, 1), (0, 0)]]
+        self.assertEqual(list(coords(geojson.Polygon(rings, packed=True))),
+                         list(coords(geojson.Polygon(rings))))
+
+    def test_coords_array(self):
+        line = geojson.LineString([(1, 2, 3), (4, 5, 6)])
+        collection = geojson.GeometryCollection([
+            line, geojson.Point((7, 8, 9), packed=True)])
+        values, dims = coords_array(collection)
+        self.assertEqual(dims, 3)
+        self.assertEqual(values.tolist(), [1, 2, 3, 4, 5, 6, 7, 8, 9])
+        values, dims = coords_array(geojson.MultiPoint([]))
+        self.assertEqual((len(values), dims), (0, 2))
+
+    def test_coords_array_packed(self):
+        rings = [[(0, 0), (1, 0), (1, 1), (0, 0)]]
+        polygon = geojson.MultiPolygon([rings, rings], packed=True)
+        self.assertEqual(coords_array(polygon.coordinates[1]),
+                         coords_array(geojson.Polygon(rings)))
+
+    def test_coords_array_mixed_dimensions(self):
+        with self.assertRaises(ValueError):
+            coords_array(geojson.MultiPoint([(1, 2), (3, 4, 5)]))
+
     def test_map_point(self):
         result = map_coords(lambda x: x, geojson.Point((-115.81, 37.24)))
         self.assertEqual(result['type'], 'Point')
@@ -103,3 +143,100 @@ class CoordsTestCase(unittest.TestCase):
     def test_map_invalid(self):
         with self.assertRaises(ValueError):
             map_coords(lambda x: x, {"type": ""})
+
+    def test_map_vectorized(self):
+        polygon = [[(3.78, 9.28), (-130.91, 1.52), (35.12, 72.23), (3.78, 9.28)]]
+        collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=geojson.Point((1, 2))),
+            geojson.Feature(geometry=None),
+            geojson.Feature(geometry=geojson.GeometryCollection([
+                geojson.MultiPolygon([polygon, polygon]),
+                geojson.LineString([(5, 6), (7, 8)])])),
+        ])
+        expected = map_tuples(lambda c: (c[0] * 2, c[1] + 1), collection)
+        calls = []
+
+        def transform(x, y):
+            calls.append(len(x))
+            return [v * 2 for v in x], [v + 1 for v in y]
+
+        result = map_tuples(transform, collection, vectorized=True)
+        self.assertEqual(calls, [11])
+        self.assertEqual(result, expected)
+
+    def test_map_vectorized_packed(self):
+        polygon = geojson.Polygon([[(0, 0), (1, 0), (1, 1), (0, 0)]],
+                                  packed=True)
+        result = map_tuples(lambda x, y: (y, x), polygon, vectorized=True)
+        self.assertEqual(result['coordinates'],
+                         [[[0, 0], [0, 1], [1, 1], [0, 0]]])
+
+    def test_map_coords_vectorized(self):
+        line = geojson.LineString([(1, 2, 3), (4, 5, 6)])
+
+        def halve(values):
+            return [v / 2 for v in values]
+
+        self.assertEqual(map_coords(halve, line, vectorized=True),
+                         map_coords(lambda v: v / 2, line))
+
+    def test_map_vectorized_errors(self):
+        line = geojson.LineString([(1, 2), (3, 4)])
+        with self.assertRaises(ValueError):
+            map_tuples(lambda x, y: (x[:1], y[:1]), line, vectorized=True)
+        with self.assertRaises(ValueError):
+            map_tuples(lambda x, y: (x, y), {"type": ""}, vectorized=True)
+
+    def test_map_copy_keeps_members(self):
+        feature = geojson.Feature(
+            id=7, geometry=geojson.LineString([(1, 2), (3, 4)], bbox=[1, 2, 3, 4]),
+            properties={"name": "a"}, crs="urn:ogc:def:crs:OGC::CRS84")
+        collection = geojson.FeatureCollection([feature], title="t")
+        original = geojson.loads(geojson.dumps(collection))
+        result = map_tuples(lambda c: (c[0] + 1, c[1]), collection)
+        self.assertEqual(collection, original)
+        self.assertEqual(result['title'], "t")
+        mapped = result['features'][0]
+        self.assertEqual((mapped['id'], mapped['crs'], mapped['properties']),
+                         (7, "urn:ogc:def:crs:OGC::CRS84", {"name": "a"}))
+        self.assertEqual(mapped['geometry'],
+                         {'type': 'LineString', 'bbox': [1, 2, 3, 4],
+                          'coordinates': [(2, 2), (4, 4)]})
+
+    def test_map_inplace(self):
+        line = geojson.LineString([(1, 2), (3, 4)])
+        positions = line['coordinates']
+        collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=line),
+            geojson.Feature(geometry=geojson.GeometryCollection([
+                geojson.Point((5, 6))])),
+            geojson.Feature(geometry=None)])
+        self.assertEqual(line.compute_bbox(), [1, 2, 3, 4])
+        result = map_tuples(lambda c: (c[0] * 10, c[1]), collection,
+                            inplace=True)
+        self.assertIs(result, collection)
+        self.assertIs(collection.features[0].geometry, line)
+        self.assertIs(line['coordinates'], positions)
+        self.assertEqual(positions, [(10, 2), (30, 4)])
+        self.assertEqual(line.compute_bbox(), [10, 2, 30, 4])
+        point = collection.features[1].geometry.geometries[0]
+        self.assertEqual(point.coordinates, [50, 6])
+
+    def test_map_inplace_tuples(self):
+        polygon = {'type': 'Polygon',
+                   'coordinates': ((((0, 0), (1, 0), (1, 1), (0, 0))),)}
+        result = map_coords(lambda v: v * 2, polygon, inplace=True)
+        self.assertIs(result, polygon)
+        self.assertEqual(polygon['coordinates'],
+                         [[(0, 0), (2, 0), (2, 2), (0, 0)]])
+
+    def test_map_inplace_packed(self):
+        polygon = geojson.Polygon([[(0, 0), (1, 0), (1, 1), (0, 0)]],
+                                  packed=True)
+        values = polygon.coordinates.values
+        # swapping the columns works on NumPy and array('d') columns alike
+        map_tuples(lambda x, y: (y, x), polygon, vectorized=True,
+                   inplace=True)
+        self.assertIs(polygon.coordinates.values, values)
+        self.assertEqual(polygon.coordinates,
+                         [[[0, 0], [0, 1], [1, 1], [0, 0]]])
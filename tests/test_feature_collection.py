@@ -25,3 +25,16 @@ class FeatureCollectionsTest(unittest.TestCase):
         self.assertTrue(isinstance(obj, geojson.FeatureCollection))
         self.assertTrue(isinstance(obj.features[0], geojson.Feature))
         self.assertTrue(obj.is_valid)
+
+    def test_dumps_bbox(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=geojson.LineString([(0, 1), (2, 3)])),
+            geojson.Feature(geometry=geojson.Point((-1, 5))),
+            geojson.Feature(geometry=None),
+        ])
+        decoded = geojson.loads(geojson.dumps(collection, bbox=True))
+        self.assertEqual(decoded.bbox, [-1, 1, 2, 5])
+        self.assertEqual([f.get("bbox") for f in decoded.features],
+                         [[0, 1, 2, 3], [-1, 5, -1, 5], None])
+        self.assertNotIn("bbox", collection)
+        self.assertNotIn("bbox", collection.features[0])
@@ -0,0 +1,98 @@
+"""
+Tests for the spatial index of feature collections
+"""
+
+import random
+import unittest
+
+import geojson
+import geojson.index
+
+
+def random_collection(count, seed=0):
+    rng = random.Random(seed)
+    features = []
+    for i in range(count):
+        x, y = rng.uniform(-180, 170), rng.uniform(-90, 80)
+        if i % 3:
+            geometry = geojson.Point((x, y))
+        else:
+            geometry = geojson.LineString(
+                [(x, y), (x + rng.random() * 10, y + rng.random() * 10)])
+        features.append(geojson.Feature(id=i, geometry=geometry))
+    return geojson.FeatureCollection(features)
+
+
+def scan(collection, bbox):
+    west, south, east, north = bbox
+    found = []
+    for feature in collection.features:
+        box = geojson.utils.bbox(feature)
+        if box and box[0] <= east and box[2] >= west and \
+                box[1] <= north and box[3] >= south:
+            found.append(feature)
+    return found
+
+
+class SpatialIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.collection = random_collection(2000)
+        self.index = self.collection.build_index(node_capacity=8)
+
+    def test_query(self):
+        for bbox in ([0, 0, 20, 20], [-180, -90, 180, 90], [100, -5, 101, 5],
+                     [200, 0, 210, 10]):
+            self.assertEqual(self.index.query(bbox),
+                             scan(self.collection, bbox))
+
+    def test_nearest(self):
+        def distance(feature):
+            return geojson.index._distance(
+                geojson.utils.bbox(feature), 15, 25)
+
+        expected = sorted(self.collection.features, key=distance)[:10]
+        result = self.index.nearest(geojson.Point((15, 25)), k=10)
+        self.assertEqual([distance(f) for f in result],
+                         [distance(f) for f in expected])
+        self.assertEqual(len(self.index.nearest((0, 0), k=5000)), 2000)
+
+    def test_append(self):
+        bbox = [0, 0, 20, 20]
+        for i in range(300):
+            self.collection.features.append(
+                geojson.Feature(id=-i, geometry=geojson.Point((10, i / 10))))
+            if i in (0, 100):
+                self.assertEqual(self.index.query(bbox),
+                                 scan(self.collection, bbox))
+                self.assertEqual(self.index.nearest((10, 0))[0].id, 0)
+        self.assertEqual(self.index.query(bbox), scan(self.collection, bbox))
+        self.assertEqual(len(self.index), 2300)
+        self.assertEqual(self.index._pending, [])
+
+    def test_remove(self):
+        del self.collection.features[100:]
+        self.assertEqual(self.index.query([-180, -90, 180, 90]),
+                         self.collection.features)
+
+    def test_pure_python(self):
+        numpy = geojson.index.numpy
+        geojson.index.numpy = None
+        try:
+            index = self.collection.build_index()
+        finally:
+            geojson.index.numpy = numpy
+        self.assertEqual(index._items, self.collection.build_index()._items)
+
+    def test_empty_and_null_geometries(self):
+        collection = geojson.FeatureCollection(
+            [geojson.Feature(), geojson.Feature(geometry=geojson.Point((1, 1)))])
+        index = collection.build_index()
+        self.assertEqual(index.query([0, 0, 2, 2]), collection.features[1:])
+        self.assertEqual(index.nearest((0, 0), k=3), collection.features[1:])
+        empty = geojson.FeatureCollection([]).build_index()
+        self.assertEqual(empty.query([0, 0, 1, 1]), [])
+        self.assertEqual(empty.nearest((0, 0)), [])
+
+    def test_node_capacity(self):
+        with self.assertRaises(ValueError):
+            self.collection.build_index(node_capacity=1)
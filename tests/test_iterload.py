@@ -0,0 +1,115 @@
+"""
+Tests for geojson.iterload
+"""
+
+import io
+import unittest
+
+import geojson
+
+
+FEATURE_COLLECTION = geojson.FeatureCollection(
+    [geojson.Feature(id=i, geometry=geojson.Point((i, -i)),
+                     properties={"name": f"feature {i}"})
+     for i in range(50)],
+    bbox=[0, -49, 49, 0],
+    crs={"type": "name", "properties": {"name": "EPSG:4326"}},
+)
+
+
+class IterLoadTestCase(unittest.TestCase):
+
+    def test_features_match_load(self):
+        text = geojson.dumps(FEATURE_COLLECTION)
+        expected = geojson.loads(text)['features']
+        features = list(geojson.iterload(io.StringIO(text), chunk_size=7))
+        self.assertEqual(features, expected)
+        self.assertTrue(all(isinstance(f, geojson.Feature) for f in features))
+
+    def test_members(self):
+        text = geojson.dumps(FEATURE_COLLECTION)
+        reader = geojson.iterload(io.StringIO(text), chunk_size=16)
+        for _ in reader:
+            pass
+        self.assertEqual(reader.members['type'], 'FeatureCollection')
+        self.assertEqual(reader.members['bbox'], [0, -49, 49, 0])
+        self.assertEqual(reader.members['crs']['properties']['name'],
+                         'EPSG:4326')
+        self.assertNotIn('features', reader.members)
+
+    def test_members_before_features(self):
+        text = ('{"type": "FeatureCollection", "bbox": [1, 2, 3, 4], '
+                '"features": [{"type": "Feature", "geometry": null, '
+                '"properties": {}}]}')
+        reader = geojson.iterload(io.StringIO(text))
+        next(reader)
+        self.assertEqual(reader.members['bbox'], [1, 2, 3, 4])
+
+    def test_binary_file(self):
+        text = ('{"type": "FeatureCollection", "features": [{"type": '
+                '"Feature", "geometry": null, "properties": {"name": "Zürich"'
+                '}}]}')
+        fp = io.BytesIO(text.encode("utf-8"))
+        features = list(geojson.iterload(fp, chunk_size=1))
+        self.assertEqual(features[0]['properties']['name'], 'Zürich')
+
+    def test_empty_features(self):
+        text = '{"type": "FeatureCollection", "features": [ ]}'
+        self.assertEqual(list(geojson.iterload(io.StringIO(text))), [])
+
+    def test_numbers_split_across_chunks(self):
+        text = '{"features": [], "count": 123456789}'
+        reader = geojson.iterload(io.StringIO(text), chunk_size=4)
+        list(reader)
+        self.assertEqual(reader.members['count'], 123456789)
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            list(geojson.iterload(io.StringIO('[1, 2]')))
+        with self.assertRaises(ValueError):
+            list(geojson.iterload(io.StringIO('{"features": [{"type": }]}')))
+
+    def test_strict_numbers(self):
+        text = ('{"features": [{"type": "Point", '
+                '"coordinates": [1.0, NaN]}]}')
+        with self.assertRaises(ValueError):
+            list(geojson.iterload(io.StringIO(text)))
+
+    def test_invalid_feature_stops_reading(self):
+        features = ",".join(['{"type": "Feature", "geometry": null}'] * 1000)
+        fp = io.StringIO('{"features": [{"type": "Feature", "id": 1, '
+                         '"geometry": nul}, ' + features + ']}')
+        reader = geojson.iterload(fp, chunk_size=64)
+        with self.assertRaises(ValueError):
+            next(reader)
+        self.assertLess(fp.tell(), 1000)
+
+    def test_tokens_split_across_chunks(self):
+        text = ('{"features": [{"type": "Feature", "geometry": null, '
+                '"properties": {"name": "\\ud83d\\ude00 long enough name", '
+                '"flag": false, "none": null}}]}')
+        expected = geojson.loads(text)["features"]
+        for chunk_size in range(1, 40):
+            self.assertEqual(
+                list(geojson.iterload(io.StringIO(text),
+                                      chunk_size=chunk_size)), expected)
+
+    def test_numbers_at_every_chunk_boundary(self):
+        text = ('{"type": "FeatureCollection", "x": 12.5, "y": -1.5e+10, '
+                '"features": [{"type": "Feature", "geometry": {"type": '
+                '"Point", "coordinates": [12.25, -0.5e-3]}, "properties": '
+                '{"n": 1234567}}], "z": 9.75}')
+        expected = geojson.loads(text)
+        for chunk_size in range(1, len(text) + 1):
+            reader = geojson.iterload(io.StringIO(text),
+                                      chunk_size=chunk_size)
+            self.assertEqual(list(reader), expected["features"])
+            self.assertEqual((reader.members["x"], reader.members["y"],
+                              reader.members["z"]), (12.5, -1.5e+10, 9.75))
+
+    def test_not_a_feature_collection(self):
+        for text in ('{"type": "Point", "coordinates": [1, 2]}',
+                     '{"coordinates": [1, 2], "type": "Point"}',
+                     '{"name": "no features"}', '{}'):
+            with self.assertRaises(ValueError):
+                list(geojson.iterload(io.StringIO(text)))
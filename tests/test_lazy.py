@@ -0,0 +1,103 @@
+"""
+Tests for lazily decoded features
+"""
+
+import io
+import json
+import pickle
+import unittest
+
+import geojson
+import geojson.compact
+from geojson.feature import LazyFeature
+
+
+TEXT = (
+    '{"type": "FeatureCollection", "name": "places", "features": [\n'
+    ' {"type":"Feature","id":1,"geometry":{"type":"Point",'
+    '"coordinates":[1.5,2.0]},"properties":{"name":"Zürich"}},\n'
+    ' {"type":"Feature","geometry":{"type":"LineString",'
+    '"coordinates":[[0,0],[1,1.0000001]]},"properties":{"name":"b"}}\n'
+    ']}'
+)
+
+
+class LazyLoadTestCase(unittest.TestCase):
+
+    def test_features_are_lazy(self):
+        collection = geojson.loads(TEXT, lazy=True)
+        self.assertIsInstance(collection, geojson.FeatureCollection)
+        self.assertEqual(collection.name, "places")
+        self.assertEqual([type(f) for f in collection.features],
+                         [LazyFeature, LazyFeature])
+        self.assertTrue(collection.features[1].raw_json.startswith(
+            '{"type":"Feature","geometry"'))
+
+    def test_access_builds_feature(self):
+        collection = geojson.loads(TEXT, lazy=True)
+        feature = collection.features[1]
+        self.assertEqual(feature.properties, {"name": "b"})
+        self.assertIs(type(feature), geojson.Feature)
+        self.assertIsInstance(feature.geometry, geojson.LineString)
+        self.assertEqual(feature.geometry.coordinates, [[0, 0], [1, 1]])
+        self.assertEqual(collection, geojson.loads(TEXT))
+
+    def test_dict_operations(self):
+        for operation in (len, dict, list, lambda f: "id" in f,
+                          lambda f: f == geojson.loads(TEXT).features[0],
+                          lambda f: pickle.loads(pickle.dumps(f))):
+            feature = geojson.loads(TEXT, lazy=True).features[0]
+            result = operation(feature)
+            self.assertIs(type(feature), geojson.Feature)
+            self.assertTrue(result)
+
+    def test_untouched_features_are_written_verbatim(self):
+        collection = geojson.loads(TEXT, lazy=True)
+        raw = [f.raw_json for f in collection.features]
+        text = geojson.dumps(collection)
+        self.assertIn(raw[0], text)
+        self.assertIn(raw[1], text)
+        collection.features[1].properties["name"] = "c"
+        text = geojson.dumps(collection)
+        self.assertIn(raw[0], text)
+        self.assertNotIn(raw[1], text)
+        self.assertEqual(geojson.loads(text).features[1].properties,
+                         {"name": "c"})
+
+    def test_ensure_ascii(self):
+        collection = geojson.loads(TEXT, lazy=True)
+        output = io.StringIO()
+        geojson.dump(collection, output)
+        self.assertTrue(output.getvalue().isascii())
+        self.assertEqual(geojson.loads(output.getvalue()),
+                         geojson.loads(TEXT))
+
+    def test_encoder_options_encode(self):
+        collection = geojson.loads(TEXT, lazy=True)
+        self.assertEqual(geojson.dumps(collection, sort_keys=True),
+                         geojson.dumps(geojson.loads(TEXT), sort_keys=True))
+
+    def test_other_object_hooks(self):
+        collection = geojson.loads(TEXT, lazy=True,
+                                   object_hook=geojson.compact.object_hook)
+        self.assertEqual(collection, geojson.loads(
+            TEXT, object_hook=geojson.compact.object_hook))
+        feature = collection["features"][0]
+        self.assertIsInstance(feature, geojson.compact.Feature)
+        self.assertEqual(feature.geometry.coordinates,
+                         [1.5, 2.0])
+
+        plain = geojson.loads(TEXT, lazy=True, object_hook=None)
+        self.assertIs(type(plain), dict)
+        self.assertIs(type(plain["features"][1]), dict)
+        self.assertEqual(plain, json.loads(TEXT))
+
+    def test_other_documents(self):
+        self.assertEqual(
+            geojson.loads('{"type": "Point", "coordinates": [1, 2]}',
+                          lazy=True),
+            geojson.Point((1, 2)))
+        self.assertEqual(geojson.loads(b'[1, 2]', lazy=True), [1, 2])
+        with self.assertRaises(ValueError):
+            geojson.loads('{"type": "FeatureCollection", "features": [',
+                          lazy=True)
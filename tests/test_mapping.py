@@ -0,0 +1,70 @@
+"""
+Tests for geojson/mapping.py
+"""
+
+import enum
+import json
+import unittest
+from collections import namedtuple
+from decimal import Decimal
+
+import geojson
+from geojson.mapping import normalize, to_mapping
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+class Name(str):
+    pass
+
+
+Position = namedtuple("Position", ["x", "y"])
+
+
+def roundtrip(obj):
+    return json.loads(json.dumps(obj))
+
+
+class NormalizeTestCase(unittest.TestCase):
+
+    VALUES = [
+        (1.5, -2, 3),
+        [(1, 2), [3.25, (4, 5)]],
+        [None, True, False, "text", Name("name"), Color.RED, 1e300],
+        {"a": (1, 2), 3: "int", 2.5: "float", True: "true",
+         None: "null", Name("b"): [{"c": (3,)}]},
+        {float("nan"): 1, float("inf"): 2, float("-inf"): 3},
+        [],
+        (),
+    ]
+
+    def test_matches_json_roundtrip(self):
+        for value in self.VALUES:
+            self.assertEqual(repr(normalize(value)), repr(roundtrip(value)))
+
+    def test_types(self):
+        result = normalize([Name("name"), Color.RED, (1,)])
+        self.assertIs(type(result[0]), str)
+        self.assertIs(type(result[1]), int)
+        self.assertIs(type(result[2]), list)
+
+    def test_simplejson_conversions(self):
+        # as the simplejson round trip normalize replaced did
+        self.assertEqual(normalize([Position(1, (2, 3))]),
+                         [{"x": 1, "y": [2, 3]}])
+        result = normalize({"value": Decimal("1.5")})
+        self.assertEqual(result, {"value": 1.5})
+        self.assertIs(type(result["value"]), float)
+
+    def test_not_serializable(self):
+        for value in ({1, 2}, {(1, 2): "tuple key"},
+                      object()):
+            with self.assertRaises(TypeError):
+                normalize(value)
+
+    def test_to_mapping(self):
+        self.assertEqual(to_mapping((1, (2, 3))), [1, [2, 3]])
+        point = geojson.Point((1, 2))
+        self.assertIs(to_mapping(point), point)
@@ -0,0 +1,147 @@
+"""
+Tests for the spatial predicates of geojson.ops
+"""
+
+import random
+import unittest
+
+import geojson
+import geojson.compact
+import geojson.ops
+
+
+# a square with a square hole
+SQUARE = geojson.Polygon([
+    [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)],
+    [(4, 4), (6, 4), (6, 6), (4, 6), (4, 4)],
+])
+
+
+def random_points(count, seed=0):
+    rng = random.Random(seed)
+    return [(rng.uniform(-5, 15), rng.uniform(-5, 15)) for _ in range(count)]
+
+
+def expected(point):
+    x, y = point
+    return 0 < x < 10 and 0 < y < 10 and not (4 < x < 6 and 4 < y < 6)
+
+
+class ContainsTest(unittest.TestCase):
+    def test_holes(self):
+        self.assertEqual(
+            geojson.ops.contains(SQUARE, [(1, 1), (5, 5), (11, 5), (5, 8)]),
+            [True, False, False, True])
+
+    def test_batches(self):
+        points = random_points(1000)
+        self.assertEqual(geojson.ops.contains(SQUARE, points),
+                         [expected(point) for point in points])
+
+    def test_without_numpy(self):
+        numpy = geojson.ops.numpy
+        geojson.ops.numpy = None
+        try:
+            points = random_points(1000)
+            self.assertEqual(geojson.ops.contains(SQUARE, iter(points)),
+                             [expected(point) for point in points])
+        finally:
+            geojson.ops.numpy = numpy
+
+    @unittest.skipIf(geojson.ops.numpy is None, "requires NumPy")
+    def test_numpy_array(self):
+        points = random_points(100)
+        result = geojson.ops.contains(
+            SQUARE, geojson.ops.numpy.array(points))
+        self.assertEqual(result.tolist(),
+                         [expected(point) for point in points])
+
+    def test_multipolygon_feature(self):
+        polygon = geojson.Feature(geometry=geojson.MultiPolygon([
+            ([(0, 0), (1, 0), (1, 1), (0, 0)],),
+            ([(20, 20), (30, 20), (30, 30), (20, 30), (20, 20)],),
+        ]))
+        points = [(0.8, 0.2), (0.2, 0.8), (25, 25, 100), (15, 15)]
+        self.assertEqual(geojson.ops.contains(polygon, points),
+                         [True, False, True, False])
+        self.assertEqual(geojson.ops.contains(polygon, points * 20),
+                         [True, False, True, False] * 20)
+
+    def test_not_a_polygon(self):
+        with self.assertRaises(ValueError):
+            geojson.ops.contains(geojson.Point((0, 0)), [(0, 0)])
+
+
+class FilterFeaturesTest(unittest.TestCase):
+    def setUp(self):
+        self.collection = geojson.FeatureCollection([
+            geojson.Feature(id=0, geometry=geojson.Point((1, 1))),
+            geojson.Feature(id=1, geometry=geojson.Point((5, 5))),
+            geojson.Feature(id=2, geometry=geojson.LineString(
+                [(1, 1), (3, 3)])),
+            geojson.Feature(id=3, geometry=geojson.LineString(
+                [(1, 1), (5, 5)])),
+            geojson.Feature(id=4, geometry=geojson.Point((20, 20))),
+            geojson.Feature(id=5, geometry=None),
+        ], name="sample")
+
+    def ids(self, features):
+        return [feature["id"] for feature in features]
+
+    def test_intersects_bbox(self):
+        self.assertTrue(geojson.ops.intersects_bbox(
+            self.collection.features[3], [4, 4, 8, 8]))
+        self.assertFalse(geojson.ops.intersects_bbox(
+            self.collection.features[2], [4, 4, 8, 8]))
+        self.assertFalse(geojson.ops.intersects_bbox(
+            self.collection.features[5], [4, 4, 8, 8]))
+
+    def test_bbox(self):
+        result = geojson.ops.filter_features(self.collection,
+                                             bbox=[2, 2, 30, 30])
+        self.assertEqual(self.ids(result["features"]), [1, 2, 3, 4])
+        self.assertEqual(result["name"], "sample")
+        self.assertEqual(len(self.collection.features), 6)
+
+    def test_within(self):
+        result = geojson.ops.filter_features(self.collection, within=SQUARE)
+        self.assertEqual(self.ids(result["features"]), [0, 2])
+
+    def test_within_crossing_edges(self):
+        # a U shape, notched from the top between x=4 and x=6
+        notched = geojson.Polygon([[(0, 0), (10, 0), (10, 10), (6, 10),
+                                    (6, 4), (4, 4), (4, 10), (0, 10),
+                                    (0, 0)]])
+        features = [
+            geojson.Feature(id=0, geometry=geojson.LineString(
+                [(1, 1), (9, 9)])),
+            geojson.Feature(id=1, geometry=geojson.LineString(
+                [(1, 1), (3, 9)])),
+            geojson.Feature(id=2, geometry=geojson.LineString(
+                [(2, 8), (8, 8)], packed=True)),
+            geojson.Feature(id=3, geometry=geojson.LineString(
+                [(1, 2), (9, 2)])),
+            geojson.Feature(id=4, geometry=geojson.Polygon(
+                [[(1, 5), (9, 5), (9, 6), (1, 6), (1, 5)]])),
+            geojson.Feature(id=5, geometry=geojson.GeometryCollection(
+                [geojson.Point((1, 1)),
+                 geojson.LineString([(2, 8), (8, 8)])])),
+        ]
+        self.assertEqual(
+            self.ids(geojson.ops.filter_features(features, within=SQUARE)),
+            [1, 2, 3, 5])
+        self.assertEqual(
+            self.ids(geojson.ops.filter_features(features, within=notched)),
+            [1, 3])
+
+    def test_bbox_and_within(self):
+        result = geojson.ops.filter_features(
+            self.collection.features, bbox=[2, 2, 30, 30], within=SQUARE)
+        self.assertEqual(self.ids(result), [2])
+
+    def test_compact_features(self):
+        collection = geojson.loads(geojson.dumps(self.collection),
+                                   object_hook=geojson.compact.object_hook)
+        result = geojson.ops.filter_features(collection, within=SQUARE)
+        self.assertEqual([feature.id for feature in result["features"]],
+                         [0, 2])
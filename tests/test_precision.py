@@ -0,0 +1,134 @@
+"""
+Tests for formatting coordinates to a given precision when encoding
+"""
+
+import io
+import json
+import unittest
+
+import geojson
+import geojson.compact
+from geojson.coordinates import CoordinateArray
+
+
+def rounded(coordinates, precision):
+    if isinstance(coordinates, (list, tuple)):
+        return [rounded(item, precision) for item in coordinates]
+    return round(coordinates, precision)
+
+
+class CoordPrecisionTestCase(unittest.TestCase):
+
+    def test_geometries(self):
+        geometries = [
+            geojson.Point((-115.123456789, 37.1), trusted=True),
+            geojson.LineString([(1.23456789, 2), (100, -0.5)], trusted=True),
+            geojson.Polygon([[(0, 0), (1.0000001, 0), (1, 1.66666666),
+                              (0, 0)]], trusted=True),
+            geojson.MultiPolygon([([(0, 0), (1, 0), (1, 1), (0, 0)],),
+                                  ([(2.22222222, 2, 9.99999999), (3, 2, 1),
+                                    (3, 3, 1), (2.22222222, 2, 9.99999999)],
+                                   )], trusted=True),
+        ]
+        for geometry in geometries:
+            text = geojson.dumps(geometry, coord_precision=3)
+            self.assertEqual(json.loads(text)["coordinates"],
+                             rounded(geometry.coordinates, 3))
+
+    def test_format(self):
+        point = geojson.Point((-0.0000001, 100.0000004), trusted=True)
+        self.assertEqual(geojson.dumps(point, coord_precision=6),
+                         '{"type": "Point", "coordinates": [-0, 100]}')
+        self.assertEqual(geojson.dumps(point, coord_precision=0),
+                         '{"type": "Point", "coordinates": [-0, 100]}')
+        line = geojson.LineString([(1.5, 2.25), (10.1, 20)])
+        self.assertEqual(geojson.dumps(line, coord_precision=1),
+                         '{"type": "LineString", '
+                         '"coordinates": [[1.5, 2.2], [10.1, 20]]}')
+
+    def test_feature_collection(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(id=i, geometry=geojson.Point(
+                (i / 3, i / 7), trusted=True), properties={"x": i / 3})
+            for i in range(5)
+        ] + [geojson.Feature(geometry=geojson.GeometryCollection([
+            geojson.Point((1 / 3, 2 / 3), trusted=True)]))],
+            name="thirds")
+        decoded = json.loads(geojson.dumps(collection, coord_precision=2,
+                                           bbox=True))
+        self.assertEqual(decoded["features"][1]["geometry"]["coordinates"],
+                         [0.33, 0.14])
+        self.assertEqual(decoded["features"][1]["properties"], {"x": 1 / 3})
+        self.assertEqual(decoded["features"][5]["geometry"]["geometries"][0],
+                         {"type": "Point", "coordinates": [0.33, 0.67]})
+        self.assertEqual(decoded["bbox"], [0, 0, 1.33, 0.67])
+        self.assertEqual(decoded["name"], "thirds")
+
+    def test_encoder_options(self):
+        feature = geojson.Feature(geometry=geojson.LineString(
+            [(1 / 3, 1), (2, 2 / 3)], trusted=True), properties={"b": 1})
+        self.assertEqual(
+            geojson.dumps(feature, coord_precision=2, sort_keys=True,
+                          separators=(",", ":")),
+            '{"geometry":{"coordinates":[[0.33,1],[2,0.67]],'
+            '"type":"LineString"},"properties":{"b":1},"type":"Feature"}')
+        indented = geojson.dumps(feature, coord_precision=2, indent=2)
+        self.assertIn('"coordinates": [[0.33, 1], [2, 0.67]]', indented)
+
+        fp = io.StringIO()
+        geojson.dump(feature, fp, coord_precision=1)
+        self.assertEqual(json.loads(fp.getvalue()), json.loads(
+            geojson.dumps(feature, coord_precision=1)))
+
+    def test_packed_and_compact(self):
+        polygon = geojson.Polygon(
+            coordinates=CoordinateArray([0, 0, 1 / 3, 0, 1, 1, 0, 0],
+                                        offsets=[[0, 4]]))
+        self.assertEqual(
+            json.loads(geojson.dumps(polygon, coord_precision=2))[
+                "coordinates"],
+            [[[0, 0], [0.33, 0], [1, 1], [0, 0]]])
+        feature = geojson.loads(
+            '{"type": "Feature", "geometry": {"type": "Point", '
+            '"coordinates": [0.123456, 1]}, "properties": {}}',
+            object_hook=geojson.compact.object_hook)
+        self.assertIn('[0.12, 1]', geojson.dumps(feature, coord_precision=2))
+
+    def test_lazy_features(self):
+        text = geojson.dumps(geojson.FeatureCollection(
+            [geojson.Feature(geometry=geojson.Point((1 / 3, 0),
+                                                    trusted=True))]))
+        collection = geojson.loads(text, lazy=True)
+        self.assertIn("[0.3, 0]", geojson.dumps(collection, coord_precision=1))
+
+    def test_not_finite(self):
+        point = geojson.Point((float("nan"), 1.23), trusted=True)
+        with self.assertRaises(ValueError):
+            geojson.dumps(point, coord_precision=1)
+        self.assertEqual(
+            geojson.dumps(point, coord_precision=1, allow_nan=True),
+            '{"type": "Point", "coordinates": [NaN, 1.2]}')
+
+    def test_negative_precision(self):
+        with self.assertRaises(ValueError):
+            geojson.dumps(geojson.Point((1, 2)), coord_precision=-1)
+
+    def test_writer(self):
+        fp = io.StringIO()
+        with geojson.FeatureCollectionWriter(fp, coord_precision=1) as writer:
+            writer.write(geojson.Feature(geometry=geojson.Point(
+                (1 / 3, 2 / 3), trusted=True)))
+        self.assertIn("[0.3, 0.7]", fp.getvalue())
+
+    def test_empty_first_part(self):
+        ring = [(0, 0), (1 / 3, 0), (1 / 3, 1 / 3), (0, 0)]
+        for geometry, expected in [
+                (geojson.MultiLineString([[], [(0, 0), (1 / 3, 1)]]),
+                 '[[], [[0, 0], [0.3, 1]]]'),
+                (geojson.Polygon([[], ring]),
+                 '[[], [[0, 0], [0.3, 0], [0.3, 0.3], [0, 0]]]'),
+                (geojson.MultiPolygon([[], [[], ring]]),
+                 '[[], [[], [[0, 0], [0.3, 0], [0.3, 0.3], [0, 0]]]]'),
+                (geojson.MultiPolygon([[[], []]]), '[[[], []]]')]:
+            self.assertIn(expected, geojson.dumps(geometry,
+                                                  coord_precision=1))
@@ -0,0 +1,153 @@
+"""
+Tests for quantized, delta-encoded coordinates
+"""
+
+import io
+import json
+import random
+import unittest
+
+import geojson
+import geojson.codec
+import geojson.compact
+from geojson.utils import coords
+
+
+def random_collection(seed=0):
+    rng = random.Random(seed)
+
+    def line(count):
+        x, y = rng.uniform(-10, 10), rng.uniform(-10, 10)
+        positions = []
+        for _ in range(count):
+            x, y = x + rng.uniform(-1, 1), y + rng.uniform(-1, 1)
+            positions.append([x, y])
+        return positions
+
+    def ring(count):
+        positions = line(count)
+        return positions + [positions[0]]
+
+    return geojson.FeatureCollection([
+        geojson.Feature(id=0, geometry=geojson.Point(line(1)[0],
+                                                     trusted=True)),
+        geojson.Feature(id=1, geometry=geojson.MultiPoint(line(5),
+                                                          trusted=True)),
+        geojson.Feature(id=2, geometry=geojson.LineString(line(100),
+                                                          trusted=True)),
+        geojson.Feature(id=3, geometry=geojson.MultiLineString(
+            [line(50), line(2)], trusted=True)),
+        geojson.Feature(id=4, geometry=geojson.Polygon(
+            [ring(60), ring(10)], trusted=True)),
+        geojson.Feature(id=5, geometry=geojson.MultiPolygon(
+            [[ring(20)], [ring(30), ring(5)]], trusted=True)),
+        geojson.Feature(id=6, geometry=geojson.GeometryCollection(
+            [geojson.LineString(line(10), trusted=True)])),
+        geojson.Feature(id=7, geometry=None),
+    ], name="random")
+
+
+class QuantizeTestCase(unittest.TestCase):
+
+    def test_format(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=geojson.Point((2, 4))),
+            geojson.Feature(geometry=geojson.MultiPoint([(0, 0), (8, 4)])),
+            geojson.Feature(geometry=geojson.LineString(
+                [(0, 0), (4, 2), (8, 4)])),
+        ])
+        encoded = json.loads(geojson.dumps(collection, quantize=5))
+        self.assertEqual(encoded["transform"],
+                         {"scale": [2, 1], "translate": [0, 0]})
+        self.assertEqual([feature["geometry"]["coordinates"]
+                          for feature in encoded["features"]],
+                         [[1, 4], [[0, 0], [4, 4]], [[0, 0], [2, 2], [2, 2]]])
+
+    def test_round_trip(self):
+        collection = random_collection()
+        text = geojson.dumps(collection, quantize=10000)
+        transform = json.loads(text)["transform"]
+        decoded = geojson.loads(text, dequantize=True)
+        self.assertNotIn("transform", decoded)
+        self.assertEqual(decoded.name, "random")
+        self.assertEqual(decoded.features[7].geometry, None)
+        (kx, ky), _ = transform["scale"], transform["translate"]
+        for original, position in zip(coords(collection), coords(decoded)):
+            self.assertLessEqual(abs(position[0] - original[0]),
+                                 kx / 2 * 1.0001)
+            self.assertLessEqual(abs(position[1] - original[1]),
+                                 ky / 2 * 1.0001)
+        for feature in decoded.features:
+            self.assertTrue(feature.is_valid)
+
+    def test_without_numpy(self):
+        collection = random_collection()
+        text = geojson.dumps(collection, quantize=1000)
+        numpy = geojson.codec.numpy
+        geojson.codec.numpy = None
+        try:
+            self.assertEqual(geojson.dumps(collection, quantize=1000), text)
+        finally:
+            geojson.codec.numpy = numpy
+
+    def test_elevation(self):
+        line = geojson.LineString([(0, 0, 10.5), (10, 10, 11.5)])
+        encoded = json.loads(geojson.dumps(line, quantize=11))
+        self.assertEqual(encoded["coordinates"],
+                         [[0, 0, 10.5], [10, 10, 11.5]])
+        self.assertEqual(geojson.loads(json.dumps(encoded), dequantize=True),
+                         line)
+
+    def test_decoding(self):
+        point = geojson.Point((1.25, 2.5))
+        text = geojson.dumps(point, quantize=10)
+        self.assertIn("transform", geojson.loads(text))
+        self.assertEqual(geojson.loads(text, dequantize=True), point)
+        self.assertEqual(geojson.load(io.StringIO(text), dequantize=True),
+                         point)
+        # documents without a transform are left as they are
+        self.assertEqual(geojson.loads(geojson.dumps(point),
+                                       dequantize=True), point)
+
+    def test_lazy_and_compact(self):
+        collection = random_collection()
+        text = geojson.dumps(collection, quantize=1000)
+        expected = geojson.loads(text, dequantize=True)
+
+        lazy = geojson.loads(text, lazy=True, dequantize=True)
+        self.assertEqual(lazy, expected)
+        plain = geojson.dumps(collection)
+        self.assertEqual(
+            geojson.dumps(geojson.loads(plain, lazy=True), quantize=1000),
+            geojson.dumps(geojson.loads(plain), quantize=1000))
+
+        compact = geojson.loads(text, dequantize=True,
+                                object_hook=geojson.compact.object_hook)
+        self.assertEqual(geojson.dumps(compact), geojson.dumps(expected))
+
+        feature = geojson.compact.Feature(
+            geometry=geojson.compact.LineString([(0, 0), (3, 3)]))
+        decoded = geojson.loads(geojson.dumps(feature, quantize=4),
+                                dequantize=True,
+                                object_hook=geojson.compact.object_hook)
+        self.assertEqual(decoded.geometry.coordinates, [[0, 0], [3, 3]])
+        self.assertFalse(decoded.extra)
+
+    def test_packed(self):
+        polygon = geojson.Polygon([[(0, 0), (4, 0), (4, 4), (0, 0)]],
+                                  packed=True)
+        self.assertEqual(
+            json.loads(geojson.dumps(polygon, quantize=5))["coordinates"],
+            [[[0, 0], [4, 0], [0, 4], [-4, -4]]])
+
+    def test_invalid(self):
+        point = geojson.Point((1, 2))
+        for quantize in (1, 2.5, True):
+            with self.assertRaises(ValueError):
+                geojson.dumps(point, quantize=quantize)
+        with self.assertRaises(ValueError):
+            geojson.dumps(geojson.Point((float("nan"), 0), trusted=True),
+                          quantize=10)
+        with self.assertRaises(ValueError):
+            geojson.loads('{"type": "Point", "coordinates": [1, 2], '
+                          '"transform": {"scale": 2}}', dequantize=True)
@@ -0,0 +1,111 @@
+"""
+Tests for GeoJSON text sequences (RFC 8142 and newline-delimited GeoJSON)
+"""
+
+import io
+import unittest
+
+import geojson
+
+
+FEATURES = [geojson.Feature(id=i, geometry=geojson.Point((i, i + 0.5)))
+            for i in range(5)]
+
+
+class DumpSeqTestCase(unittest.TestCase):
+
+    def test_newline_delimited(self):
+        fp = io.StringIO()
+        geojson.dump_seq(FEATURES, fp, batch_size=2)
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(geojson.loads(lines[3]), FEATURES[3])
+
+    def test_record_separator(self):
+        fp = io.StringIO()
+        geojson.dump_seq(FEATURES, fp, rs=True)
+        records = fp.getvalue().split("\x1e")
+        self.assertEqual(records[0], "")
+        self.assertEqual(len(records), 6)
+        self.assertTrue(all(r.endswith("\n") for r in records[1:]))
+
+    def test_feature_collection(self):
+        fp = io.StringIO()
+        geojson.dump_seq(geojson.FeatureCollection(FEATURES), fp)
+        self.assertEqual(len(fp.getvalue().splitlines()), 5)
+
+    def test_single_object(self):
+        fp = io.StringIO()
+        geojson.dump_seq(FEATURES[0], fp)
+        self.assertEqual(len(fp.getvalue().splitlines()), 1)
+
+    def test_strict_numbers(self):
+        with self.assertRaises(ValueError):
+            geojson.dump_seq([{"type": "Point",
+                               "coordinates": [float("nan"), 0]}],
+                             io.StringIO())
+
+
+class LoadSeqTestCase(unittest.TestCase):
+
+    def _roundtrip(self, rs):
+        fp = io.StringIO()
+        geojson.dump_seq(FEATURES, fp, rs=rs)
+        fp.seek(0)
+        return list(geojson.load_seq(fp))
+
+    def test_roundtrip(self):
+        self.assertEqual(self._roundtrip(rs=False), FEATURES)
+        self.assertEqual(self._roundtrip(rs=True), FEATURES)
+        self.assertIsInstance(self._roundtrip(rs=True)[0], geojson.Feature)
+
+    def test_lazy(self):
+        lines = iter(['{"type": "Point", "coordinates": [1, 2]}\n', 'oops\n'])
+        records = geojson.load_seq(lines)
+        self.assertEqual(next(records), geojson.Point((1, 2)))
+        with self.assertRaises(ValueError):
+            next(records)
+
+    def test_multiline_records(self):
+        fp = io.StringIO('\x1e{"type": "Point",\n"coordinates": [1, 2]}\n'
+                         '\x1e{"type": "Point", "coordinates": [3, 4]}\n')
+        self.assertEqual(list(geojson.load_seq(fp)),
+                         [geojson.Point((1, 2)), geojson.Point((3, 4))])
+
+    def test_invalid_record(self):
+        fp = io.StringIO('{"type": "Point", "coordinates": [1, 2]}\n'
+                         '\n'
+                         '{"type": "Point", "coordinates": [1, \n'
+                         '{"type": "Point", "coordinates": [3, NaN]}\n'
+                         '{"type": "Point", "coordinates": [3, 4]}\n')
+        with self.assertRaisesRegex(ValueError, "record 3"):
+            list(geojson.load_seq(fp))
+        fp.seek(0)
+        self.assertEqual(list(geojson.load_seq(fp, skip_invalid=True)),
+                         [geojson.Point((1, 2)), geojson.Point((3, 4))])
+
+    def test_invalid_object(self):
+        lines = ['{"type": "Point", "coordinates": 5}\n',
+                 '{"type": "Point", "coordinates": [3, 4]}\n']
+        with self.assertRaisesRegex(ValueError, "record 1"):
+            list(geojson.load_seq(lines))
+        self.assertEqual(list(geojson.load_seq(lines, skip_invalid=True)),
+                         [geojson.Point((3, 4))])
+
+    def test_binary(self):
+        fp = io.BytesIO('{"type": "Point", "coordinates": [1, 2]}\n'
+                        '\x1e{"type": "Feature", "geometry": null,\n'
+                        '"properties": {"name": "Zürich"}}\n'
+                        '\x1e\xff\n'.encode("utf-8") + b'\x1e\xff\n')
+        records = geojson.load_seq(fp, skip_invalid=True)
+        self.assertEqual(next(records), geojson.Point((1, 2)))
+        self.assertEqual(next(records).properties, {"name": "Zürich"})
+        self.assertEqual(list(records), [])
+
+    def test_byte_order_mark(self):
+        for rs in ("", "\x1e"):
+            text = (rs + '{"type": "Point", "coordinates": [1, 2]}\n') * 2
+            for fp in (io.BytesIO(text.encode("utf-8-sig")),
+                       io.StringIO("\ufeff" + text)):
+                self.assertEqual(list(geojson.load_seq(fp)),
+                                 [geojson.Point((1, 2))] * 2)
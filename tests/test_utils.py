@@ -2,11 +2,14 @@
 Tests for geojson generation
 """
 
+import math
 import random
 import unittest
 
 import geojson
-from geojson.utils import generate_random, map_geometries
+import geojson.utils
+from geojson.utils import bbox, generate_random, map_geometries
+from geojson.utils import generate_random_collection
 
 
 def generate_bbox():
@@ -72,6 +75,64 @@ class TestGenerateRandom(unittest.TestCase):
         with self.assertRaises(ValueError):
             generate_random("MultiPolygon")
 
+    def test_seed(self):
+        for type_ in ("Point", "LineString", "Polygon"):
+            self.assertEqual(generate_random(type_, seed=7),
+                             generate_random(type_, seed=7))
+        self.assertNotEqual(generate_random("Polygon", seed=7),
+                            generate_random("Polygon", seed=8))
+
+
+class TestGenerateRandomCollection(unittest.TestCase):
+    TYPES = ("Point", "MultiPoint", "LineString", "MultiLineString",
+             "Polygon", "MultiPolygon")
+
+    def check_collection(self):
+        area = [-10.0, 40.0, 5.0, 50.0]
+        collection = generate_random_collection(
+            50, types=self.TYPES, seed=3, vertices=5, parts=2, bbox=area,
+            properties=lambda i, rng: {"speed": rng.random(), "even": i % 2})
+        self.assertTrue(collection.is_valid)
+        self.assertEqual(len(collection.features), 50)
+        for i, feature in enumerate(collection.features):
+            self.assertEqual(feature.id, i)
+            self.assertEqual(feature.geometry.type, self.TYPES[i % 6])
+            self.assertEqual(feature.properties["even"], i % 2)
+        polygon = collection.features[4].geometry
+        self.assertEqual(len(polygon.coordinates[0]), 6)
+        self.assertEqual(len(collection.features[5].geometry.coordinates), 2)
+        self.assertEqual(
+            len(collection.features[3].geometry.coordinates[1]), 5)
+        box = bbox(collection)
+        self.assertTrue(area[0] <= box[0] and box[2] <= area[2])
+        self.assertTrue(area[1] <= box[1] and box[3] <= area[3])
+        self.assertEqual(collection, generate_random_collection(
+            50, types=self.TYPES, seed=3, vertices=5, parts=2, bbox=area,
+            properties=lambda i, rng: {"speed": rng.random(), "even": i % 2}))
+
+    def test_collection(self):
+        self.check_collection()
+
+    def test_without_numpy(self):
+        numpy = geojson.utils.numpy
+        geojson.utils.numpy = None
+        try:
+            self.check_collection()
+        finally:
+            geojson.utils.numpy = numpy
+
+    def test_defaults(self):
+        collection = generate_random_collection(4)
+        self.assertEqual([f.geometry.type for f in collection.features],
+                         ["Point", "LineString", "Polygon", "Point"])
+        self.assertEqual(collection.features[0].properties, {})
+
+    def test_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            generate_random_collection(3, types=("GeometryCollection",))
+        with self.assertRaises(ValueError):
+            generate_random_collection(3, types=())
+
 
 class TestMapGeometries(unittest.TestCase):
     def test_with_simple_type(self):
@@ -97,3 +158,198 @@ class TestMapGeometries(unittest.TestCase):
         invalid_object = geojson.Feature(type="InvalidType")
         with self.assertRaises(ValueError):
             map_geometries(lambda g: g, invalid_object)
+
+
+class TestBbox(unittest.TestCase):
+    polygon = [[(0, 0), (4, 0), (4, 3), (0, 0)],
+               [(1, 1), (2, 1), (2, 2), (1, 1)]]
+
+    def test_geometries(self):
+        self.assertEqual(bbox(geojson.Point((1, 2))), [1, 2, 1, 2])
+        self.assertEqual(bbox(geojson.Polygon(self.polygon)), [0, 0, 4, 3])
+        self.assertEqual(
+            bbox(geojson.MultiPolygon([self.polygon, [[(-1, 5), (0, 5),
+                                                       (0, 6), (-1, 5)]]])),
+            [-1, 0, 4, 6])
+        self.assertIsNone(bbox(geojson.MultiPoint([])))
+
+    def test_elevation(self):
+        line = geojson.LineString([(0, 0, 10), (1, 2, -3)])
+        self.assertEqual(bbox(line), [0, 0, -3, 1, 2, 10])
+        mixed = geojson.MultiPoint([(0, 0, 10), (1, 2)])
+        self.assertEqual(bbox(mixed), [0, 0, 1, 2])
+        collection = geojson.GeometryCollection(
+            [line, geojson.Point((5, 5))])
+        self.assertEqual(bbox(collection), [0, 0, 5, 5])
+
+    def test_packed(self):
+        polygon = geojson.Polygon(self.polygon, packed=True)
+        self.assertEqual(bbox(polygon), [0, 0, 4, 3])
+        point = geojson.Point((1, 2, 3), packed=True)
+        self.assertEqual(bbox(point), [1, 2, 3, 1, 2, 3])
+
+    def test_features(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=geojson.Polygon(self.polygon)),
+            geojson.Feature(geometry=None),
+            {"type": "Feature",
+             "geometry": {"type": "Point", "coordinates": [-5, 1]}},
+        ])
+        self.assertEqual(bbox(collection), [-5, 0, 4, 3])
+        self.assertEqual(collection.compute_bbox(), [-5, 0, 4, 3])
+        self.assertIsNone(bbox(geojson.Feature()))
+        self.assertNotIn("bbox", collection)
+
+    def test_cache(self):
+        polygon = geojson.Polygon(self.polygon)
+        result = polygon.compute_bbox()
+        result[0] = 100
+        self.assertEqual(polygon.compute_bbox(), [0, 0, 4, 3])
+        polygon.coordinates = [[(5, 5), (6, 5), (6, 6), (5, 5)]]
+        self.assertEqual(polygon.compute_bbox(), [5, 5, 6, 6])
+
+    def test_cache_in_place(self):
+        line = geojson.LineString([(0, 0), (1, 1)])
+        self.assertEqual(line.compute_bbox(), [0, 0, 1, 1])
+        self.assertNotIn(line.coordinates, line.__dict__.values())
+        line.coordinates.append([9, 9])
+        self.assertEqual(geojson.loads(geojson.dumps(line, bbox=True)).bbox,
+                         [0, 0, 9, 9])
+        line.coordinates = line.coordinates
+        self.assertEqual(line.compute_bbox(), [0, 0, 9, 9])
+        line.update(coordinates=[(2, 2), (3, 3)])
+        self.assertEqual(line.compute_bbox(), [2, 2, 3, 3])
+        geojson.utils.map_tuples(lambda c: (c[0] * 2, c[1] * 2), line,
+                                 inplace=True)
+        self.assertEqual(line.compute_bbox(), [4, 4, 6, 6])
+
+
+def simplify_recursive(positions, tolerance):
+    # the textbook Douglas-Peucker algorithm
+    if len(positions) < 3:
+        return positions
+    (ax, ay), (bx, by) = positions[0], positions[-1]
+    length = math.hypot(bx - ax, by - ay)
+    distances = [abs((bx - ax) * (y - ay) - (by - ay) * (x - ax)) / length
+                 for x, y in positions[1:-1]]
+    index = max(range(len(distances)), key=distances.__getitem__) + 1
+    if distances[index - 1] <= tolerance:
+        return [positions[0], positions[-1]]
+    return simplify_recursive(positions[:index + 1], tolerance)[:-1] + \
+        simplify_recursive(positions[index:], tolerance)
+
+
+class TestSimplify(unittest.TestCase):
+    line = [(0, 0), (1, 0.1), (2, -0.1), (3, 5), (4, 6), (5, 7), (6, 8.1),
+            (7, 9)]
+    circle = [[(math.cos(i * math.pi / 50), math.sin(i * math.pi / 50))
+               for i in range(100)] + [(1, 0)]]
+
+    def random_line(self, count):
+        rng = random.Random(count)
+        return [(i + rng.random(), rng.gauss(0, 10)) for i in range(count)]
+
+    def test_douglas_peucker(self):
+        line = geojson.LineString(self.line)
+        self.assertEqual(geojson.utils.simplify(line, 1)["coordinates"],
+                         [[0, 0], [2, -0.1], [3, 5], [7, 9]])
+        self.assertEqual(
+            geojson.utils.simplify(line, max_vertices=3)["coordinates"],
+            [[0, 0], [2, -0.1], [7, 9]])
+        self.assertEqual(len(line.coordinates), len(self.line))
+
+    def test_matches_recursive(self):
+        for count in (50, 1000):
+            positions = self.random_line(count)
+            for tolerance in (0.5, 3, 10):
+                self.assertEqual(
+                    geojson.utils.simplify(
+                        {"type": "LineString", "coordinates": positions},
+                        tolerance)["coordinates"],
+                    simplify_recursive(positions, tolerance))
+
+    def test_without_numpy(self):
+        numpy = geojson.utils.numpy
+        geojson.utils.numpy = None
+        try:
+            self.test_matches_recursive()
+            self.test_visvalingam()
+        finally:
+            geojson.utils.numpy = numpy
+
+    def test_visvalingam(self):
+        line = {"type": "LineString", "coordinates": self.line}
+        self.assertEqual(
+            geojson.utils.simplify(line, 1,
+                                   method="visvalingam")["coordinates"],
+            [(0, 0), (2, -0.1), (3, 5), (7, 9)])
+        self.assertEqual(
+            geojson.utils.simplify(line, max_vertices=3,
+                                   method="visvalingam")["coordinates"],
+            [(0, 0), (3, 5), (7, 9)])
+        line["coordinates"] = self.random_line(500)
+        lengths = [len(geojson.utils.simplify(
+            line, tolerance, method="visvalingam")["coordinates"])
+            for tolerance in (0, 1, 10, 100)]
+        self.assertEqual(lengths, sorted(lengths, reverse=True))
+
+    def test_polygons(self):
+        for method in ("douglas-peucker", "visvalingam"):
+            polygon = geojson.Polygon(self.circle)
+            for tolerance in (0, 0.01, 10):
+                result = geojson.Polygon(**geojson.utils.simplify(
+                    polygon, tolerance, method=method))
+                self.assertTrue(result.is_valid)
+            self.assertEqual(len(result.coordinates[0]), 4)
+            result = geojson.utils.simplify(
+                geojson.MultiPolygon([self.circle, self.circle]),
+                max_vertices=20, method=method)
+            self.assertEqual([len(ring) for polygon in result["coordinates"]
+                              for ring in polygon], [20, 20])
+            self.assertEqual(len(geojson.utils.simplify(
+                polygon, max_vertices=2, method=method)["coordinates"][0]), 4)
+
+    def test_collections(self):
+        collection = geojson.FeatureCollection([
+            geojson.Feature(id=0, geometry=geojson.MultiLineString(
+                [self.line, self.line[:2]])),
+            geojson.Feature(id=1, geometry=geojson.GeometryCollection([
+                geojson.Point((1, 2)),
+                geojson.MultiPoint(self.line),
+                geojson.Polygon(self.circle, packed=True)])),
+            geojson.Feature(id=2, geometry=None),
+        ], name="shapes")
+        result = geojson.utils.simplify(collection, 1)
+        self.assertEqual(result["name"], "shapes")
+        self.assertEqual([len(line) for line in result["features"][0][
+            "geometry"]["coordinates"]], [4, 2])
+        point, points, polygon = result["features"][1]["geometry"][
+            "geometries"]
+        self.assertEqual(point, geojson.Point((1, 2)))
+        self.assertEqual(len(points["coordinates"]), len(self.line))
+        self.assertIsInstance(polygon["coordinates"],
+                              geojson.coordinates.CoordinateArray)
+        self.assertEqual(len(polygon["coordinates"][0]), 4)
+        self.assertEqual(len(collection.features[1].geometry.geometries[2]
+                             .coordinates[0]), 101)
+
+    def test_inplace(self):
+        polygon = geojson.Polygon(self.circle)
+        bbox(polygon)
+        coordinates = polygon.coordinates
+        result = geojson.utils.simplify(polygon, 0.1, inplace=True)
+        self.assertIs(result, polygon)
+        self.assertIs(polygon.coordinates, coordinates)
+        self.assertLess(len(coordinates[0]), 101)
+        self.assertTrue(polygon.is_valid)
+
+    def test_elevation(self):
+        line = geojson.LineString([(0, 0, 5), (1, 0.01, 6), (2, 0, 7)])
+        self.assertEqual(geojson.utils.simplify(line, 1)["coordinates"],
+                         [[0, 0, 5], [2, 0, 7]])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            geojson.utils.simplify(geojson.Point((0, 0)), method="fast")
+        with self.assertRaises(ValueError):
+            geojson.utils.simplify({"type": "Curve", "coordinates": []})
@@ -193,3 +193,132 @@ class TestValidationGeometryCollection(unittest.TestCase):
                 geometries=[point, poly]
             )
         self.assertTrue(geom_collection.is_valid)
+
+
+class TestValidationEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = geojson.FeatureCollection([
+            geojson.Feature(geometry=geojson.Point((1, 2))),
+            geojson.Feature(geometry=geojson.Polygon(
+                [[(0, 0), (1, 0), (1, 1), (0, 0)],
+                 [(0, 0), (1, 0), (1, 1), (2, 2)],
+                 [(0, 0), (1, 0), (0, 0)]])),
+            geojson.Feature(geometry=None),
+            geojson.Feature(geometry=geojson.MultiLineString(
+                [[(0, 0), (1, 2, 3, 4)], [(0, 0)]])),
+        ])
+
+    def test_valid(self):
+        self.assertEqual(geojson.validate(geojson.Point((1, 2))), [])
+        self.assertEqual(geojson.validate(
+            geojson.GeometryCollection([geojson.Point((1, 2))])), [])
+
+    def test_errors(self):
+        self.assertEqual(geojson.validate(self.collection), [
+            ('/features/1/geometry/coordinates/1',
+             'Each linear ring must end where it started'),
+            ('/features/1/geometry/coordinates/2',
+             'Each linear ring must contain at least 4 positions'),
+            ('/features/3/geometry/coordinates/0/1',
+             'a position must have exactly 2 or 3 values'),
+            ('/features/3/geometry/coordinates/1',
+             'the "coordinates" member must be an array of two or more '
+             'positions'),
+        ])
+        self.assertFalse(self.collection.is_valid)
+
+    def test_max_errors(self):
+        errors = geojson.validate(self.collection, max_errors=1)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].path, '/features/1/geometry/coordinates/1')
+
+    def test_plain_dicts(self):
+        errors = geojson.validate(
+            {"type": "Feature", "properties": {},
+             "geometry": {"type": "Point", "coordinates": [1, [2]]}})
+        self.assertEqual(errors, [('/geometry/coordinates',
+                                   'a position cannot have inner positions')])
+
+    def test_unknown_type(self):
+        errors = geojson.validate({"type": "Pointy", "coordinates": [1, 2]})
+        self.assertEqual(errors[0].path, '/type')
+
+    def test_feature_stream(self):
+        errors = geojson.validate(iter(self.collection.features))
+        self.assertEqual(errors, geojson.validate(self.collection))
+
+    def test_not_objects(self):
+        for obj, path in [
+                ({"type": "Feature", "geometry": "x"}, '/geometry'),
+                ({"type": "Feature", "geometry": 5}, '/geometry'),
+                ({"type": "FeatureCollection", "features": [None]},
+                 '/features/0'),
+                ({"type": "GeometryCollection", "geometries": [None]},
+                 '/geometries/0'),
+                ("x", ''),
+                (5, '')]:
+            errors = geojson.validate(obj)
+            self.assertEqual(len(errors), 1, obj)
+            self.assertEqual(errors[0].path, path)
+            self.assertIn('is not a GeoJSON object', errors[0].message)
+        errors = geojson.validate([{"type": "Point", "coordinates": [1]}, []])
+        self.assertEqual([error.path for error in errors],
+                         ['/features/0/coordinates', '/features/1'])
+
+    def test_packed(self):
+        polygon = geojson.Polygon([[(0, 0), (1, 0), (1, 1), (2, 2)]],
+                                  packed=True)
+        self.assertEqual(geojson.validate(polygon), [
+            ('/coordinates/0', 'Each linear ring must end where it started'),
+        ])
+
+    def test_check_polygon_precedence(self):
+        short, open_ring = [[0, 0]], [[0, 0], [1, 0], [1, 1], [2, 2]]
+        check = geojson.geometry.check_polygon
+        self.assertEqual(check([open_ring, short]),
+                         'Each linear ring must contain at least 4 positions')
+        self.assertEqual(check([short, open_ring, 5]),
+                         "Each element of a polygon's coordinates must be a "
+                         "list")
+        self.assertEqual(check([open_ring]),
+                         'Each linear ring must end where it started')
+
+
+class TestParallelValidation(unittest.TestCase):
+
+    def setUp(self):
+        features = []
+        for i in range(40):
+            if i % 7 == 3:
+                geometry = geojson.LineString([(i, i)])
+            elif i % 11 == 5:
+                geometry = geojson.Polygon([[(0, 0), (1, 0), (1, 1), (i, 0)]],
+                                           packed=True)
+            else:
+                geometry = geojson.Point((i, -i))
+            features.append(geojson.Feature(id=i, geometry=geometry))
+        self.collection = geojson.FeatureCollection(features)
+
+    def test_matches_validate(self):
+        expected = geojson.validate(self.collection)
+        self.assertTrue(expected)
+        errors = geojson.validate_parallel(self.collection, workers=2,
+                                           chunk_size=3)
+        self.assertEqual(errors, expected)
+        self.assertEqual(errors[0].path, '/features/3/geometry/coordinates')
+
+    def test_feature_stream(self):
+        errors = geojson.validate_parallel(iter(self.collection.features),
+                                           workers=2, chunk_size=4)
+        self.assertEqual(errors, geojson.validate(self.collection))
+
+    def test_max_errors(self):
+        errors = geojson.validate_parallel(self.collection, workers=2,
+                                           chunk_size=3, max_errors=2)
+        self.assertEqual(errors, geojson.validate(self.collection)[:2])
+
+    def test_not_a_collection(self):
+        self.assertEqual(
+            geojson.validate_parallel(geojson.LineString([(1, 2)])),
+            geojson.validate(geojson.LineString([(1, 2)])))
@@ -0,0 +1,97 @@
+"""
+Tests for writing FeatureCollections one feature at a time
+"""
+
+import io
+import unittest
+
+import geojson
+
+
+FEATURES = [geojson.Feature(id=i, geometry=geojson.Point((i, i + 0.5)),
+                            properties={"name": f"né{i}"})
+            for i in range(5)]
+
+
+class FeatureCollectionWriterTestCase(unittest.TestCase):
+
+    def test_matches_dumps(self):
+        fp = io.StringIO()
+        with geojson.FeatureCollectionWriter(
+                fp, members={"name": "points"}, batch_size=2) as writer:
+            writer.write(FEATURES[0])
+            writer.write_all(feature for feature in FEATURES[1:])
+        self.assertEqual(writer.count, 5)
+        self.assertEqual(fp.getvalue(), geojson.dumps(
+            geojson.FeatureCollection(FEATURES, name="points")))
+
+    def test_empty(self):
+        fp = io.StringIO()
+        with geojson.FeatureCollectionWriter(fp):
+            pass
+        self.assertEqual(geojson.loads(fp.getvalue()),
+                         geojson.FeatureCollection([]))
+
+    def test_batches(self):
+        fp = io.StringIO()
+        writer = geojson.FeatureCollectionWriter(fp, batch_size=2)
+        writer.write_all(FEATURES[:3])
+        # the third feature waits for the next batch
+        self.assertEqual(fp.getvalue().count('"Feature"'), 2)
+        writer.close()
+        self.assertEqual(fp.getvalue().count('"Feature"'), 3)
+        self.assertTrue(fp.getvalue().endswith("]}"))
+
+    def test_binary_stream(self):
+        fp = io.BytesIO()
+        with geojson.FeatureCollectionWriter(fp) as writer:
+            writer.write_all(FEATURES)
+        features = list(geojson.iterload(io.BytesIO(fp.getvalue())))
+        self.assertEqual(features, FEATURES)
+
+    def test_unbuffered_stream(self):
+        written = []
+
+        class Raw(io.RawIOBase):
+            def writable(self):
+                return True
+
+            def write(self, data):
+                # accepts at most 7 bytes per call
+                written.append(bytes(data[:7]))
+                return len(written[-1])
+
+        with geojson.FeatureCollectionWriter(Raw()) as writer:
+            writer.write_all(FEATURES)
+        self.assertEqual(geojson.loads(b"".join(written)).features, FEATURES)
+
+    def test_exception_leaves_collection_open(self):
+        fp = io.StringIO()
+        with self.assertRaises(RuntimeError):
+            with geojson.FeatureCollectionWriter(fp, batch_size=1) as writer:
+                writer.write(FEATURES[0])
+                raise RuntimeError("cursor failed")
+        self.assertFalse(writer.closed)
+        with self.assertRaises(ValueError):
+            geojson.loads(fp.getvalue())
+
+    def test_write_after_close(self):
+        writer = geojson.FeatureCollectionWriter(io.StringIO())
+        writer.close()
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(FEATURES[0])
+
+    def test_lazy_features(self):
+        text = geojson.dumps(geojson.FeatureCollection(FEATURES))
+        collection = geojson.loads(text, lazy=True)
+        fp = io.StringIO()
+        with geojson.FeatureCollectionWriter(fp) as writer:
+            writer.write_all(collection.features)
+        self.assertEqual(fp.getvalue(), text)
+
+        fp = io.StringIO()
+        with geojson.FeatureCollectionWriter(fp, ensure_ascii=True) as writer:
+            writer.write_all(geojson.loads(text, lazy=True).features)
+        self.assertTrue(fp.getvalue().isascii())
+        self.assertEqual(geojson.loads(fp.getvalue()).features, FEATURES)